@@ -0,0 +1 @@
+"""Numerical Analysis Calculator: numerical methods with step-by-step Tkinter front ends."""
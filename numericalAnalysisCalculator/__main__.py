@@ -0,0 +1,47 @@
+"""Command line batch solver: python -m numericalAnalysisCalculator --help
+
+Reads problems as JSONL or CSV from a file or stdin and writes one JSON
+result per line as they are solved (see core.stream for the format).
+"""
+import argparse
+import sys
+
+from numericalAnalysisCalculator import registry
+from numericalAnalysisCalculator.core.stream import CHUNK_SIZE, read_csv, read_jsonl, solve_stream, write_jsonl
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m numericalAnalysisCalculator",
+                                     description="Solve a stream of problems headlessly, one JSON result per line.",
+                                     epilog=f"methods: {', '.join(registry.names(capability=registry.BATCH))}")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="JSONL or CSV file of problems (default: stdin)")
+    parser.add_argument('-o', '--output', default='-', help="file for the JSONL results (default: stdout)")
+    parser.add_argument('--format', choices=('jsonl', 'csv'),
+                        help="input format (default: csv for a .csv file, otherwise jsonl)")
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help="solve in a pool of N processes; 0 uses every CPU (default: %(default)s)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, metavar='N',
+                        help="problems sent to a worker at a time (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.workers < 0 or args.chunk_size < 1:
+        parser.error("--workers must be at least 0 and --chunk-size at least 1")
+
+    fmt = args.format or ('csv' if args.input.lower().endswith('.csv') else 'jsonl')
+    source = sys.stdin if args.input == '-' else open(args.input, newline='')
+    out = sys.stdout if args.output == '-' else open(args.output, 'w')
+    try:
+        problems = read_csv(source) if fmt == 'csv' else read_jsonl(source)
+        results = solve_stream(problems, args.workers or None, args.chunk_size)
+        count, failed = write_jsonl(results, out)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"{count} problems solved, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
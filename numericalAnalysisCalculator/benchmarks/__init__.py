@@ -0,0 +1,8 @@
+"""Headless benchmarks for the numerical cores behind every calculator window.
+
+    python -m numericalAnalysisCalculator.benchmarks --save baseline.json
+    python -m numericalAnalysisCalculator.benchmarks --compare baseline.json
+
+See benchmarks.catalogue for the problems and benchmarks.runner for what is
+measured.
+"""
@@ -0,0 +1,48 @@
+"""Command line entry point: python -m numericalAnalysisCalculator.benchmarks --help"""
+import argparse
+import sys
+
+from numericalAnalysisCalculator.benchmarks import catalogue, runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m numericalAnalysisCalculator.benchmarks",
+                                     description="Benchmark every calculator method headlessly.")
+    parser.add_argument('--methods', nargs='+', metavar='METHOD',
+                        help="only these methods (default: all)")
+    parser.add_argument('--quick', action='store_true',
+                        help=f"matrix sizes up to {catalogue.QUICK_MATRIX_SIZES[-1]} only")
+    parser.add_argument('--sizes', nargs='+', type=int, metavar='N',
+                        help=f"matrix sizes to run (default: {' '.join(map(str, catalogue.MATRIX_SIZES))})")
+    parser.add_argument('--repeat', type=int, default=runner.REPEAT,
+                        help="timings per case, best kept (default: %(default)s)")
+    parser.add_argument('--save', metavar='FILE', help="write the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='FILE', help="compare against a saved JSON baseline")
+    parser.add_argument('--threshold', type=float, default=runner.THRESHOLD,
+                        help="slowdown ratio reported as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (catalogue.QUICK_MATRIX_SIZES if args.quick else catalogue.MATRIX_SIZES)
+    print(runner.HEADER)
+    results = runner.run(args.methods, sizes, args.repeat,
+                         progress=lambda m: print(runner.format_row(m), flush=True))
+
+    if args.save:
+        runner.save_baseline(results, args.save)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        regressions = 0
+        print(f"\nCompared with {args.compare}:")
+        for m, old, ratio, regressed in runner.compare(results, runner.load_baseline(args.compare),
+                                                       args.threshold):
+            flag = "REGRESSION" if regressed else ""
+            regressions += regressed
+            print(f"{m.key:44} {runner.format_seconds(old.seconds)} -> {runner.format_seconds(m.seconds)}"
+                  f" x{ratio:5.2f}  evals {old.evaluations} -> {m.evaluations}  {flag}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Problems the benchmarks run: test functions for the scalar methods and matrix sizes.
+
+The first entries are the load_example problems of the calculator windows.
+Tolerances are tighter than the examples so each solve does real work.
+The methods come from the registry, so a registered plugin method is
+benchmarked with the other methods of its kind.
+"""
+from numericalAnalysisCalculator import registry
+
+# Root-finding problems: f with a bracket [xl, xu] containing one root.
+# Newton starts from x0 (the bracket midpoint when not given); secant from xl and xu.
+ROOT_PROBLEMS = [
+    {'name': 'bisection-example', 'f': "4*x**3 - 6*x**2 + 7*x - 2.3", 'xl': 0.0, 'xu': 1.0},
+    {'name': 'false-position-example', 'f': "-13 - 20*x + 19*x**2 -3*x**3", 'xl': -1.0, 'xu': 0.0},
+    {'name': 'secant-example', 'f': "2*x**3 - 11.7*x**2 + 17.7*x - 5", 'xl': 3.0, 'xu': 4.0},
+    {'name': 'newton-example', 'f': "-0.9*x**2 + 1.7*x + 2.5", 'xl': 2.0, 'xu': 5.0, 'x0': 5.0},
+    {'name': 'wallis-cubic', 'f': "x**3 - 2*x - 5", 'xl': 2.0, 'xu': 3.0},
+    {'name': 'exp-minus-x', 'f': "exp(-x) - x", 'xl': 0.0, 'xu': 1.0},
+    {'name': 'cos-fixed-point', 'f': "cos(x) - x", 'xl': 0.0, 'xu': 1.0},
+    {'name': 'log-plus-linear', 'f': "log(x) + x", 'xl': 0.1, 'xu': 1.0},
+    # Strongly curved: false position keeps one end fixed and converges slowly
+    {'name': 'tenth-power', 'f': "x**10 - 1", 'xl': 0.0, 'xu': 1.3},
+    {'name': 'damped-sine', 'f': "exp(-x/5)*sin(3*x) - 0.1", 'xl': 0.0, 'xu': 0.5},
+    # Factored polynomials with multiple roots: expanding them to Horner form would
+    # cancel catastrophically near the root. 'root' is checked (see ROOT_CHECK)
+    {'name': 'fifth-power-factor', 'f': "(x - 1.1)**5*(x + 3)", 'xl': 0.3, 'xu': 1.7, 'root': 1.1},
+    {'name': 'seventh-power', 'f': "(x - 2)**7", 'xl': 1.0, 'xu': 2.5, 'root': 2.0},
+]
+
+# Golden-section problems: unimodal f on [xl, xu]
+OPTIMUM_PROBLEMS = [
+    {'name': 'golden-example', 'f': "2*sin(x) - x**2/10", 'xl': 0.0, 'xu': 4.0, 'maximize': True},
+    {'name': 'shifted-parabola', 'f': "(x - 2)**2 + 1", 'xl': 0.0, 'xu': 5.0, 'maximize': False},
+    {'name': 'x-exp-minus-x', 'f': "x*exp(-x)", 'xl': 0.0, 'xu': 4.0, 'maximize': True},
+]
+
+# Methods of the registry that can run headless, grouped by kind of problem
+ROOT_METHODS = registry.names('root', registry.BATCH)
+OPTIMUM_METHODS = registry.names('optimum', registry.BATCH)
+MATRIX_METHODS = registry.names('linear', registry.BATCH)
+STRUCTURED_METHODS = registry.names('sparse', registry.BATCH)
+# Nonlinear systems; 'broyden' is newton_system(method='broyden')
+SYSTEM_METHODS = registry.names('system', registry.BATCH) + ('broyden',)
+# Iterative linear solvers, run on the dominant (and symmetric) sparse matrices
+ITERATIVE_METHODS = registry.names('iterative', registry.BATCH)
+ITERATIVE_KINDS = ('tridiagonal', 'pentadiagonal', 'poisson-2d')
+# Modified false position rules, benchmarked as e.g. 'false_position[illinois]'
+FALSE_POSITION_VARIANTS = ('illinois', 'pegasus', 'anderson-bjorck')
+
+# Startup: each module is imported in a fresh interpreter ('interpreter' imports nothing)
+STARTUP_MODULES = (
+    ('interpreter', None),
+    ('launcher', 'numericalAnalysisCalculator.main_app'),
+    ('bisection-window', 'numericalAnalysisCalculator.calculators.BisectUPdated'),
+    ('gauss-elimination-window', 'numericalAnalysisCalculator.calculators.GE'),
+)
+
+EPS = 1e-10          # approximate relative error in percent
+ROOT_CHECK = 1e-6    # a root farther than this (relative) from a problem's known 'root' counts as not converged
+MAX_ITER = 500
+ITERATIVE_TOL = 1e-10  # relative residual of the iterative linear solvers
+OPTIMUM_EPS = 1e-6   # golden-section and Brent optimum, relative error in percent
+OPTIMUM_MAX_ITER = 200
+
+MATRIX_SIZES = (3, 10, 50, 100, 200, 500, 1000, 2000)
+QUICK_MATRIX_SIZES = (3, 10, 50, 100, 200)
+# Nonlinear system sizes up to the largest matrix size of the run; n=2 is the window example
+SYSTEM_SIZES = (2, 10, 100, 500)
+# Sparse matrix sizes; they run up to STRUCTURED_SCALE times the largest matrix size of
+# the run, and dense LU is timed on the same matrices only within the matrix sizes
+STRUCTURED_SIZES = (100, 1000, 10000)
+STRUCTURED_SCALE = 10
+# Sparse matrix shapes: the first three are solved by Thomas, band LU and band LU, the last by sparse LU
+STRUCTURED_KINDS = ('tridiagonal', 'pentadiagonal', 'poisson-2d', 'indefinite-band')
+
+# The Gauss elimination example of the GE and LU windows
+EXAMPLE_A = [[4, 1, -1], [5, 1, 2], [6, 1, 1]]
+EXAMPLE_B = [-2, 4, 6]
+
+
+def make_system(n, seed=0):
+    """Well-conditioned n x n system (diagonally dominant, random); n=3 gives the window example."""
+    import numpy as np
+    if n == 3:
+        return np.array(EXAMPLE_A, dtype=float), np.array(EXAMPLE_B, dtype=float)
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1, 1, (n, n))
+    A[np.diag_indices(n)] += n
+    return A, rng.uniform(-10, 10, n)
+
+
+def make_structured(kind, n, seed=0):
+    """Sparse n x n system (CSRMatrix, b) of the given STRUCTURED_KINDS shape.
+
+    tridiagonal is the 1D Poisson matrix, pentadiagonal a dominant band and
+    poisson-2d the five-point Laplacian on the largest square grid with at
+    most n points (all dominant); indefinite-band is random, not dominant
+    and so needs pivoting, but well conditioned.
+    """
+    import numpy as np
+    from numericalAnalysisCalculator.core.sparse import CSRMatrix
+    rng = np.random.default_rng(seed)
+    if kind == 'tridiagonal':
+        A = CSRMatrix.from_diagonals([-1, 2.5, -1], [-1, 0, 1], n)
+    elif kind == 'pentadiagonal':
+        A = CSRMatrix.from_diagonals([1, -2, 8, -2, 1], [-2, -1, 0, 1, 2], n)
+    elif kind == 'poisson-2d':
+        m = int(np.sqrt(n))
+        n = m * m
+        # Grid neighbours left and right of a row end are not coupled
+        side = np.tile(np.r_[np.full(m - 1, -1.0), 0.0], m)[:n - 1]
+        A = CSRMatrix.from_diagonals([-1, side, 4.01, side, -1], [-m, -1, 0, 1, m], n)
+    elif kind == 'indefinite-band':
+        diagonal = rng.choice([-1, 1], n) * rng.uniform(1.5, 2.5, n)
+        A = CSRMatrix.from_diagonals([rng.uniform(-1, 1, n - 1), diagonal, rng.uniform(-1, 1, n - 1),
+                                      rng.uniform(-1, 1, n - 2)], [-1, 0, 1, 2], n)
+    else:
+        raise ValueError(f"Unknown structured problem '{kind}'")
+    return A, rng.uniform(-10, 10, n)
+
+
+# The example of the nonlinear systems window
+EXAMPLE_EQUATIONS = ["x**2 + y**2 - 4", "exp(x) + y - 1"]
+EXAMPLE_VARIABLES = ('x', 'y')
+EXAMPLE_GUESS = [1.0, -1.0]
+
+
+def broyden_tridiagonal(X):
+    """Broyden's tridiagonal test function, (3 - 2x_i) x_i - x_(i-1) - 2x_(i+1) + 1.
+
+    X is one point (n,) or points as columns (n, k).
+    """
+    import numpy as np
+    X = np.asarray(X, dtype=float)
+    left = np.zeros_like(X)
+    left[1:] = X[:-1]
+    right = np.zeros_like(X)
+    right[:-1] = X[1:]
+    return (3 - 2 * X) * X - left - 2 * right + 1
@@ -0,0 +1,311 @@
+"""Runs the catalogue and measures each solve.
+
+For every (method, problem) pair the runner reports:
+
+- seconds: best wall time per solve (each timing repeats the solve until it
+  takes at least MIN_TIME, and the best of REPEAT timings is kept)
+- evaluations: calls of f in one solve, counted with core.profiling.instrument
+  (Newton's fused f, f' call counts once)
+- iterations: iterations to reach the tolerance, and whether it converged
+- peak_bytes: peak memory allocated during one solve, from tracemalloc
+
+Solvers run with record=False, as in batch use.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, replace
+
+from numericalAnalysisCalculator import registry
+from numericalAnalysisCalculator.benchmarks import catalogue
+from numericalAnalysisCalculator.core.autodiff import compile_with_derivative
+from numericalAnalysisCalculator.core.batch import get_solver
+from numericalAnalysisCalculator.core.expression import compile_function
+from numericalAnalysisCalculator.core.profiling import instrument
+
+MIN_TIME = 0.02
+REPEAT = 3
+
+# Slowdown against the baseline that counts as a regression
+THRESHOLD = 1.25
+
+
+@dataclass
+class Measurement:
+    """Cost of one method on one problem."""
+    method: str
+    problem: str
+    size: int
+    seconds: float
+    evaluations: int = None
+    iterations: int = None
+    converged: bool = None
+    peak_bytes: int = 0
+
+    @property
+    def key(self):
+        return f"{self.method}/{self.problem}"
+
+
+def time_per_solve(run, min_time=MIN_TIME, repeat=REPEAT):
+    """Best seconds per call of run() over repeat timings of at least min_time each."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_memory(run):
+    """Peak bytes allocated while run() executes."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(method, problem, size, solve, f=None, repeat=REPEAT):
+    """Measures solve(f); f is counted for one extra solve when given."""
+    if f is not None:
+        counted = instrument(f, timing=False)
+        result = solve(counted)
+        evaluations = counted.calls
+    else:
+        result = solve(None)
+        evaluations = None
+    seconds = time_per_solve(lambda: solve(f), repeat=repeat)
+    peak = peak_memory(lambda: solve(f))
+    return Measurement(method, problem, size, seconds, evaluations,
+                       getattr(result, 'n_iter', None), getattr(result, 'converged', None), peak)
+
+
+def _root_solve(method, problem, **options):
+    """solve(f) for a root finder, called as its capabilities say.
+
+    DERIVATIVE methods take (f, df, x0) with f returning f and f' together,
+    followed by the bracket when they are also BRACKETING; the others take
+    the two starting points xl, xu.
+    """
+    entry = registry.get(method)
+    solver = entry.load_solver()
+    xl, xu = problem['xl'], problem['xu']
+    eps, max_iter = catalogue.EPS, catalogue.MAX_ITER
+    if entry.has(registry.DERIVATIVE):
+        x0 = problem.get('x0', (xl + xu) / 2)
+        if entry.has(registry.BRACKETING):
+            return lambda f: solver(f, None, x0, xl, xu, eps, max_iter, record=False, **options)
+        return lambda f: solver(f, None, x0, eps, max_iter, record=False, **options)
+    return lambda f: solver(f, xl, xu, eps, max_iter, record=False, **options)
+
+
+def _checked(solve, root):
+    """solve, with a result farther than ROOT_CHECK from the known root marked not converged."""
+    def checked(f):
+        result = solve(f)
+        if abs(result.root - root) > catalogue.ROOT_CHECK * max(1.0, abs(root)):
+            return replace(result, converged=False, message=f"{result.root!r} is not the known root {root!r}")
+        return result
+    return checked
+
+
+def root_cases(methods=catalogue.ROOT_METHODS):
+    """Yields (method, problem name, size, solve, f) for the root finders."""
+    for problem in catalogue.ROOT_PROBLEMS:
+        for method in methods:
+            if registry.get(method).has(registry.DERIVATIVE):
+                f = compile_with_derivative(problem['f'])
+            else:
+                f = compile_function(problem['f'])
+            solve = _root_solve(method, problem)
+            if 'root' in problem:
+                solve = _checked(solve, problem['root'])
+            yield method, problem['name'], None, solve, f
+            if method == 'false_position':
+                for variant in catalogue.FALSE_POSITION_VARIANTS:
+                    yield (f"{method}[{variant}]", problem['name'], None,
+                           _root_solve(method, problem, variant=variant), compile_function(problem['f']))
+
+
+def optimum_cases(methods=catalogue.OPTIMUM_METHODS):
+    """Yields golden-section and Brent optimum cases, solved to OPTIMUM_EPS."""
+    for problem in catalogue.OPTIMUM_PROBLEMS:
+        for method in methods:
+            f = compile_function(problem['f'])
+            solver = get_solver(method)
+            xl, xu, maximize = problem['xl'], problem['xu'], problem['maximize']
+            solve = lambda f, solver=solver, xl=xl, xu=xu, maximize=maximize: solver(
+                f, xl, xu, catalogue.OPTIMUM_MAX_ITER, maximize, eps=catalogue.OPTIMUM_EPS, record=False)
+            yield method, problem['name'], None, solve, f
+
+
+def matrix_cases(sizes=catalogue.MATRIX_SIZES, methods=catalogue.MATRIX_METHODS):
+    """Yields Gauss elimination and LU cases for each matrix size."""
+    for n in sizes:
+        A, b = catalogue.make_system(n)
+        for method in methods:
+            solver = get_solver(method)
+            solve = lambda f, solver=solver, A=A, b=b: solver(A, b, True, record=False)
+            yield method, f"n={n}", n, solve, None
+
+
+def system_cases(sizes=catalogue.SYSTEM_SIZES, methods=catalogue.SYSTEM_METHODS):
+    """Yields Newton and Broyden cases for nonlinear systems of each size."""
+    import numpy as np
+    from numericalAnalysisCalculator.core.systems import compile_system
+    solver = get_solver('newton_system')
+    for n in sizes:
+        if n == 2:
+            F = compile_system(catalogue.EXAMPLE_EQUATIONS, catalogue.EXAMPLE_VARIABLES)
+            x0, problem = catalogue.EXAMPLE_GUESS, "window-example"
+        else:
+            F, x0, problem = catalogue.broyden_tridiagonal, -np.ones(n), f"tridiagonal n={n}"
+        for method in methods:
+            kind = 'broyden' if method == 'broyden' else 'newton'
+            # instrument() hides F.vectorized, so it is passed explicitly
+            solve = lambda f, x0=x0, kind=kind: solver(f, x0, None, catalogue.EPS, catalogue.MAX_ITER, kind,
+                                                       vectorized=True, record=False)
+            yield method, problem, n, solve, F
+
+
+def structured_cases(sizes=catalogue.STRUCTURED_SIZES, methods=catalogue.STRUCTURED_METHODS, dense_limit=0):
+    """Yields sparse solves of the sparse catalogue matrices, and 'lu' on dense copies up to dense_limit.
+
+    lu_solve hands a banded or sparse A to core.structured, so the 'lu' rows
+    measure that dispatch, including the scan of the dense copy.
+    """
+    solvers = [(method, get_solver(method)) for method in methods]
+    lu = get_solver('lu')
+    for kind in catalogue.STRUCTURED_KINDS:
+        for n in sizes:
+            A, b = catalogue.make_structured(kind, n)
+            problem = f"{kind} n={A.shape[0]}"
+            for method, solver in solvers:
+                yield method, problem, A.shape[0], lambda f, solver=solver, A=A, b=b: solver(A, b), None
+            if n <= dense_limit:
+                dense = A.to_dense()
+                yield 'lu', problem, n, lambda f, A=dense, b=b: lu(A, b, True, record=False), None
+
+
+def iterative_cases(sizes=catalogue.STRUCTURED_SIZES, methods=catalogue.ITERATIVE_METHODS):
+    """Yields iterative solves of the dominant sparse catalogue matrices."""
+    for kind in catalogue.ITERATIVE_KINDS:
+        for n in sizes:
+            A, b = catalogue.make_structured(kind, n)
+            for method in methods:
+                solver = get_solver(method)
+                solve = lambda f, solver=solver, A=A, b=b: solver(A, b, tol=catalogue.ITERATIVE_TOL,
+                                                                  max_iter=catalogue.MAX_ITER * 20, record=False)
+                yield method, f"{kind} n={A.shape[0]}", A.shape[0], solve, None
+
+
+def startup_cases():
+    """Yields the time to start Python and import each of catalogue.STARTUP_MODULES."""
+    package_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_root, os.environ.get('PYTHONPATH')])))
+    for problem, module in catalogue.STARTUP_MODULES:
+        command = [sys.executable, '-c', f"import {module}" if module else "pass"]
+        solve = lambda f, command=command: subprocess.run(command, env=env, check=True)
+        yield 'startup', problem, None, solve, None
+
+
+def run(methods=None, sizes=catalogue.MATRIX_SIZES, repeat=REPEAT, progress=None):
+    """Measures every catalogue case, optionally limited to the given methods."""
+    cases = []
+    root_methods = [m for m in catalogue.ROOT_METHODS if methods is None or m in methods]
+    cases.extend(root_cases(root_methods))
+    optimum_methods = [m for m in catalogue.OPTIMUM_METHODS if methods is None or m in methods]
+    cases.extend(optimum_cases(optimum_methods))
+    matrix_methods = [m for m in catalogue.MATRIX_METHODS if methods is None or m in methods]
+    if matrix_methods and sizes:
+        cases.extend(matrix_cases(sizes, matrix_methods))
+    system_methods = [m for m in catalogue.SYSTEM_METHODS if methods is None or m in methods]
+    if system_methods and sizes:
+        system_sizes = [n for n in catalogue.SYSTEM_SIZES if n <= max(sizes)]
+        cases.extend(system_cases(system_sizes, system_methods))
+    structured_sizes = [n for n in catalogue.STRUCTURED_SIZES if sizes and n <= max(sizes) * catalogue.STRUCTURED_SCALE]
+    structured_methods = [m for m in catalogue.STRUCTURED_METHODS if methods is None or m in methods]
+    if structured_methods and structured_sizes:
+        dense_limit = max(sizes) if methods is None or 'lu' in methods else 0
+        cases.extend(structured_cases(structured_sizes, structured_methods, dense_limit))
+    if methods is None or 'startup' in methods:
+        cases.extend(startup_cases())
+    iterative_methods = [m for m in catalogue.ITERATIVE_METHODS if methods is None or m in methods]
+    if iterative_methods and structured_sizes:
+        cases.extend(iterative_cases(structured_sizes, iterative_methods))
+
+    results = []
+    for method, problem, size, solve, f in cases:
+        m = measure(method, problem, size, solve, f, repeat)
+        if progress is not None:
+            progress(m)
+        results.append(m)
+    return results
+
+
+def save_baseline(measurements, path):
+    """Writes the measurements and the environment they were taken in as JSON."""
+    import numpy as np
+    data = {
+        'meta': {'python': platform.python_version(), 'numpy': np.__version__,
+                 'machine': platform.machine(), 'platform': platform.platform(),
+                 'created': time.strftime('%Y-%m-%dT%H:%M:%S')},
+        'results': [asdict(m) for m in measurements],
+    }
+    with open(path, 'w') as fh:
+        json.dump(data, fh, indent=2)
+
+
+def load_baseline(path):
+    """{method/problem: Measurement} from a saved baseline."""
+    with open(path) as fh:
+        data = json.load(fh)
+    return {m.key: m for m in (Measurement(**r) for r in data['results'])}
+
+
+def compare(measurements, baseline, threshold=THRESHOLD):
+    """Yields (measurement, baseline measurement, time ratio, regressed) for shared cases."""
+    for m in measurements:
+        old = baseline.get(m.key)
+        if old is None or old.seconds <= 0:
+            continue
+        ratio = m.seconds / old.seconds
+        # More evaluations for the same problem is a regression whatever the timing noise
+        more_calls = (m.evaluations or 0) > (old.evaluations or 0)
+        yield m, old, ratio, ratio > threshold or more_calls
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:8.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.2f} ms"
+    return f"{seconds:8.3f} s "
+
+
+def format_row(m):
+    evaluations = '' if m.evaluations is None else m.evaluations
+    iterations = '' if m.iterations is None else m.iterations
+    converged = '' if m.converged is None else ('yes' if m.converged else 'NO')
+    return (f"{m.method:31} {m.problem:24} {format_seconds(m.seconds)} {evaluations:>6} "
+            f"{iterations:>6} {converged:>5} {m.peak_bytes / 1024:10.1f}")
+
+
+HEADER = (f"{'method':31} {'problem':24} {'time/solve':>11} {'evals':>6} {'iters':>6} "
+          f"{'conv':>5} {'peak KiB':>10}")
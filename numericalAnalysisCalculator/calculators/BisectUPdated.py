@@ -1,6 +1,12 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import math
+from tkinter import ttk, messagebox, filedialog
+from numericalAnalysisCalculator.core.expression import compile_function, ExpressionError
+from numericalAnalysisCalculator.core.profiling import instrument
+from numericalAnalysisCalculator.core.rootfinding import bisection
+from numericalAnalysisCalculator.calculators.logview import LogView
+from numericalAnalysisCalculator.calculators.rootscan import RootScan
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
 
 class BisectionCalculator:
     def __init__(self, root):
@@ -8,6 +14,8 @@ class BisectionCalculator:
         self.root.title("Bisection Method Calculator")
         self.root.geometry("800x700")
         self.root.resizable(False, False)
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
+        self.scan = RootScan(self, 'bisection')
         self.setup_ui()
         
     def setup_ui(self):
@@ -41,10 +49,25 @@ class BisectionCalculator:
         self.max_iter_entry = tk.Entry(input_frame, font=('Arial', 10))
         self.max_iter_entry.grid(row=4, column=1, sticky='w', padx=5, pady=5)
         
-        # Calculate button
-        btn_calculate = tk.Button(main_frame, text="Calculate", command=self.start_bisection, 
+        # Calculate and Cancel buttons
+        button_frame = tk.Frame(main_frame, bg="#f0f2f5")
+        button_frame.pack(pady=10)
+        self.btn_calculate = tk.Button(button_frame, text="Calculate", command=self.start_bisection, 
                                  bg="#4CAF50", fg="white", font=('Arial', 10, 'bold'))
-        btn_calculate.pack(pady=10)
+        self.btn_calculate.pack(side=tk.LEFT, padx=5)
+        self.btn_cancel = tk.Button(button_frame, text="Cancel", command=self.cancel, 
+                                   bg="#F44336", fg="white", font=('Arial', 10, 'bold'), state=tk.DISABLED)
+        self.btn_cancel.pack(side=tk.LEFT, padx=5)
+        self.btn_export = tk.Button(button_frame, text="Export CSV", command=self.export_trace, 
+                                   bg="#2196F3", fg="white", font=('Arial', 10), state=tk.DISABLED)
+        self.btn_export.pack(side=tk.LEFT, padx=5)
+        self.btn_scan = tk.Button(button_frame, text="Find All Roots", command=self.scan.start, 
+                                 bg="#9C27B0", fg="white", font=('Arial', 10))
+        self.btn_scan.pack(side=tk.LEFT, padx=5)
+        
+        # Progress through max iterations
+        self.progress = ttk.Progressbar(main_frame, mode='determinate', length=400)
+        self.progress.pack(pady=(0, 10))
         
         # Create notebook for tabs
         self.notebook = ttk.Notebook(main_frame)
@@ -54,8 +77,7 @@ class BisectionCalculator:
         results_tab = tk.Frame(self.notebook, bg="#f0f2f5")
         self.notebook.add(results_tab, text="Results")
         
-        self.result_box = scrolledtext.ScrolledText(results_tab, width=90, height=15, 
-                                                   wrap=tk.WORD, font=('Arial', 10), bg="white")
+        self.result_box = LogView(results_tab, width=90, height=15, font=('Arial', 10), bg="white")
         self.result_box.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Root display
@@ -63,12 +85,15 @@ class BisectionCalculator:
                                          font=('Arial', 12, 'bold'), fg="#388E3C")
         self.root_result_label.pack(pady=5)
         
+        # Cost of the last run: evaluations of f and time spent inside it
+        self.evaluations_label = tk.Label(results_tab, text="", bg="#f0f2f5", font=('Arial', 9), fg="#555555")
+        self.evaluations_label.pack()
+        
         # Calculations tab
         calculations_tab = tk.Frame(self.notebook, bg="#f0f2f5")
         self.notebook.add(calculations_tab, text="Calculations")
         
-        self.calc_box = scrolledtext.ScrolledText(calculations_tab, width=90, height=15, 
-                                                wrap=tk.WORD, font=('Arial', 10), bg="white")
+        self.calc_box = LogView(calculations_tab, width=90, height=15, font=('Arial', 10), bg="white")
         self.calc_box.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Example function button
@@ -88,65 +113,80 @@ class BisectionCalculator:
         self.max_iter_entry.delete(0, tk.END)
         self.max_iter_entry.insert(0, "50")
     
-    def evaluate_function(self, func_str, x_val):
-        """Evaluates the user-defined function at a given x value."""
-        x = x_val
+    def compile_function(self, func_str):
+        """Parses and compiles the user-defined function once."""
         try:
-            return eval(func_str, {'x': x, 'math': math, 'exp': math.exp, 'log': math.log, 
-                                 'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
-                                 'sqrt': math.sqrt})
-        except Exception as e:
-            messagebox.showerror("Error", f"Invalid function: {e}")
+            return compile_function(func_str)
+        except ExpressionError as e:
+            messagebox.showerror("Error", str(e))
             return None
     
-    def bisection_method(self, func_str, xl, xu, eps, max_iter):
+    def bisection_method(self, f, xl, xu, eps, max_iter):
         """Performs the bisection method to find the root of the function."""
-        self.result_box.delete(1.0, tk.END)
-        self.calc_box.delete(1.0, tk.END)
+        self.result_box.clear()
+        self.calc_box.clear()
         self.root_result_label.config(text="")
-        
-        f_xl = self.evaluate_function(func_str, xl)
-        f_xu = self.evaluate_function(func_str, xu)
-        
-        if f_xl is None or f_xu is None:
-            return None
-        
-        if f_xl * f_xu > 0:
-            messagebox.showerror("Error", "Invalid input: f(xl) and f(xu) must have opposite signs.")
-            return None
-        
-        xrold = None
-        for iter_count in range(1, max_iter + 1):
-            xr = (xl + xu) / 2.0
-            f_xr = self.evaluate_function(func_str, xr)
-            
-            if f_xr == 0:
-                error = 0.0
-            else:
-                error = abs((xr - xrold) / xr) * 100 if xrold is not None else float('inf')
-            
-            # Display iteration results
-            self.display_iteration(iter_count, xl, xu, xr, f_xl, f_xu, f_xr, error)
-            
-            # Show calculations for this step
-            self.display_calculations(iter_count, xl, xu, xr, f_xl, f_xu, f_xr, xrold, error)
-            
-            # Check stopping criteria
-            if error is not None and error <= eps:
-                self.root_result_label.config(text=f"Root found: {xr:.8f} (after {iter_count} iterations)", fg="#388E3C")
-                return xr
-            
-            # Update bounds for next iteration
-            if f_xl * f_xr < 0:
-                xu, f_xu = xr, f_xr
-            else:
-                xl, f_xl = xr, f_xr
-            
-            xrold = xr
-        
-        messagebox.showwarning("Warning", f"Maximum iterations ({max_iter}) reached without convergence.")
-        self.root_result_label.config(text=f"Approximate root: {xrold:.8f} (max iterations reached)", fg="#FF5722")
-        return xrold
+        self.evaluations_label.config(text="")
+        self.btn_export.config(state=tk.DISABLED)
+        self.progress.config(value=0, maximum=max_iter)
+        
+        # Solve on a worker thread; records arrive through show_step
+        self.f = instrument(f)
+        if self.worker.start(bisection, self.f, xl, xu, eps, max_iter, trace=True):
+            self.btn_calculate.config(state=tk.DISABLED)
+            self.btn_scan.config(state=tk.DISABLED)
+            self.btn_cancel.config(state=tk.NORMAL)
+    
+    def show_step(self, step):
+        """Displays one iteration record streamed from the solver."""
+        # Display iteration results
+        self.display_iteration(step.iteration, step.xl, step.xu, step.xr, step.f_xl, step.f_xu, step.f_xr, step.error)
+        
+        # Show calculations for this step
+        self.display_calculations(step.iteration, step.xl, step.xu, step.xr, step.f_xl, step.f_xu, step.f_xr, step.xr_old, step.error)
+        self.progress.config(value=step.iteration)
+    
+    def show_result(self, result):
+        """Shows the root once the solver has finished."""
+        self.finish()
+        self.trace = result.trace
+        self.btn_export.config(state=tk.NORMAL)
+        self.evaluations_label.config(text=self.f.summary())
+        if result.converged:
+            self.root_result_label.config(text=f"Root found: {result.root:.8f} (after {result.n_iter} iterations)", fg="#388E3C")
+        else:
+            messagebox.showwarning("Warning", result.message)
+            self.root_result_label.config(text=f"Approximate root: {result.root:.8f} (max iterations reached)", fg="#FF5722")
+    
+    def show_error(self, error):
+        """Reports an exception raised by the solver."""
+        self.finish()
+        if isinstance(error, ValueError):
+            messagebox.showerror("Error", f"Invalid input: {error}")
+        else:
+            messagebox.showerror("Error", f"An error occurred: {error}")
+    
+    def show_cancelled(self):
+        """Marks a run stopped with the Cancel button."""
+        self.finish()
+        self.root_result_label.config(text="Calculation cancelled", fg="#FF5722")
+    
+    def export_trace(self):
+        """Saves the iterations of the last run as CSV."""
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if path:
+            self.trace.to_csv(path)
+    
+    def cancel(self):
+        """Stops whichever run is in progress."""
+        self.worker.cancel()
+        self.scan.cancel()
+    
+    def finish(self):
+        """Re-enables the inputs after a run."""
+        self.btn_calculate.config(state=tk.NORMAL)
+        self.btn_scan.config(state=tk.NORMAL)
+        self.btn_cancel.config(state=tk.DISABLED)
     
     def display_iteration(self, iter_count, xl, xu, xr, f_xl, f_xu, f_xr, error):
         """Displays the iteration results in the results tab."""
@@ -155,8 +195,7 @@ class BisectionCalculator:
                       f"xu = {xu:.8f}, f(xu) = {f_xu:.8f}\n"
                       f"xr = {xr:.8f}, f(xr) = {f_xr:.8f}\n"
                       f"Error = {error:.8f}%\n\n") 
-        self.result_box.insert(tk.END, result_text)
-        self.result_box.see(tk.END)
+        self.result_box.append(result_text)
     
     def display_calculations(self, iter_count, xl, xu, xr, f_xl, f_xu, f_xr,xrold, error):
         """Shows the detailed calculations for each step in the calculations tab."""
@@ -184,38 +223,20 @@ class BisectionCalculator:
             calc_text += "   - New interval: [xr, xu]\n"
         
         calc_text += "\n"
-        self.calc_box.insert(tk.END, calc_text)
-        self.calc_box.see(tk.END)
+        self.calc_box.append(calc_text)
     
     def start_bisection(self):
         """Starts the bisection method calculation with user inputs."""
-        func_str = self.function_entry.get()
+        f = self.compile_function(self.function_entry.get())
+        if f is None:
+            return
         try:
             xl = float(self.xl_entry.get())
             xu = float(self.xu_entry.get())
             eps = float(self.eps_entry.get())
             max_iter = int(self.max_iter_entry.get())
             
-            if max_iter <= 0:
-                messagebox.showerror("Error", "Maximum iterations must be a positive integer.")
-                return
-            
-            if xl >= xu:
-                messagebox.showerror("Error", "Lower bound must be less than upper bound.")
-                return
-            
-            # Check initial bounds
-            f_xl = self.evaluate_function(func_str, xl)
-            f_xu = self.evaluate_function(func_str, xu)
-            
-            if f_xl is None or f_xu is None:
-                return
-            
-            if f_xl * f_xu >= 0:
-                messagebox.showerror("Error", "The function must have opposite signs at the bounds.")
-                return
-            
-            self.bisection_method(func_str, xl, xu, eps, max_iter)
+            self.bisection_method(f, xl, xu, eps, max_iter)
             
         except ValueError as ve:
             messagebox.showerror("Error", f"Invalid input: {ve}")
@@ -223,9 +244,7 @@ class BisectionCalculator:
             messagebox.showerror("Error", f"An error occurred: {e}")
 
 def run():
-    root = tk.Toplevel()
-    app = BisectionCalculator(root)
-    root.mainloop()
+    windows.show(__name__, BisectionCalculator)
     
 if __name__ == "__main__":
     run()
\ No newline at end of file
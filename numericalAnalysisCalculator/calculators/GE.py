@@ -2,17 +2,28 @@ import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
+from numericalAnalysisCalculator.core.cache import default_cache
+from numericalAnalysisCalculator.core.linear import gauss_elimination
+from numericalAnalysisCalculator.calculators.logview import LogView
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
+
+# Largest system that is entered through the grid of entry boxes; larger
+# systems are solved headless with core.linear.gauss_elimination
+MAX_GUI_SIZE = 8
 
 class GaussEliminationCalculator:
     def __init__(self, root):
         self.root = root
-        self.root.title("Gauss Elimination Solver (3x3)")
+        self.root.title("Gauss Elimination Solver (n x n)")
         self.root.geometry("700x600")
         self.root.resizable(False, False)
         
         self.matrix_entries = []
         self.pivoting = tk.BooleanVar(value=True)
+        self.size = tk.IntVar(value=3)
         
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
         self.setup_ui()
         self.create_matrix_inputs()
     
@@ -20,49 +31,59 @@ class GaussEliminationCalculator:
         main_frame = ttk.Frame(self.root, padding=10)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        ttk.Checkbutton(main_frame, text="Use Partial Pivoting", variable=self.pivoting).pack(pady=5)
+        options_frame = ttk.Frame(main_frame)
+        options_frame.pack(pady=5)
+        ttk.Checkbutton(options_frame, text="Use Partial Pivoting", variable=self.pivoting).pack(side=tk.LEFT)
+        ttk.Label(options_frame, text="Size n:").pack(side=tk.LEFT, padx=(15, 2))
+        ttk.Spinbox(options_frame, from_=2, to=MAX_GUI_SIZE, width=4, textvariable=self.size,
+                    command=self.create_matrix_inputs, state='readonly').pack(side=tk.LEFT)
         
-        self.matrix_frame = ttk.LabelFrame(main_frame, text="Enter 3x3 Matrix A and Vector b")
+        self.matrix_frame = ttk.LabelFrame(main_frame)
         self.matrix_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.solution_text = tk.Text(main_frame, height=15, wrap=tk.WORD, font=('Consolas', 10))
-        scrollbar = ttk.Scrollbar(main_frame, command=self.solution_text.yview)
-        self.solution_text.config(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.solution_text = LogView(main_frame, height=15, font=('Consolas', 10))
         self.solution_text.pack(fill=tk.BOTH, expand=True)
         
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill=tk.X, pady=5)
-        ttk.Button(btn_frame, text="Solve", command=self.solve).pack(side=tk.LEFT)
+        self.solve_button = ttk.Button(btn_frame, text="Solve", command=self.solve)
+        self.solve_button.pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(btn_frame, text="Cancel", command=self.worker.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(btn_frame, text="Clear", command=self.clear).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Random Fill", command=self.random_fill).pack(side=tk.LEFT)
         ttk.Button(btn_frame, text="Example", command=self.load_example).pack(side=tk.LEFT, padx=5)
+        self.progress = ttk.Progressbar(btn_frame, mode='indeterminate', length=120)
+        self.progress.pack(side=tk.RIGHT)
     
     def create_matrix_inputs(self):
         for widget in self.matrix_frame.winfo_children():
             widget.destroy()
         
+        n = self.size.get()
+        self.matrix_frame.config(text=f"Enter {n}x{n} Matrix A and Vector b")
         self.matrix_entries = []
-        for i in range(3):
+        for i in range(n):
             row_entries = []
-            for j in range(3):
+            for j in range(n):
                 e = ttk.Entry(self.matrix_frame, width=6)
                 e.grid(row=i, column=j, padx=2, pady=2)
                 row_entries.append(e)
-            ttk.Separator(self.matrix_frame, orient=tk.VERTICAL).grid(row=i, column=3, sticky='ns', padx=5)
+            ttk.Separator(self.matrix_frame, orient=tk.VERTICAL).grid(row=i, column=n, sticky='ns', padx=5)
             e = ttk.Entry(self.matrix_frame, width=6)
-            e.grid(row=i, column=4, padx=2, pady=2)
+            e.grid(row=i, column=n+1, padx=2, pady=2)
             row_entries.append(e)
             self.matrix_entries.append(row_entries)
     
     def get_matrix(self):
         try:
-            A = np.zeros((3, 3))
-            b = np.zeros(3)
-            for i in range(3):
-                for j in range(3):
+            n = len(self.matrix_entries)
+            A = np.zeros((n, n))
+            b = np.zeros(n)
+            for i in range(n):
+                for j in range(n):
                     A[i,j] = float(self.matrix_entries[i][j].get())
-                b[i] = float(self.matrix_entries[i][3].get())
+                b[i] = float(self.matrix_entries[i][n].get())
             return A, b
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers in all fields")
@@ -72,18 +93,21 @@ class GaussEliminationCalculator:
         for row in self.matrix_entries:
             for entry in row:
                 entry.delete(0, tk.END)
-        self.solution_text.delete(1.0, tk.END)
+        self.solution_text.clear()
     
     def random_fill(self):
         """Fill the matrix with random values"""
         self.clear()
-        for i in range(3):
-            for j in range(3):
+        n = len(self.matrix_entries)
+        for i in range(n):
+            for j in range(n):
                 self.matrix_entries[i][j].insert(0, f"{random.uniform(-10, 10):.2f}")
-            self.matrix_entries[i][3].insert(0, f"{random.uniform(-10, 10):.2f}")
+            self.matrix_entries[i][n].insert(0, f"{random.uniform(-10, 10):.2f}")
     
     def load_example(self):
         example = [[4,1,-1,-2], [5,1,2,4], [6,1,1,6]]
+        self.size.set(3)
+        self.create_matrix_inputs()
         for i in range(3):
             for j in range(4):
                 self.matrix_entries[i][j].delete(0, tk.END)
@@ -93,42 +117,67 @@ class GaussEliminationCalculator:
         A, b = self.get_matrix()
         if A is None: return
         
-        self.solution_text.delete(1.0, tk.END)
-        Ab = np.column_stack((A.copy(), b.copy()))
+        self.solution_text.clear()
+        self.solution_text.append("=== GAUSS ELIMINATION ===\n")
+        # The steps only carry the rows they change; they are replayed on this copy
+        self.current = np.column_stack((A, b))
+        self.print_matrix(self.current, "Initial [A|b]:")
         
-        self.solution_text.insert(tk.END, "=== GAUSS ELIMINATION ===\n")
-        self.print_matrix(Ab, "Initial [A|b]:")
+        # Where the cached-factors note goes if elimination is skipped
+        self.factors_line = self.solution_text.line_count()
         
-        for i in range(3):
-            if self.pivoting.get():
-                max_row = np.argmax(np.abs(Ab[i:, i])) + i
-                if max_row != i:
-                    Ab[[i, max_row]] = Ab[[max_row, i]]
-                    self.solution_text.insert(tk.END, f"Pivot: Swapped row {i+1} ↔ {max_row+1}\n")
-                    self.print_matrix(Ab, "After pivot:")
-            
-            for j in range(i+1, 3):
-                m = Ab[j,i]/Ab[i,i]
-                self.solution_text.insert(tk.END, f"m {j+1}{i+1} = {Ab[j,i]:.4} / {Ab[i,i]:.4} = {m:.4f} \n")
-                Ab[j,i:] -= m * Ab[i,i:]
-                self.solution_text.insert(tk.END, f"Row {j+1} -= {m:.4f} * Row {i+1}\n")
-                self.print_matrix(Ab[:,:-1], "Current A:")
+        # Solve on a worker thread; steps arrive through show_step
+        if self.worker.start(gauss_elimination, A, b, self.pivoting.get(), cache=default_cache):
+            self.solve_button.config(state=tk.DISABLED)
+            self.cancel_button.config(state=tk.NORMAL)
+            self.progress.start()
+    
+    def show_step(self, step):
+        if step.kind == 'pivot':
+            self.solution_text.append(f"Pivot: Swapped row {step.row+1} ↔ {step.pivot_row+1}\n")
+            rows = [step.row, step.pivot_row]
+            self.current[rows] = self.current[rows[::-1]]
+            self.print_matrix(self.current, "After pivot:")
+        elif step.kind == 'eliminate':
+            j, i, m = step.row, step.pivot_row, step.multiplier
+            self.current[j, i:] = step.values
+            self.solution_text.append(f"m {j+1}{i+1} = {step.numerator:.4} / {step.denominator:.4} = {m:.4f} \n")
+            self.solution_text.append(f"Row {j+1} -= {m:.4f} * Row {i+1}\n")
+            self.print_matrix(self.current[:,:-1], "Current A:")
+        elif step.kind == 'back':
+            self.solution_text.append(f"x[{step.row}] = {step.value:.4f}\n")
+    
+    def show_result(self, result):
+        self.finish()
+        if result.cached:
+            self.solution_text.insert(self.factors_line, "Matrix A was factored before: elimination skipped, reusing the cached factors\n")
+            self.print_matrix(np.column_stack((result.U, result.c)), "Reduced [U|c]:", line=self.factors_line + 1)
         
-        x = np.zeros(3)
-        for i in range(2, -1, -1):
-            x[i] = (Ab[i,3] - np.sum(Ab[i,i+1:3]*x[i+1:3])) / Ab[i,i]
-            self.solution_text.insert(tk.END, f"x[{i}] = {x[i]:.4f}\n")
+        stats = default_cache.stats()
+        self.solution_text.append(f"\nFactorization cache: {stats['hits']} hits, {stats['misses']} misses\n")
+    
+    def show_error(self, error):
+        self.finish()
+        messagebox.showerror("Error", str(error))
+    
+    def show_cancelled(self):
+        self.finish()
+        self.solution_text.append("\nCalculation cancelled\n")
+    
+    def finish(self):
+        self.progress.stop()
+        self.solve_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
     
-    def print_matrix(self, matrix, label=""):
-        self.solution_text.insert(tk.END, f"{label}\n")
-        for row in matrix:
-            self.solution_text.insert(tk.END, " ".join(f"{x:7.3f}" for x in row) + "\n")
-        self.solution_text.insert(tk.END, "\n")
+    def print_matrix(self, matrix, label="", line=None):
+        text = f"{label}\n" + "".join(" ".join(f"{x:7.3f}" for x in row) + "\n" for row in matrix) + "\n"
+        if line is None:
+            self.solution_text.append(text)
+        else:
+            self.solution_text.insert(line, text)
 
 def run():
-    root = tk.Toplevel()
-    app = GaussEliminationCalculator(root)
-    root.mainloop()
+    windows.show(__name__, GaussEliminationCalculator)
     
 if __name__ == "__main__":
     run()
\ No newline at end of file
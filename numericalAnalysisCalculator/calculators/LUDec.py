@@ -2,6 +2,11 @@ import numpy as np
 import tkinter as tk
 from tkinter import ttk, messagebox
 import random
+from numericalAnalysisCalculator.core.cache import default_cache
+from numericalAnalysisCalculator.core.linear import lu_solve
+from numericalAnalysisCalculator.calculators.logview import LogView
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
 
 class LUSolver:
     def __init__(self, root):
@@ -13,6 +18,7 @@ class LUSolver:
         self.matrix_entries = []
         self.pivoting = tk.BooleanVar(value=True)
         
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
         self.setup_ui()
         self.create_matrix_inputs()
     
@@ -25,18 +31,20 @@ class LUSolver:
         self.matrix_frame = ttk.LabelFrame(main_frame, text="Enter 3x3 Matrix A and Vector b")
         self.matrix_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        self.solution_text = tk.Text(main_frame, height=22, wrap=tk.WORD, font=('Consolas', 10))
-        scrollbar = ttk.Scrollbar(main_frame, command=self.solution_text.yview)
-        self.solution_text.config(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.solution_text = LogView(main_frame, height=22, font=('Consolas', 10))
         self.solution_text.pack(fill=tk.BOTH, expand=True)
         
         btn_frame = ttk.Frame(main_frame)
         btn_frame.pack(fill=tk.X, pady=5)
-        ttk.Button(btn_frame, text="Solve", command=self.solve).pack(side=tk.LEFT)
+        self.solve_button = ttk.Button(btn_frame, text="Solve", command=self.solve)
+        self.solve_button.pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(btn_frame, text="Cancel", command=self.worker.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(5, 0))
         ttk.Button(btn_frame, text="Clear", command=self.clear).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Random Fill", command=self.random_fill).pack(side=tk.LEFT)
         ttk.Button(btn_frame, text="Example", command=self.load_example).pack(side=tk.LEFT, padx=5)
+        self.progress = ttk.Progressbar(btn_frame, mode='indeterminate', length=120)
+        self.progress.pack(side=tk.RIGHT)
     
     def create_matrix_inputs(self):
         for widget in self.matrix_frame.winfo_children():
@@ -75,7 +83,7 @@ class LUSolver:
         for row in self.matrix_entries:
             for entry in row:
                 entry.delete(0, tk.END)
-        self.solution_text.delete(1.0, tk.END)
+        self.solution_text.clear()
     
     def random_fill(self):
         """Fill the matrix with random values"""
@@ -100,96 +108,141 @@ class LUSolver:
                 self.matrix_entries[i][j].insert(0, str(example_A[i][j]))
             self.matrix_entries[i][3].insert(0, str(example_b[i]))
     
-    def print_matrix(self, matrix, title=""):
+    def print_matrix(self, matrix, title="", line=None):
         """Helper method to print a matrix in the solution text"""
-        self.solution_text.insert(tk.END, f"\n{title}\n")
+        text = f"\n{title}\n"
         if len(matrix.shape) == 1:  # Vector 1D
             for i in range(matrix.shape[0]):
-                self.solution_text.insert(tk.END, f"[ {matrix[i]:10.6f} ]\n")
+                text += f"[ {matrix[i]:10.6f} ]\n"
         else:  # Matrix
             for i in range(matrix.shape[0]):
                 row = "[ "
                 for j in range(matrix.shape[1]):
                     row += f"{matrix[i,j]:10.6f} "
                 row += "]\n"
-                self.solution_text.insert(tk.END, row)
-        self.solution_text.insert(tk.END, "\n")
+                text += row
+        text += "\n"
+        
+        # Printed as one block; at a given line if one is given
+        if line is None:
+            self.solution_text.append(text)
+        else:
+            self.solution_text.insert(line, text)
+        return text.count("\n")
     
     def solve(self):
         A, b = self.get_matrix()
         if A is None: return
         
-        self.solution_text.delete(1.0, tk.END)
-        L = np.eye(3)
-        U = A.copy()
-        P = np.eye(3)
-        b = b.copy()
+        self.solution_text.clear()
+        self.n = len(b)
+        self.stage = None
+        self.phase = 'decompose'
         
         # ===== LU DECOMPOSITION =====
-        self.solution_text.insert(tk.END, "=== LU DECOMPOSITION STEPS ===\n")
+        self.solution_text.append("=== LU DECOMPOSITION STEPS ===\n")
         self.print_matrix(A, "Initial Matrix A:")
+        # The steps only carry the rows they change; they are replayed on these
+        self.U = np.array(A, dtype=float)
+        self.L = np.eye(self.n)
         
-        for i in range(3):
-            self.solution_text.insert(tk.END, f"--- STAGE {i+1} ---\n")
-            
-            # Pivoting
-            if self.pivoting.get():
-                max_row = np.argmax(np.abs(U[i:, i])) + i
-                if max_row != i:
-                    U[[i, max_row], i:] = U[[max_row, i], i:]
-                    if i > 0:
-                        L[[i, max_row], :i] = L[[max_row, i], :i]
-                    P[[i, max_row]] = P[[max_row, i]]
-                    b[[i, max_row]] = b[[max_row, i]]
-                    self.solution_text.insert(tk.END, f"Pivot: Swapped row {i+1} ↔ row {max_row+1}\n")
-                    self.print_matrix(U, "U after pivot:")
-                    self.print_matrix(L, "L after pivot:")
+        # Where the cached factors are shown if the decomposition is skipped
+        self.factors_line = self.solution_text.line_count()
+        
+        # Solve on a worker thread; steps arrive through show_step
+        if self.worker.start(lu_solve, A, b, self.pivoting.get(), cache=default_cache):
+            self.solve_button.config(state=tk.DISABLED)
+            self.cancel_button.config(state=tk.NORMAL)
+            self.progress.start()
+    
+    def show_step(self, step):
+        """Prints one streamed step, opening a new stage or phase as needed"""
+        n = self.n
+        if step.kind in ('pivot', 'eliminate'):
+            # Elimination steps are grouped by stage (pivot column)
+            i = step.row if step.kind == 'pivot' else step.pivot_row
+            if i != self.stage:
+                self.stage = i
+                self.solution_text.append(f"--- STAGE {i+1} ---\n")
             
-            # Elimination
-            for j in range(i+1, 3):
-                L[j,i] = U[j,i]/U[i,i]
-                self.solution_text.insert(tk.END, f"m{j+1}{i+1} = {U[j,i]:.4f} / {U[i,i]:.4f} = {L[j,i]:.4f}\n")
-                U[j,i:] -= L[j,i] * U[i,i:]
-                self.solution_text.insert(tk.END, f"Row {j+1} -= {L[j,i]:.4f} * Row {i+1}\n")
-                self.print_matrix(U, "Updated U:")
-                self.print_matrix(L, "Updated L:")
-        
-        # ===== FORWARD SUBSTITUTION =====
-        self.solution_text.insert(tk.END, "\n=== FORWARD SUBSTITUTION (Lc = b) ===\n")
-        c = np.zeros(3)
-        for i in range(3):
-            c[i] = b[i] - np.sum(L[i,:i] * c[:i])
-            self.solution_text.insert(tk.END, f"\nc[{i}] = b[{i}] - sum(L[{i},:]*c[:])")
-            self.solution_text.insert(tk.END, f"\n     = {b[i]:.4f} - {np.sum(L[i,:i] * c[:i]):.4f} = {c[i]:.6f}\n")
-        
-        # ===== BACK SUBSTITUTION =====
-        self.solution_text.insert(tk.END, "\n=== BACK SUBSTITUTION (Ux = c) ===\n")
-        x = np.zeros(3)
-        for i in range(2, -1, -1):
-            self.solution_text.insert(tk.END, f"\nSolving for x[{i}]:\n")
-            self.solution_text.insert(tk.END, f"x[{i}] = [c[{i}] - (")
+            if step.kind == 'pivot':
+                self.solution_text.append(f"Pivot: Swapped row {i+1} ↔ row {step.pivot_row+1}\n")
+                rows = [i, step.pivot_row]
+                self.U[rows, i:] = self.U[rows[::-1], i:]
+                self.L[rows, :i] = self.L[rows[::-1], :i]
+                self.print_matrix(self.U, "U after pivot:")
+                self.print_matrix(self.L, "L after pivot:")
+            else:
+                j = step.row
+                self.U[j, i:] = step.values
+                self.L[j, i] = step.multiplier
+                self.solution_text.append(f"m{j+1}{i+1} = {step.numerator:.4f} / {step.denominator:.4f} = {step.multiplier:.4f}\n")
+                self.solution_text.append(f"Row {j+1} -= {step.multiplier:.4f} * Row {i+1}\n")
+                self.print_matrix(self.U, "Updated U:")
+                self.print_matrix(self.L, "Updated L:")
+        
+        elif step.kind == 'forward':
+            # ===== FORWARD SUBSTITUTION =====
+            if self.phase != 'forward':
+                self.phase = 'forward'
+                self.solution_text.append("\n=== FORWARD SUBSTITUTION (Lc = b) ===\n")
+            i = step.row
+            self.solution_text.append(f"\nc[{i}] = b[{i}] - sum(L[{i},:]*c[:])")
+            self.solution_text.append(f"\n     = {step.rhs:.4f} - {step.total:.4f} = {step.value:.6f}\n")
+        
+        else:
+            # ===== BACK SUBSTITUTION =====
+            if self.phase != 'back':
+                self.phase = 'back'
+                self.solution_text.append("\n=== BACK SUBSTITUTION (Ux = c) ===\n")
+            i = step.row
+            self.solution_text.append(f"\nSolving for x[{i}]:\n")
+            self.solution_text.append(f"x[{i}] = [c[{i}] - (")
             
             # Show the terms being subtracted
             terms = []
-            for j in range(i+1, 3):
+            for j in range(i+1, n):
                 terms.append(f"U[{i},{j}]*x[{j}]")
-            self.solution_text.insert(tk.END, " + ".join(terms) + f")] / U[{i},{i}]\n")
+            self.solution_text.append(" + ".join(terms) + f")] / U[{i},{i}]\n")
             
             # Show numerical calculation
-            sum_terms = np.sum(U[i,i+1:3] * x[i+1:3])
-            self.solution_text.insert(tk.END, f"     = [{c[i]:.6f} - ({sum_terms:.6f})] / {U[i,i]:.6f}\n")
-            x[i] = (c[i] - sum_terms) / U[i,i]
-            self.solution_text.insert(tk.END, f"     = {x[i]:.8f}\n")
+            self.solution_text.append(f"     = [{step.rhs:.6f} - ({step.total:.6f})] / {step.diagonal:.6f}\n")
+            self.solution_text.append(f"     = {step.value:.8f}\n")
+    
+    def show_result(self, result):
+        """Prints the solution once the solver has finished"""
+        self.finish()
+        if result.cached:
+            line = self.factors_line
+            self.solution_text.insert(line, "Matrix A was factored before: reusing the cached factors\n")
+            line += 1
+            for matrix, title in ((result.P, "P:"), (result.U, "U:"), (result.L, "L:")):
+                line += self.print_matrix(matrix, title, line)
         
         # ===== FINAL SOLUTION =====
-        self.solution_text.insert(tk.END, "=== FINAL SOLUTION ===\n")
-        for i in range(3):
-            self.solution_text.insert(tk.END, f"x[{i}] = {x[i]:.8f}\n")
+        self.solution_text.append("=== FINAL SOLUTION ===\n")
+        for i in range(self.n):
+            self.solution_text.append(f"x[{i}] = {result.x[i]:.8f}\n")
+        
+        stats = default_cache.stats()
+        self.solution_text.append(f"\nFactorization cache: {stats['hits']} hits, {stats['misses']} misses\n")
+    
+    def show_error(self, error):
+        self.finish()
+        messagebox.showerror("Error", str(error))
+    
+    def show_cancelled(self):
+        self.finish()
+        self.solution_text.append("\nCalculation cancelled\n")
+    
+    def finish(self):
+        """Re-enables Solve after a run"""
+        self.progress.stop()
+        self.solve_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
 
 def run():
-    root = tk.Toplevel()
-    app = LUSolver(root)
-    root.mainloop()
+    windows.show(__name__, LUSolver)
     
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -0,0 +1 @@
+"""Tkinter windows for each numerical method."""
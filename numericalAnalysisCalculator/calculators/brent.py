@@ -0,0 +1,256 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from numericalAnalysisCalculator.core.expression import compile_function, ExpressionError
+from numericalAnalysisCalculator.core.profiling import instrument
+from numericalAnalysisCalculator.core.rootfinding import brent
+from numericalAnalysisCalculator.calculators.logview import LogView
+from numericalAnalysisCalculator.calculators.rootscan import RootScan
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
+
+class BrentCalculator:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Brent's Method Calculator")
+        self.root.geometry("800x700")
+        self.root.resizable(False, False)
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
+        self.scan = RootScan(self, 'brent')
+        self.setup_ui()
+        
+    def setup_ui(self):
+        # Create main container
+        main_frame = tk.Frame(self.root, bg="#f0f2f5")
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Input frame
+        input_frame = tk.LabelFrame(main_frame, text="Input Parameters", bg="#f0f2f5", fg="#333", font=('Arial', 12, 'bold'))
+        input_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # Function input
+        tk.Label(input_frame, text="Function f(x):", bg="#f0f2f5", font=('Arial', 10)).grid(row=0, column=0, sticky='w', padx=5, pady=5)
+        self.function_entry = tk.Entry(input_frame, width=40, font=('Arial', 10))
+        self.function_entry.grid(row=0, column=1, padx=5, pady=5)
+        
+        # Bounds and tolerance
+        tk.Label(input_frame, text="Lower bound (xl):", bg="#f0f2f5", font=('Arial', 10)).grid(row=1, column=0, sticky='w', padx=5, pady=5)
+        self.xl_entry = tk.Entry(input_frame, font=('Arial', 10))
+        self.xl_entry.grid(row=1, column=1, sticky='w', padx=5, pady=5)
+        
+        tk.Label(input_frame, text="Upper bound (xu):", bg="#f0f2f5", font=('Arial', 10)).grid(row=2, column=0, sticky='w', padx=5, pady=5)
+        self.xu_entry = tk.Entry(input_frame, font=('Arial', 10))
+        self.xu_entry.grid(row=2, column=1, sticky='w', padx=5, pady=5)
+        
+        tk.Label(input_frame, text="Error tolerance (ε):", bg="#f0f2f5", font=('Arial', 10)).grid(row=3, column=0, sticky='w', padx=5, pady=5)
+        self.eps_entry = tk.Entry(input_frame, font=('Arial', 10))
+        self.eps_entry.grid(row=3, column=1, sticky='w', padx=5, pady=5)
+        
+        tk.Label(input_frame, text="Max iterations:", bg="#f0f2f5", font=('Arial', 10)).grid(row=4, column=0, sticky='w', padx=5, pady=5)
+        self.max_iter_entry = tk.Entry(input_frame, font=('Arial', 10))
+        self.max_iter_entry.grid(row=4, column=1, sticky='w', padx=5, pady=5)
+        
+        # Calculate and Cancel buttons
+        button_frame = tk.Frame(main_frame, bg="#f0f2f5")
+        button_frame.pack(pady=10)
+        self.btn_calculate = tk.Button(button_frame, text="Calculate", command=self.start_brent, 
+                                 bg="#4CAF50", fg="white", font=('Arial', 10, 'bold'))
+        self.btn_calculate.pack(side=tk.LEFT, padx=5)
+        self.btn_cancel = tk.Button(button_frame, text="Cancel", command=self.cancel, 
+                                   bg="#F44336", fg="white", font=('Arial', 10, 'bold'), state=tk.DISABLED)
+        self.btn_cancel.pack(side=tk.LEFT, padx=5)
+        self.btn_export = tk.Button(button_frame, text="Export CSV", command=self.export_trace, 
+                                   bg="#2196F3", fg="white", font=('Arial', 10), state=tk.DISABLED)
+        self.btn_export.pack(side=tk.LEFT, padx=5)
+        self.btn_scan = tk.Button(button_frame, text="Find All Roots", command=self.scan.start, 
+                                 bg="#9C27B0", fg="white", font=('Arial', 10))
+        self.btn_scan.pack(side=tk.LEFT, padx=5)
+        
+        # Progress through max iterations
+        self.progress = ttk.Progressbar(main_frame, mode='determinate', length=400)
+        self.progress.pack(pady=(0, 10))
+        
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Results tab
+        results_tab = tk.Frame(self.notebook, bg="#f0f2f5")
+        self.notebook.add(results_tab, text="Results")
+        
+        self.result_box = LogView(results_tab, width=90, height=15, font=('Arial', 10), bg="white")
+        self.result_box.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Root display
+        self.root_result_label = tk.Label(results_tab, text="", bg="#f0f2f5", 
+                                         font=('Arial', 12, 'bold'), fg="#388E3C")
+        self.root_result_label.pack(pady=5)
+        
+        # Cost of the last run: evaluations of f and time spent inside it
+        self.evaluations_label = tk.Label(results_tab, text="", bg="#f0f2f5", font=('Arial', 9), fg="#555555")
+        self.evaluations_label.pack()
+        
+        # Calculations tab
+        calculations_tab = tk.Frame(self.notebook, bg="#f0f2f5")
+        self.notebook.add(calculations_tab, text="Calculations")
+        
+        self.calc_box = LogView(calculations_tab, width=90, height=15, font=('Arial', 10), bg="white")
+        self.calc_box.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Example function button
+        btn_example = tk.Button(main_frame, text="Load Example", command=self.load_example, 
+                               bg="#2196F3", fg="white", font=('Arial', 10))
+        btn_example.pack(pady=5)
+    
+    def load_example(self):
+        self.function_entry.delete(0, tk.END)
+        self.function_entry.insert(0, "4*x**3 - 6*x**2 + 7*x - 2.3")
+        self.xl_entry.delete(0, tk.END)
+        self.xl_entry.insert(0, "0")
+        self.xu_entry.delete(0, tk.END)
+        self.xu_entry.insert(0, "1")
+        self.eps_entry.delete(0, tk.END)
+        self.eps_entry.insert(0, "1e-10")
+        self.max_iter_entry.delete(0, tk.END)
+        self.max_iter_entry.insert(0, "50")
+    
+    def compile_function(self, func_str):
+        """Parses and compiles the user-defined function once."""
+        try:
+            return compile_function(func_str)
+        except ExpressionError as e:
+            messagebox.showerror("Error", str(e))
+            return None
+    
+    def brent_method(self, f, xl, xu, eps, max_iter):
+        """Performs Brent's method to find the root of the function."""
+        self.result_box.clear()
+        self.calc_box.clear()
+        self.root_result_label.config(text="")
+        self.evaluations_label.config(text="")
+        self.btn_export.config(state=tk.DISABLED)
+        self.progress.config(value=0, maximum=max_iter)
+        
+        # Solve on a worker thread; records arrive through show_step
+        self.f = instrument(f)
+        if self.worker.start(brent, self.f, xl, xu, eps, max_iter, trace=True):
+            self.btn_calculate.config(state=tk.DISABLED)
+            self.btn_scan.config(state=tk.DISABLED)
+            self.btn_cancel.config(state=tk.NORMAL)
+    
+    def show_step(self, step):
+        """Displays one iteration record streamed from the solver."""
+        # Display iteration results
+        self.display_iteration(step.iteration, step.xl, step.xu, step.xr, step.f_xl, step.f_xu, step.f_xr, step.error, step.kind)
+        
+        # Show calculations for this step
+        self.display_calculations(step)
+        self.progress.config(value=step.iteration)
+    
+    def show_result(self, result):
+        """Shows the root once the solver has finished."""
+        self.finish()
+        self.trace = result.trace
+        self.btn_export.config(state=tk.NORMAL)
+        self.evaluations_label.config(text=self.f.summary())
+        if result.converged:
+            self.root_result_label.config(text=f"Root found: {result.root:.8f} (after {result.n_iter} iterations)", fg="#388E3C")
+        else:
+            messagebox.showwarning("Warning", result.message)
+            self.root_result_label.config(text=f"Approximate root: {result.root:.8f} (max iterations reached)", fg="#FF5722")
+    
+    def show_error(self, error):
+        """Reports an exception raised by the solver."""
+        self.finish()
+        if isinstance(error, ValueError):
+            messagebox.showerror("Error", f"Invalid input: {error}")
+        else:
+            messagebox.showerror("Error", f"An error occurred: {error}")
+    
+    def show_cancelled(self):
+        """Marks a run stopped with the Cancel button."""
+        self.finish()
+        self.root_result_label.config(text="Calculation cancelled", fg="#FF5722")
+    
+    def export_trace(self):
+        """Saves the iterations of the last run as CSV."""
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if path:
+            self.trace.to_csv(path)
+    
+    def cancel(self):
+        """Stops whichever run is in progress."""
+        self.worker.cancel()
+        self.scan.cancel()
+    
+    def finish(self):
+        """Re-enables the inputs after a run."""
+        self.btn_calculate.config(state=tk.NORMAL)
+        self.btn_scan.config(state=tk.NORMAL)
+        self.btn_cancel.config(state=tk.DISABLED)
+    
+    def display_iteration(self, iter_count, xl, xu, xr, f_xl, f_xu, f_xr, error, kind):
+        """Displays the iteration results in the results tab."""
+        result_text = (f"Iteration {iter_count} ({kind}):\n"
+                      f"xl = {xl:.8f}, f(xl) = {f_xl:.8f}\n"
+                      f"xu = {xu:.8f}, f(xu) = {f_xu:.8f}\n"
+                      f"xr = {xr:.8f}, f(xr) = {f_xr:.8f}\n"
+                      f"Error = {error:.8f}%\n\n") 
+        self.result_box.append(result_text)
+    
+    def display_calculations(self, step):
+        """Shows the detailed calculations for each step in the calculations tab."""
+        b, a = step.xr_old, step.a
+        f_b = step.f_xl if b == step.xl else step.f_xu
+        c, f_c = (step.xu, step.f_xu) if b == step.xl else (step.xl, step.f_xl)
+        calc_text = (f"Step {step.iteration}:\n"
+                    f"   Bracket [xl, xu] = [{step.xl:.8f}, {step.xu:.8f}], best estimate b = {b:.8f}\n")
+        if step.kind == 'inverse quadratic':
+            calc_text += (f"1. Inverse quadratic interpolation: fit x as a quadratic in f through\n"
+                          f"   (a, f(a)) = ({a:.8f}, {step.f_a:.8f})\n"
+                          f"   (b, f(b)) = ({b:.8f}, {f_b:.8f})\n"
+                          f"   (c, f(c)) = ({c:.8f}, {f_c:.8f})\n"
+                          f"   and take its value at f = 0: xr = {step.xr:.8f}\n")
+        elif step.kind == 'secant':
+            calc_text += (f"1. Secant step through (a, f(a)) = ({a:.8f}, {step.f_a:.8f}) and (b, f(b)) = ({b:.8f}, {f_b:.8f}):\n"
+                          f"   xr = b - f(b)*(b - a)/(f(b) - f(a)) = {step.xr:.8f}\n")
+        elif step.kind == 'safeguarded':
+            calc_text += (f"1. Interpolated point too far from the midpoint (b + c)/2 to shrink the bracket as fast as bisection\n"
+                          f"   Move it toward the midpoint: xr = {step.xr:.8f}\n")
+        else:
+            calc_text += (f"1. Interpolation rejected (too close to an end or not shrinking fast enough)\n"
+                          f"   Bisect: xr = (b + c)/2 = ({b:.8f} + {c:.8f})/2 = {step.xr:.8f}\n")
+        calc_text += (f"2. Evaluate f(xr) = {step.f_xr:.8f}\n"
+                      f"3. Evaluate error = abs((xr - b) / xr) * 100 = abs(({step.xr:.8f}-{b:.8f})/{step.xr:.8f})*100 = {step.error:.8f}%\n"
+                      f"4. Check sign:\n"
+                      f"   - f(b) = {f_b:.8f}, f(xr) = {step.f_xr:.8f}\n")
+        if f_b * step.f_xr < 0:
+            calc_text += "   - Sign change between b and xr: new bracket [b, xr]\n"
+        else:
+            calc_text += "   - No sign change between b and xr: new bracket [xr, c]\n"
+        
+        calc_text += "\n"
+        self.calc_box.append(calc_text)
+    
+    def start_brent(self):
+        """Starts the Brent's method calculation with user inputs."""
+        f = self.compile_function(self.function_entry.get())
+        if f is None:
+            return
+        try:
+            xl = float(self.xl_entry.get())
+            xu = float(self.xu_entry.get())
+            eps = float(self.eps_entry.get())
+            max_iter = int(self.max_iter_entry.get())
+            
+            self.brent_method(f, xl, xu, eps, max_iter)
+            
+        except ValueError as ve:
+            messagebox.showerror("Error", f"Invalid input: {ve}")
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {e}")
+
+def run():
+    windows.show(__name__, BrentCalculator)
+    
+if __name__ == "__main__":
+    run()
\ No newline at end of file
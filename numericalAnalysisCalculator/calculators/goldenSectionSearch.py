@@ -1,12 +1,17 @@
 import tkinter as tk
-from tkinter import ttk
-import math
+from tkinter import ttk, filedialog
+from numericalAnalysisCalculator.core.expression import compile_function
+from numericalAnalysisCalculator.core.optimize import R, brent_optimum, golden_section
+from numericalAnalysisCalculator.core.profiling import instrument
+from numericalAnalysisCalculator.calculators.logview import LogView, VirtualTable
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
 
 class GoldenSearchApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Golden Section Search")
-        self.R = (math.sqrt(5) - 1)/2  # Golden ratio
+        self.R = R  # Golden ratio
         self.root.resizable(False, False)
         
         # Variables
@@ -15,7 +20,10 @@ class GoldenSearchApp:
         self.xu_var = tk.StringVar(value="4")
         self.max_iter_var = tk.StringVar(value="8")
         self.optimization_type = tk.StringVar(value="max")
+        self.eps_var = tk.StringVar(value="")
+        self.method = tk.StringVar(value="golden")
         
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
         self.setup_ui()
         
     def setup_ui(self):
@@ -44,7 +52,26 @@ class GoldenSearchApp:
         ttk.Radiobutton(input_frame, text="Minimize", variable=self.optimization_type, 
                        value="min").grid(row=4, column=1, sticky="w")
         
-        ttk.Button(mainframe, text="Run", command=self.run).grid(row=1, column=0, pady=10)
+        # Blank tolerance: golden section runs all max iterations, Brent uses its default
+        ttk.Label(input_frame, text="Tolerance εs (%):").grid(row=5, column=0, sticky="w")
+        ttk.Entry(input_frame, textvariable=self.eps_var, width=10).grid(row=5, column=1, sticky="w")
+        
+        ttk.Radiobutton(input_frame, text="Golden section", variable=self.method,
+                       value="golden").grid(row=6, column=0, sticky="w")
+        ttk.Radiobutton(input_frame, text="Brent (parabolic)", variable=self.method,
+                       value="brent").grid(row=6, column=1, sticky="w")
+        
+        # Run and Cancel buttons, with progress through max iterations
+        button_frame = ttk.Frame(mainframe)
+        button_frame.grid(row=1, column=0, pady=10)
+        self.run_button = ttk.Button(button_frame, text="Run", command=self.run)
+        self.run_button.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.worker.cancel, state="disabled")
+        self.cancel_button.pack(side="left", padx=5)
+        self.export_button = ttk.Button(button_frame, text="Export CSV", command=self.export_trace, state="disabled")
+        self.export_button.pack(side="left", padx=5)
+        self.progress = ttk.Progressbar(button_frame, mode='determinate', length=200)
+        self.progress.pack(side="left", padx=(10,0))
         
         # Results Notebook
         self.notebook = ttk.Notebook(mainframe)
@@ -54,117 +81,189 @@ class GoldenSearchApp:
         table_frame = ttk.Frame(self.notebook)
         self.notebook.add(table_frame, text="Results")
         
-        cols = ("Iter", "xl", "f(xl)", "x1", "f(x1)", "x2", "f(x2)", "xu", "f(xu)", "d")
-        self.tree = ttk.Treeview(table_frame, columns=cols, show="headings", height=10)
+        cols = ("Iter", "xl", "f(xl)", "x1", "f(x1)", "x2", "f(x2)", "xu", "f(xu)", "d", "ea (%)")
+        self.golden_table = VirtualTable(table_frame, columns=cols, height=10, format_row=self.format_step)
+        for col in cols:
+            self.golden_table.tree.column(col, width=70, anchor="center")
+            self.golden_table.tree.heading(col, text=col)
+        self.golden_table.grid(row=0, column=0, sticky="nsew")
+        
+        # Brent's method has its own columns; run() shows the table of the chosen method
+        cols = ("Iter", "xl", "xu", "x", "f(x)", "u", "f(u)", "Step", "ea (%)")
+        self.brent_table = VirtualTable(table_frame, columns=cols, height=10, format_row=self.format_brent_step)
         for col in cols:
-            self.tree.column(col, width=70, anchor="center")
-            self.tree.heading(col, text=col)
-        self.tree.grid(row=0, column=0, sticky="nsew")
+            self.brent_table.tree.column(col, width=80, anchor="center")
+            self.brent_table.tree.heading(col, text=col)
+        self.brent_table.grid(row=0, column=0, sticky="nsew")
+        self.brent_table.grid_remove()
+        self.table = self.golden_table
         
         # Calculation Steps Tab
         self.steps_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.steps_frame, text="Calculation Steps")
         
-        self.steps_text = tk.Text(self.steps_frame, wrap="word", width=80, height=15)
-        scrollbar = ttk.Scrollbar(self.steps_frame, command=self.steps_text.yview)
-        self.steps_text.configure(yscrollcommand=scrollbar.set)
-        
+        self.steps_text = LogView(self.steps_frame, width=80, height=15)
         self.steps_text.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
         
         # Result Label
         self.result_var = tk.StringVar()
         ttk.Label(mainframe, textvariable=self.result_var, font=('TkDefaultFont', 10, 'bold')).grid(row=3, column=0, sticky="w")
-    
-    def evaluate(self, x):
-        """Safely evaluate the function at point x"""
-        safe_dict = {**{f: getattr(math, f) for f in ['sin', 'cos', 'tan', 'sqrt', 'exp', 'log']},
-                    'pi': math.pi, 'e': math.e, 'x': x}
-        return eval(self.function_str.get(), {"__builtins__": None}, safe_dict)
+        
+        # Cost of the last run: evaluations of f and time spent inside it
+        self.evaluations_var = tk.StringVar()
+        ttk.Label(mainframe, textvariable=self.evaluations_var).grid(row=4, column=0, sticky="w")
     
     def run(self):
         """Run the golden section search algorithm"""
         # Clear previous results
-        self.tree.delete(*self.tree.get_children())
-        self.steps_text.delete(1.0, tk.END)
+        self.golden_table.clear()
+        self.brent_table.clear()
+        self.steps_text.clear()
+        self.result_var.set("")
+        self.evaluations_var.set("")
+        self.export_button.config(state="disabled")
         
         try:
-            # Get and validate inputs
+            # Get inputs
             xl, xu = float(self.xl_var.get()), float(self.xu_var.get())
-            if xl >= xu:
-                raise ValueError("Lower bound must be less than upper bound")
-            
             max_iter = int(self.max_iter_var.get())
-            maximize = self.optimization_type.get() == "max"
-            
-            # Initial setup
-            d = self.R * (xu - xl)
-            x1, x2 = xl + d, xu - d
-            fx1, fx2 = self.evaluate(x1), self.evaluate(x2)
-            
-            # Initial steps documentation
-            self.steps_text.insert(tk.END, "=== INITIAL SETUP ===\n")
-            self.steps_text.insert(tk.END, f"R = (√5-1)/2 ≈ {self.R:.6f}\n")
-            self.steps_text.insert(tk.END, f"Initial interval: [{xl:.6f}, {xu:.6f}]\n")
-            self.steps_text.insert(tk.END, f"d = R*(xu-xl) = {d:.6f}\n")
-            self.steps_text.insert(tk.END, f"x1 = xl+d = {x1:.6f}, f(x1) = {fx1:.6f}\n")
-            self.steps_text.insert(tk.END, f"x2 = xu-d = {x2:.6f}, f(x2) = {fx2:.6f}\n\n")
-            
-            # Main iteration loop
-            for i in range(max_iter):
-                fxl, fxu = self.evaluate(xl), self.evaluate(xu)
-                
-                # Add to results table
-                self.tree.insert("", "end", values=(
-                    i+1, f"{xl:.6f}", f"{fxl:.6f}", f"{x1:.6f}", f"{fx1:.6f}",
-                    f"{x2:.6f}", f"{fx2:.6f}", f"{xu:.6f}", f"{fxu:.6f}", f"{d:.6f}"
-                ))
-                
-                # Document this iteration
-                self.steps_text.insert(tk.END, f"=== ITERATION {i+1} ===\n")
-                self.steps_text.insert(tk.END, f"Current: xl={xl:.6f}, x1={x1:.6f}, x2={x2:.6f}, xu={xu:.6f}\n")
-                self.steps_text.insert(tk.END, f"Values: f(x1)={fx1:.6f}, f(x2)={fx2:.6f}\n")
-                
-                if (maximize and fx1 > fx2) or (not maximize and fx1 < fx2):
-                    self.steps_text.insert(tk.END, f"Keep LEFT interval (f(x1) {'>' if maximize else '<'} f(x2))\n")
-                    xl, x2, fx2 = x2, x1, fx1
-                    d = self.R * (xu - xl)
-                    x_opt= x1
-                    f_opt= fx1
-                    x1 = xl + d
-                    fx1 = self.evaluate(x1)
-                else:
-                    self.steps_text.insert(tk.END, f"Keep RIGHT interval (f(x1) {'<=' if maximize else '>='} f(x2))\n")
-                    xu, x1, fx1 = x1, x2, fx2
-                    d = self.R * (xu - xl)
-                    x_opt= x2
-                    f_opt= fx2
-                    x2 = xu - d
-                    fx2 = self.evaluate(x2)
-                
-                self.steps_text.insert(tk.END, f"New interval: [{xl:.6f}, {xu:.6f}]\n")
-                self.steps_text.insert(tk.END, f"New d = {d:.6f}, x1 = {x1:.6f}, x2 = {x2:.6f}\n\n")
-            
-            # Final result
-            result = f"{'Maximum' if maximize else 'Minimum'} at x = {x_opt:.6f}, f(x) = {f_opt:.6f}"
-            self.result_var.set(result)
-                                                
-            self.steps_text.insert(tk.END, "=== FINAL RESULT ===\n")
-            self.steps_text.insert(tk.END, f"Final interval: [{xl:.6f}, {xu:.6f}]\n")
-            self.steps_text.insert(tk.END, f"Optimal x ≈ {x_opt:.6f}\n")
-            self.steps_text.insert(tk.END, f"f(x) = {f_opt:.6f}\n")
-            self.steps_text.insert(tk.END, f"\nRESULT: {result}\n")
-            self.steps_text.see(1.0)
-            
-            self.notebook.select(self.steps_frame)
-            
+            f = compile_function(self.function_str.get())
+            self.maximize = self.optimization_type.get() == "max"
+            options = {'eps': float(self.eps_var.get())} if self.eps_var.get().strip() else {}
         except Exception as e:
             self.result_var.set(f"Error: {str(e)}")
+            return
+        
+        self.brent = self.method.get() == "brent"
+        solver = brent_optimum if self.brent else golden_section
+        shown, hidden = (self.brent_table, self.golden_table) if self.brent else (self.golden_table, self.brent_table)
+        hidden.grid_remove()
+        shown.grid()
+        self.table = shown
+        
+        self.previous = None
+        self.progress.config(value=0, maximum=max_iter)
+        
+        # Solve on a worker thread; records arrive through show_step
+        self.f = instrument(f)
+        if self.worker.start(solver, self.f, xl, xu, max_iter, self.maximize, trace=True, **options):
+            self.run_button.config(state="disabled")
+            self.cancel_button.config(state="normal")
+    
+    def show_step(self, step):
+        """Add one iteration record streamed from the solver"""
+        if self.brent:
+            self.show_brent_step(step)
+            return
+        if self.previous is None:
+            # Initial steps documentation
+            self.steps_text.append("=== INITIAL SETUP ===\n")
+            self.steps_text.append(f"R = (√5-1)/2 ≈ {self.R:.6f}\n")
+            self.steps_text.append(f"Initial interval: [{step.xl:.6f}, {step.xu:.6f}]\n")
+            self.steps_text.append(f"d = R*(xu-xl) = {step.d:.6f}\n")
+            self.steps_text.append(f"x1 = xl+d = {step.x1:.6f}, f(x1) = {step.f_x1:.6f}\n")
+            self.steps_text.append(f"x2 = xu-d = {step.x2:.6f}, f(x2) = {step.f_x2:.6f}\n\n")
+        else:
+            # The previous iteration ends with the interval this one starts from
+            self.show_new_interval(step)
+        
+        # Add to results table
+        self.table.append(step)
+        
+        # Document this iteration
+        self.steps_text.append(f"=== ITERATION {step.iteration} ===\n")
+        self.steps_text.append(f"Current: xl={step.xl:.6f}, x1={step.x1:.6f}, x2={step.x2:.6f}, xu={step.xu:.6f}\n")
+        self.steps_text.append(f"Values: f(x1)={step.f_x1:.6f}, f(x2)={step.f_x2:.6f}\n")
+        
+        if step.keep == 'left':
+            self.steps_text.append(f"Keep LEFT interval (f(x1) {'>' if self.maximize else '<'} f(x2))\n")
+        else:
+            self.steps_text.append(f"Keep RIGHT interval (f(x1) {'<=' if self.maximize else '>='} f(x2))\n")
+        
+        self.previous = step
+        self.progress.config(value=step.iteration)
+    
+    def show_brent_step(self, step):
+        """Add one iteration of Brent's method"""
+        self.table.append(step)
+        self.steps_text.append(f"=== ITERATION {step.iteration} ===\n")
+        self.steps_text.append(f"Interval [{step.xl:.6f}, {step.xu:.6f}], best x = {step.x:.6f}, "
+                               f"f(x) = {step.fx:.6f}, ea = {step.error:.6f}%\n")
+        if step.kind == 'parabolic':
+            self.steps_text.append("Step: vertex of the parabola through the three best points\n")
+        else:
+            self.steps_text.append("Step: golden section of the larger part of the interval\n")
+        self.steps_text.append(f"New point u = {step.u:.6f}, f(u) = {step.f_u:.6f}\n\n")
+        self.previous = step
+        self.progress.config(value=step.iteration)
+    
+    def format_step(self, step):
+        """Results table row for one iteration"""
+        return (step.iteration, f"{step.xl:.6f}", f"{step.f_xl:.6f}", f"{step.x1:.6f}", f"{step.f_x1:.6f}",
+                f"{step.x2:.6f}", f"{step.f_x2:.6f}", f"{step.xu:.6f}", f"{step.f_xu:.6f}", f"{step.d:.6f}",
+                f"{step.error:.6f}")
+    
+    def format_brent_step(self, step):
+        """Results table row for one iteration of Brent's method"""
+        return (step.iteration, f"{step.xl:.6f}", f"{step.xu:.6f}", f"{step.x:.6f}", f"{step.fx:.6f}",
+                f"{step.u:.6f}", f"{step.f_u:.6f}", step.kind, f"{step.error:.6f}")
+    
+    def show_new_interval(self, new):
+        """Document the interval the next iteration starts from"""
+        self.steps_text.append(f"New interval: [{new.xl:.6f}, {new.xu:.6f}]\n")
+        self.steps_text.append(f"New d = {new.d:.6f}, x1 = {new.x1:.6f}, x2 = {new.x2:.6f}\n\n")
+    
+    def show_result(self, result):
+        """Show the optimum once the solver has finished"""
+        self.finish()
+        self.trace = result.trace
+        self.export_button.config(state="normal")
+        self.evaluations_var.set(self.f.summary())
+        if self.previous is not None and not self.brent:
+            self.show_new_interval(result)
+        if not result.converged:
+            self.steps_text.append(f"{result.message}\n\n")
+        
+        xl, xu, x_opt, f_opt = result.xl, result.xu, result.x, result.fx
+        error, n_iter = result.error, result.n_iter
+        
+        # Final result
+        result = f"{'Maximum' if self.maximize else 'Minimum'} at x = {x_opt:.6f}, f(x) = {f_opt:.6f}"
+        self.result_var.set(result)
+                                            
+        self.steps_text.append("=== FINAL RESULT ===\n")
+        self.steps_text.append(f"Final interval: [{xl:.6f}, {xu:.6f}]\n")
+        self.steps_text.append(f"Optimal x ≈ {x_opt:.6f}\n")
+        self.steps_text.append(f"f(x) = {f_opt:.6f}\n")
+        self.steps_text.append(f"ea = {error:.6f}% after {n_iter} iterations\n")
+        self.steps_text.append(f"\nRESULT: {result}\n")
+        self.steps_text.scroll_to(0)
+        
+        self.notebook.select(self.steps_frame)
+    
+    def show_error(self, error):
+        """Report an exception raised by the solver"""
+        self.finish()
+        self.result_var.set(f"Error: {str(error)}")
+    
+    def show_cancelled(self):
+        """Mark a run stopped with the Cancel button"""
+        self.finish()
+        self.result_var.set("Calculation cancelled")
+    
+    def export_trace(self):
+        """Save the iterations of the last run as CSV"""
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if path:
+            self.trace.to_csv(path)
+    
+    def finish(self):
+        """Re-enable the inputs after a run"""
+        self.run_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
 
 def run():
-    root = tk.Toplevel()
-    app = GoldenSearchApp(root)
-    root.mainloop()
+    windows.show(__name__, GoldenSearchApp)
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -0,0 +1,198 @@
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+from numericalAnalysisCalculator.core.iterative import conjugate_gradient, gauss_seidel, jacobi, sor
+from numericalAnalysisCalculator.core.sparse import laplacian
+from numericalAnalysisCalculator.calculators.logview import LogView
+from numericalAnalysisCalculator.calculators.systems import format_vector
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
+
+# Method names shown in the window -> core.iterative solver
+METHODS = {
+    "Jacobi": jacobi,
+    "Gauss-Seidel": gauss_seidel,
+    "SOR (successive over-relaxation)": sor,
+    "Conjugate Gradient (symmetric positive definite A)": conjugate_gradient,
+}
+
+# Where A and b come from; the Laplacians are built sparse with b = 1
+PROBLEMS = (
+    "Matrix [A|b] entered below",
+    "1D Laplacian, n points (tridiagonal)",
+    "2D Laplacian, n x n grid (five-point)",
+)
+
+
+class IterativeSolverCalculator:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Iterative Linear Solvers")
+        self.root.geometry("800x700")
+
+        self.method = tk.StringVar(value=next(iter(METHODS)))
+        self.problem = tk.StringVar(value=PROBLEMS[0])
+        self.warm_start = tk.BooleanVar(value=False)
+        # Solution of the last run, the starting point of a warm start
+        self.previous = None
+
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
+        self.setup_ui()
+        self.load_example()
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self.root, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # One row of the augmented matrix [A|b] per line
+        matrix_frame = ttk.LabelFrame(main_frame, text="Augmented matrix [A|b] (one row per line)")
+        matrix_frame.pack(fill=tk.X, pady=5)
+        self.matrix_text = tk.Text(matrix_frame, height=6, font=('Consolas', 10))
+        self.matrix_text.pack(fill=tk.X, padx=5, pady=5)
+
+        params_frame = ttk.LabelFrame(main_frame, text="Parameters", padding=10)
+        params_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Label(params_frame, text="Problem:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Combobox(params_frame, textvariable=self.problem, values=PROBLEMS, state='readonly',
+                     width=36).grid(row=0, column=1, sticky=tk.W, padx=(5,15))
+
+        ttk.Label(params_frame, text="n:").grid(row=0, column=2, sticky=tk.W)
+        self.size_entry = ttk.Entry(params_frame, width=15)
+        self.size_entry.grid(row=0, column=3, sticky=tk.W, padx=(5,0))
+        self.size_entry.insert(0, "100")
+
+        ttk.Label(params_frame, text="Method:").grid(row=1, column=0, sticky=tk.W, pady=(8,0))
+        ttk.Combobox(params_frame, textvariable=self.method, values=list(METHODS), state='readonly',
+                     width=36).grid(row=1, column=1, sticky=tk.W, padx=(5,15), pady=(8,0))
+
+        ttk.Label(params_frame, text="SOR ω:").grid(row=1, column=2, sticky=tk.W, pady=(8,0))
+        self.omega_entry = ttk.Entry(params_frame, width=15)
+        self.omega_entry.grid(row=1, column=3, sticky=tk.W, padx=(5,0), pady=(8,0))
+        self.omega_entry.insert(0, "1.5")
+
+        ttk.Label(params_frame, text="Tolerance (||r||/||b||):").grid(row=2, column=0, sticky=tk.W, pady=(8,0))
+        self.tol_entry = ttk.Entry(params_frame, width=15)
+        self.tol_entry.grid(row=2, column=1, sticky=tk.W, padx=(5,15), pady=(8,0))
+        self.tol_entry.insert(0, "1e-8")
+
+        ttk.Label(params_frame, text="Max iterations:").grid(row=2, column=2, sticky=tk.W, pady=(8,0))
+        self.max_iter_entry = ttk.Entry(params_frame, width=15)
+        self.max_iter_entry.grid(row=2, column=3, sticky=tk.W, padx=(5,0), pady=(8,0))
+        self.max_iter_entry.insert(0, "1000")
+
+        ttk.Checkbutton(params_frame, text="Warm start from the previous solution",
+                        variable=self.warm_start).grid(row=3, column=0, columnspan=4, sticky=tk.W, pady=(8,0))
+
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=5)
+        self.solve_button = ttk.Button(btn_frame, text="Solve", command=self.solve)
+        self.solve_button.pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(btn_frame, text="Cancel", command=self.worker.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(btn_frame, text="Example", command=self.load_example).pack(side=tk.LEFT, padx=5)
+        self.progress = ttk.Progressbar(btn_frame, mode='determinate', length=200)
+        self.progress.pack(side=tk.RIGHT)
+
+        self.solution_text = LogView(main_frame, height=18, font=('Consolas', 10))
+        self.solution_text.pack(fill=tk.BOTH, expand=True)
+
+        self.result_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.result_var, font=('Arial', 10, 'bold')).pack(anchor=tk.W, pady=(5,0))
+
+    def load_example(self):
+        """Diagonally dominant 3x3 system with solution x = (1, 2, -1)"""
+        self.problem.set(PROBLEMS[0])
+        self.matrix_text.delete("1.0", tk.END)
+        self.matrix_text.insert("1.0", "4 -1 1 1\n-1 4 -2 9\n1 -2 4 -7")
+
+    def get_system(self):
+        """A and b of the selected problem; raises ValueError on bad input"""
+        problem = PROBLEMS.index(self.problem.get())
+        if problem == 0:
+            rows = [line.replace(',', ' ').split() for line in self.matrix_text.get("1.0", tk.END).splitlines()]
+            M = np.array([[float(v) for v in row] for row in rows if row])
+            if M.ndim != 2 or M.shape[1] != M.shape[0] + 1:
+                raise ValueError("Enter n rows of n + 1 numbers: the coefficients of A, then b")
+            return M[:, :-1], M[:, -1]
+        n = int(self.size_entry.get())
+        if n < 2:
+            raise ValueError("n must be at least 2")
+        A = laplacian(n, dimensions=problem)
+        return A, np.ones(A.shape[0])
+
+    def solve(self):
+        self.solution_text.clear()
+        self.result_var.set("")
+        try:
+            A, b = self.get_system()
+            tol = float(self.tol_entry.get())
+            max_iter = int(self.max_iter_entry.get())
+            omega = float(self.omega_entry.get())
+        except ValueError as ve:
+            messagebox.showerror("Input Error", f"Invalid input: {ve}")
+            return
+
+        x0 = None
+        if self.warm_start.get() and self.previous is not None:
+            if self.previous.shape == b.shape:
+                x0 = self.previous
+            else:
+                self.solution_text.append("Previous solution has a different size: starting from x = 0\n\n")
+
+        solver = METHODS[self.method.get()]
+        options = {'x0': x0, 'tol': tol, 'max_iter': max_iter}
+        if solver is sor:
+            options['omega'] = omega
+        self.progress.config(value=0, maximum=max_iter)
+        start = "the previous solution" if x0 is not None else "x = 0"
+        self.solution_text.append(f"=== {self.method.get().upper()} ===\n{b.size} unknowns, starting from {start}\n\n")
+
+        # Solve on a worker thread; iterations arrive through show_step
+        if self.worker.start(solver, A, b, **options):
+            self.solve_button.config(state=tk.DISABLED)
+            self.cancel_button.config(state=tk.NORMAL)
+
+    def show_step(self, step):
+        """Prints one streamed iteration"""
+        if step.iteration == 0:
+            self.solution_text.append(f"Start: ||r||/||b|| = {step.residual:.6e}\n")
+        else:
+            self.solution_text.append(f"Iteration {step.iteration}: ||r||/||b|| = {step.residual:.6e}, "
+                                      f"error = {step.error:.8f}%\n")
+        if step.x is not None:
+            self.solution_text.append(f"  x = {format_vector(step.x)}\n")
+        self.solution_text.append("\n")
+        self.progress.config(value=step.iteration)
+
+    def show_result(self, result):
+        """Prints the solution once the solver has finished"""
+        self.finish()
+        if not result.converged:
+            messagebox.showwarning("Warning", result.message)
+        self.previous = result.x
+
+        self.solution_text.append("=== SOLUTION ===\n")
+        self.solution_text.append(f"x = {format_vector(result.x)}\n")
+        status = "Converged" if result.converged else "Not converged"
+        self.result_var.set(f"{status} after {result.n_iter} iterations: ||r||/||b|| = {result.residual:.3e}, "
+                            f"{result.matvecs} products with A")
+
+    def show_error(self, error):
+        self.finish()
+        messagebox.showerror("Error", str(error))
+
+    def show_cancelled(self):
+        self.finish()
+        self.solution_text.append("\nCalculation cancelled\n")
+
+    def finish(self):
+        """Re-enables Solve after a run"""
+        self.solve_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+
+def run():
+    windows.show(__name__, IterativeSolverCalculator)
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,177 @@
+"""Scrolling log and table widgets for long iteration traces.
+
+Both widgets keep their content in a Python list and only ever render the
+rows that fit on screen, so a trace of 100,000 iterations costs no more to
+display than one of ten. Appends are cheap list operations; the widget is
+redrawn at most once per FLUSH_MS, and follows the end of the trace unless
+the user has scrolled away from it.
+
+    log = LogView(frame, width=90, height=15)
+    log.append("Iteration 1:\\nxr = 0.5\\n\\n")
+    log.clear()
+
+    table = VirtualTable(frame, columns=('Iter', 'x'), format_row=lambda s: (s.iteration, f"{s.x:.6f}"))
+    table.append(step)
+"""
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+# Minimum time between redraws while records are arriving
+FLUSH_MS = 40
+
+
+class _VirtualView(ttk.Frame):
+    """Scrollbar, wheel and redraw scheduling shared by LogView and VirtualTable.
+
+    Subclasses provide _count() and _render(top, rows).
+    """
+
+    def __init__(self, master, height, **kw):
+        super().__init__(master, **kw)
+        self.rows = height
+        self.top = 0
+        self.follow = True
+        self._flush_id = None
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.yview)
+
+    def _bind_view(self, widget):
+        widget.bind('<MouseWheel>', lambda e: self._wheel(-1 if e.delta > 0 else 1))
+        widget.bind('<Button-4>', lambda e: self._wheel(-1))
+        widget.bind('<Button-5>', lambda e: self._wheel(1))
+
+    def _wheel(self, direction):
+        self.yview('scroll', 3 * direction, 'units')
+        return 'break'
+
+    def yview(self, *args):
+        """Scrollbar protocol: ('moveto', fraction) or ('scroll', n, 'units'|'pages')."""
+        count = self._count()
+        if args[0] == 'moveto':
+            top = int(float(args[1]) * count)
+        else:
+            step = int(args[1]) * (self.rows if args[2] == 'pages' else 1)
+            top = self.top + step
+        self.top = max(0, min(top, count - self.rows))
+        self.follow = self.top + self.rows >= count
+        self.flush()
+
+    def scroll_to(self, index):
+        """Shows the trace from row index, and stops following the end."""
+        self.top = max(0, min(index, self._count() - self.rows))
+        self.follow = self.top + self.rows >= self._count()
+        self.flush()
+
+    def _changed(self):
+        """Schedules a redraw unless one is already pending."""
+        if self._flush_id is None:
+            self._flush_id = self.after(FLUSH_MS, self.flush)
+
+    def flush(self):
+        """Redraws the visible rows now and moves the scrollbar once."""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+        count = self._count()
+        if self.follow:
+            self.top = max(0, count - self.rows)
+        self._render(self.top, self.rows)
+        if count:
+            self.scrollbar.set(self.top / count, min(1.0, (self.top + self.rows) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+class LogView(_VirtualView):
+    """Read-only text log that renders only the lines in view."""
+
+    def __init__(self, master, width=80, height=15, font=None, bg="white", **kw):
+        super().__init__(master, height, **kw)
+        self.lines = ['']
+        self.text = tk.Text(self, width=width, height=height, wrap=tk.NONE, bg=bg,
+                            font=font, state=tk.DISABLED)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self._linespace = tkfont.Font(font=self.text['font']).metrics('linespace')
+        self.text.bind('<Configure>', self._resize)
+        self._bind_view(self.text)
+
+    def _resize(self, event):
+        rows = max(1, event.height // self._linespace)
+        if rows != self.rows:
+            self.rows = rows
+            self.flush()
+
+    def _count(self):
+        return len(self.lines)
+
+    def line_count(self):
+        """Number of complete lines so far, i.e. the index the next line will get."""
+        return len(self.lines) - 1
+
+    def append(self, text):
+        """Adds text at the end of the log."""
+        parts = text.split('\n')
+        self.lines[-1] += parts[0]
+        self.lines.extend(parts[1:])
+        self._changed()
+
+    def insert(self, line, text):
+        """Inserts whole lines of text (ending in a newline) before line number line."""
+        self.lines[line:line] = text[:-1].split('\n') if text.endswith('\n') else text.split('\n')
+        self._changed()
+
+    def clear(self):
+        self.lines = ['']
+        self.top = 0
+        self.follow = True
+        self.flush()
+
+    def _render(self, top, rows):
+        self.text.config(state=tk.NORMAL)
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', '\n'.join(self.lines[top:top + rows]))
+        self.text.config(state=tk.DISABLED)
+
+
+class VirtualTable(_VirtualView):
+    """Treeview over a list of records, formatting only the rows in view.
+
+    format_row turns one record into the tuple of column values; records
+    are stored as given and formatted when they scroll into view.
+    """
+
+    def __init__(self, master, columns, height=10, format_row=tuple, **kw):
+        super().__init__(master, height, **kw)
+        self.records = []
+        self.format_row = format_row
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', height=height)
+        self.tree.grid(row=0, column=0, sticky=tk.NSEW)
+        self.scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self._bind_view(self.tree)
+
+    def _count(self):
+        return len(self.records)
+
+    def append(self, record):
+        self.records.append(record)
+        self._changed()
+
+    def clear(self):
+        self.records = []
+        self.top = 0
+        self.follow = True
+        self.flush()
+
+    def _render(self, top, rows):
+        # Reuse the existing row items; only their values change while scrolling
+        visible = self.records[top:top + rows]
+        items = self.tree.get_children()
+        for item, record in zip(items, visible):
+            self.tree.item(item, values=self.format_row(record))
+        for record in visible[len(items):]:
+            self.tree.insert('', tk.END, values=self.format_row(record))
+        if len(items) > len(visible):
+            self.tree.delete(*items[len(visible):])
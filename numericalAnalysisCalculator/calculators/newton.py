@@ -1,6 +1,34 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import math
+from tkinter import ttk, messagebox, filedialog
+from numericalAnalysisCalculator.core.autodiff import compile_with_derivative, horner_coefficients
+from numericalAnalysisCalculator.core.expression import compile_function
+from numericalAnalysisCalculator.core.polynomial import derivative_coefficients, polynomial_string
+from numericalAnalysisCalculator.core.profiling import instrument
+from numericalAnalysisCalculator.core.rootfinding import newton, safeguarded_newton
+from numericalAnalysisCalculator.calculators.logview import VirtualTable
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
+
+
+def format_num(num):
+    # Format values for display
+    if abs(num) < 1e-4 or abs(num) > 1e6:
+        return "{:.6e}".format(num)
+    return "{:.8f}".format(num)
+
+
+def format_step(step):
+    # Table row for one iteration; the first row has no error yet
+    iteration = step.iteration
+    kind = getattr(step, 'kind', None)
+    if kind in ('damped', 'bisection'):
+        # Safeguarded mode: mark the steps that were not plain Newton steps
+        iteration = f"{iteration} ({kind})"
+    if step.iteration > 0 :
+        return (iteration, format_num(step.x), format_num(step.fx),
+                format_num(step.dfx), format_num(step.error))
+    return (iteration, format_num(step.x), format_num(step.fx), format_num(step.dfx))
+
 
 class NewtonMethodCalculator:
     def __init__(self, root):
@@ -14,6 +42,7 @@ class NewtonMethodCalculator:
         self.style.configure('TButton', font=('Arial', 10))
         self.style.configure('TEntry', font=('Arial', 10))
         
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
         self.create_widgets()
         
     def create_widgets(self):
@@ -32,10 +61,10 @@ class NewtonMethodCalculator:
         self.function_entry.insert(0, "-0.9*x**2 + 1.7*x + 2.5")  # Default example
         
         # Derivative input
-        ttk.Label(main_frame, text="Derivative f'(x):").grid(row=2, column=0, sticky=tk.W, pady=(0,5))
+        # Left blank, f'(x) is computed automatically from f(x)
+        ttk.Label(main_frame, text="Derivative f'(x) (optional):").grid(row=2, column=0, sticky=tk.W, pady=(0,5))
         self.derivative_entry = ttk.Entry(main_frame, width=40)
         self.derivative_entry.grid(row=2, column=1, sticky=tk.W, pady=(0,5))
-        self.derivative_entry.insert(0, "-1.8*x + 1.7")  # Default example
         
         # Parameters frame
         params_frame = ttk.LabelFrame(main_frame, text="Parameters", padding=10)
@@ -59,9 +88,27 @@ class NewtonMethodCalculator:
         self.max_iter_entry.grid(row=0, column=5, sticky=tk.W)
         self.max_iter_entry.insert(0, "100")
         
-        # Calculate button
-        self.calc_button = ttk.Button(main_frame, text="Calculate", command=self.calculate)
-        self.calc_button.grid(row=4, column=0, columnspan=2, pady=(15,10))
+        # Safeguarded mode: optional bracket, bisection fallback and step halving
+        self.safeguarded = tk.BooleanVar(value=False)
+        ttk.Checkbutton(params_frame, text="Safeguarded", variable=self.safeguarded).grid(row=1, column=0, sticky=tk.W, pady=(8,0))
+        ttk.Label(params_frame, text="Bracket a (optional):").grid(row=1, column=2, sticky=tk.W, pady=(8,0))
+        self.bracket_a_entry = ttk.Entry(params_frame, width=15)
+        self.bracket_a_entry.grid(row=1, column=3, sticky=tk.W, padx=(5,15), pady=(8,0))
+        ttk.Label(params_frame, text="b:").grid(row=1, column=4, sticky=tk.W, pady=(8,0))
+        self.bracket_b_entry = ttk.Entry(params_frame, width=15)
+        self.bracket_b_entry.grid(row=1, column=5, sticky=tk.W, pady=(8,0))
+        
+        # Calculate and Cancel buttons, with progress through max iterations
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=(15,10))
+        self.calc_button = ttk.Button(button_frame, text="Calculate", command=self.calculate)
+        self.calc_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.worker.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        self.export_button = ttk.Button(button_frame, text="Export CSV", command=self.export_trace, state=tk.DISABLED)
+        self.export_button.pack(side=tk.LEFT, padx=5)
+        self.progress = ttk.Progressbar(button_frame, mode='determinate', length=250)
+        self.progress.pack(side=tk.LEFT, padx=(15,0))
         
         # Results frame
         results_frame = ttk.LabelFrame(main_frame, text="Iterations", padding=10)
@@ -73,11 +120,11 @@ class NewtonMethodCalculator:
         results_frame.columnconfigure(0, weight=1)
         results_frame.rowconfigure(0, weight=1)
         
-        # Treeview for displaying iterations
-        self.tree = ttk.Treeview(results_frame, 
-                               columns=('Iter', 'x_n', 'f(x_n)', 'fDash(x_n)', 'Error'), 
-                               show='headings', 
-                               height=12)
+        # Table of iterations; only the rows in view are formatted and drawn
+        self.table = VirtualTable(results_frame, 
+                                  columns=('Iter', 'x_n', 'f(x_n)', 'fDash(x_n)', 'Error'), 
+                                  height=12, format_row=format_step)
+        self.tree = self.table.tree
         
         # Configure columns
         self.tree.heading('Iter', text='Iteration')
@@ -86,19 +133,13 @@ class NewtonMethodCalculator:
         self.tree.heading('fDash(x_n)', text='fDash(xₙ)')
         self.tree.heading('Error', text='Error')
         
-        self.tree.column('Iter', width=70, anchor=tk.CENTER)
-        self.tree.column('x_n', width=140, anchor=tk.CENTER)
-        self.tree.column('f(x_n)', width=140, anchor=tk.CENTER)
-        self.tree.column('fDash(x_n)', width=140, anchor=tk.CENTER)
-        self.tree.column('Error', width=140, anchor=tk.CENTER)
-        
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
+        self.tree.column('Iter', width=110, anchor=tk.CENTER)
+        self.tree.column('x_n', width=130, anchor=tk.CENTER)
+        self.tree.column('f(x_n)', width=130, anchor=tk.CENTER)
+        self.tree.column('fDash(x_n)', width=130, anchor=tk.CENTER)
+        self.tree.column('Error', width=130, anchor=tk.CENTER)
         
-        # Grid the tree and scrollbar
-        self.tree.grid(row=0, column=0, sticky=tk.NSEW)
-        scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.table.grid(row=0, column=0, sticky=tk.NSEW)
         
         # Final result
         result_frame = ttk.Frame(main_frame)
@@ -109,91 +150,115 @@ class NewtonMethodCalculator:
         ttk.Label(result_frame, textvariable=self.result_var, 
                  font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=(5,0))
         
+        # Cost of the last run: evaluations of f and time spent inside it
+        self.evaluations_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.evaluations_var, 
+                 font=('Arial', 9)).grid(row=7, column=0, columnspan=2, sticky=tk.W)
+        
+        # Exact f'(x) when f(x) is a polynomial and no derivative was entered
+        self.derivative_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.derivative_var, 
+                 font=('Arial', 9)).grid(row=8, column=0, columnspan=2, sticky=tk.W)
+        
     def calculate(self):
         # Clear previous results
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.table.clear()
         self.result_var.set("")
+        self.evaluations_var.set("")
+        self.derivative_var.set("")
+        self.export_button.config(state=tk.DISABLED)
         
         try:
-            # Get inputs
+            # Get inputs, parsing and compiling f(x) and f'(x) once
             func_str = self.function_entry.get()
-            df_str = self.derivative_entry.get()
+            df_str = self.derivative_entry.get().strip()
+            if df_str:
+                f, df = compile_function(func_str), compile_function(df_str)
+            else:
+                # Automatic derivative: f(x) and f'(x) from one fused evaluation
+                f, df = compile_with_derivative(func_str), None
+                # Only labelled when compile_with_derivative really took the Horner path
+                coeffs = horner_coefficients(func_str)
+                if coeffs is not None:
+                    self.derivative_var.set(f"f'(x) = {polynomial_string(derivative_coefficients(coeffs))} (exact, Horner evaluation)")
             x0 = float(self.x0_entry.get())
             tol = float(self.tol_entry.get())
             max_iter = int(self.max_iter_entry.get())
-            
-            # Initialize variables
-            x = x0
-            converged = False
-            result = None
-            x_prev= 0
-            
-            for i in range(max_iter):
-                # Evaluate function and derivative
-                fx = eval(func_str, {'x': x, 'math': math})
-                dfx = eval(df_str, {'x': x, 'math': math})
-                
-                if abs(dfx) < 1e-15:
-                    messagebox.showwarning("Warning", "Derivative is zero. Method cannot continue.")
-                    return
-                
-                
-                # Calculate next value
-                x_next = x - (fx / dfx)
-                
-                error = abs((x - x_prev)/x)*100 
-                
-                x_prev = x
-                # Format values for display
-                def format_num(num):
-                    if abs(num) < 1e-4 or abs(num) > 1e6:
-                        return "{:.6e}".format(num)
-                    return "{:.8f}".format(num)
-                
-                # Add to treeview
-                if i > 0 :    
-                    self.tree.insert('', tk.END, 
-                                    values=(i, 
-                                           format_num(x),
-                                           format_num(fx),
-                                           format_num(dfx),
-                                           format_num(error)))
-                else : 
-                    self.tree.insert('', tk.END, 
-                                    values=(i, 
-                                           format_num(x),
-                                           format_num(fx),
-                                           format_num(dfx)))                
-                
-                
-                # Check convergence
-                if error < tol:
-                    converged = True
-                    result = x
-                    break
-                 
-                x = x_next
-            
-            # Display final result
-            if result is None:
-                result = x  # In case max_iter reached
-                
-            if converged:
-                self.result_var.set(f"{format_num(result)} (Converged after {i+1} iterations)")
+            a_str, b_str = self.bracket_a_entry.get().strip(), self.bracket_b_entry.get().strip()
+            if self.safeguarded.get() and (a_str or b_str):
+                bracket = (float(a_str), float(b_str))
             else:
-                self.result_var.set(f"{format_num(result)} (Max iterations reached)")
-            
-            # Auto-scroll to the bottom
-            self.tree.yview_moveto(1)
-            
+                bracket = (None, None)
         except ValueError as ve:
             messagebox.showerror("Input Error", f"Invalid input: {str(ve)}")
+            return
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return
+        
+        self.max_iter = max_iter
+        self.progress.config(value=0, maximum=max_iter)
+        
+        # Solve on a worker thread; records arrive through show_step
+        self.f = instrument(f)
+        if self.safeguarded.get():
+            started = self.worker.start(safeguarded_newton, self.f, df, x0, *bracket, tol, max_iter, trace=True)
+        else:
+            started = self.worker.start(newton, self.f, df, x0, tol, max_iter, trace=True)
+        if started:
+            self.calc_button.config(state=tk.DISABLED)
+            self.cancel_button.config(state=tk.NORMAL)
+    
+    def show_step(self, step):
+        """Adds one iteration record streamed from the solver to the table."""
+        self.table.append(step)
+        self.progress.config(value=step.iteration)
+    
+    def show_result(self, result):
+        """Shows the root once the solver has finished."""
+        self.finish()
+        self.trace = result.trace
+        if self.trace is not None:
+            self.export_button.config(state=tk.NORMAL)
+        self.evaluations_var.set(self.f.summary())
+        
+        # Draw the last rows now rather than on the next flush
+        self.table.flush()
+        
+        # Display final result
+        if result.converged:
+            self.result_var.set(f"{format_num(result.root)} (Converged after {result.n_iter} iterations)")
+        elif result.n_iter < self.max_iter:
+            # Stopped early: the solver's message says why
+            messagebox.showwarning("Warning", result.message)
+        else:
+            self.result_var.set(f"{format_num(result.root)} (Max iterations reached)")
+    
+    def show_error(self, error):
+        """Reports an exception raised by the solver."""
+        self.finish()
+        if isinstance(error, ValueError):
+            messagebox.showerror("Input Error", f"Invalid input: {str(error)}")
+        else:
+            messagebox.showerror("Error", f"An error occurred: {str(error)}")
+    
+    def show_cancelled(self):
+        """Marks a run stopped with the Cancel button."""
+        self.finish()
+        self.result_var.set("Calculation cancelled")
+    
+    def export_trace(self):
+        """Saves the iterations of the last run as CSV."""
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if path:
+            self.trace.to_csv(path)
+    
+    def finish(self):
+        """Re-enables the inputs after a run."""
+        self.calc_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
 
-def run():
-    root = tk.Toplevel()
+def build(root):
     app = NewtonMethodCalculator(root)
     
     # Set minimum window size
@@ -207,7 +272,10 @@ def run():
     center_x = int(screen_width/2 - window_width/2)
     center_y = int(screen_height/2 - window_height/2)
     root.geometry(f'{window_width}x{window_height}+{center_x}+{center_y}')
-    
-    root.mainloop()
+    return app
+
+def run():
+    windows.show(__name__, build)
+
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""The Find All Roots run shared by the bracketing calculator windows.
+
+The window keeps its own inputs and result widgets; RootScan reads the
+first and fills the second, so the bisection, false position and Brent
+windows scan and display the same way:
+
+    self.scan = RootScan(self, 'bisection')
+    ...
+    self.btn_scan = tk.Button(button_frame, text="Find All Roots", command=self.scan.start)
+
+The window needs function_entry, xl_entry, xu_entry, eps_entry and
+max_iter_entry, the result_box and calc_box logs, root_result_label,
+evaluations_label, btn_export, btn_calculate, btn_scan, btn_cancel and
+progress, plus compile_function(source), finish(), show_error(error) and
+show_cancelled().
+"""
+import tkinter as tk
+from tkinter import messagebox
+
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+
+
+class RootScan:
+    """Scans [xl, xu] of a window for sign changes on a worker thread and shows each root."""
+
+    def __init__(self, window, method):
+        self.window = window
+        self.method = method
+        self.worker = SolverWorker(window.root, self.show_root, self.show_result,
+                                   window.show_error, window.show_cancelled)
+
+    def start(self, **options):
+        """Finds every root in [xl, xu] by scanning for sign changes, then refining each bracket.
+
+        Extra options go to the refinement method, e.g. variant= for false position.
+        """
+        # core.scan needs NumPy and may start a process pool, so it is loaded on the first scan
+        from numericalAnalysisCalculator.core.scan import find_all_roots
+        w = self.window
+        source = w.function_entry.get()
+        if w.compile_function(source) is None:
+            return
+        try:
+            xl = float(w.xl_entry.get())
+            xu = float(w.xu_entry.get())
+            eps = float(w.eps_entry.get())
+            max_iter = int(w.max_iter_entry.get())
+        except ValueError as ve:
+            messagebox.showerror("Error", f"Invalid input: {ve}")
+            return
+
+        w.result_box.clear()
+        w.calc_box.clear()
+        w.root_result_label.config(text="")
+        w.evaluations_label.config(text="")
+        w.btn_export.config(state=tk.DISABLED)
+        w.progress.config(value=0)
+
+        # workers=None lets find_all_roots refine in a process pool once there are enough
+        # brackets to pay for it; results arrive through show_root in completion order
+        if self.worker.start(find_all_roots, source, xl, xu, method=self.method, eps=eps,
+                             max_iter=max_iter, workers=None, **options):
+            w.btn_calculate.config(state=tk.DISABLED)
+            w.btn_scan.config(state=tk.DISABLED)
+            w.btn_cancel.config(state=tk.NORMAL)
+
+    def cancel(self):
+        self.worker.cancel()
+
+    def show_root(self, result):
+        """Displays the refinement of one sign-change bracket."""
+        if result.converged:
+            self.window.result_box.append(f"Root x = {result.root:.8f} ({result.n_iter} iterations)\n")
+        else:
+            self.window.result_box.append(f"Bracket rejected: {result.message}\n")
+
+    def show_result(self, scan):
+        """Lists all roots found by the scan."""
+        w = self.window
+        w.finish()
+        w.evaluations_label.config(text=f"{len(scan.brackets)} brackets from {scan.n} subintervals")
+        if scan.roots:
+            roots = ", ".join(f"{root:.8f}" for root in scan.roots)
+            w.root_result_label.config(text=f"{len(scan.roots)} roots found: {roots}", fg="#388E3C")
+        else:
+            w.root_result_label.config(text="No sign change found in [xl, xu]", fg="#FF5722")
@@ -1,6 +1,11 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import math
+from tkinter import ttk, messagebox, filedialog
+from numericalAnalysisCalculator.core.expression import compile_function, ExpressionError
+from numericalAnalysisCalculator.core.profiling import instrument
+from numericalAnalysisCalculator.core.rootfinding import secant
+from numericalAnalysisCalculator.calculators.logview import LogView
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
 
 class SecantCalculator:
     def __init__(self, root):
@@ -8,6 +13,7 @@ class SecantCalculator:
         self.root.title("Secant Method Calculator")
         self.root.geometry("800x700")
         self.root.resizable(False, False)
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
         self.setup_ui()
         
     def setup_ui(self):
@@ -41,10 +47,22 @@ class SecantCalculator:
         self.max_iter_entry = tk.Entry(input_frame, font=('Arial', 10))
         self.max_iter_entry.grid(row=4, column=1, sticky='w', padx=5, pady=5)
         
-        # Calculate button
-        btn_calculate = tk.Button(main_frame, text="Calculate", command=self.start_secant, 
+        # Calculate and Cancel buttons
+        button_frame = tk.Frame(main_frame, bg="#f0f2f5")
+        button_frame.pack(pady=10)
+        self.btn_calculate = tk.Button(button_frame, text="Calculate", command=self.start_secant, 
                                  bg="#4CAF50", fg="white", font=('Arial', 10, 'bold'))
-        btn_calculate.pack(pady=10)
+        self.btn_calculate.pack(side=tk.LEFT, padx=5)
+        self.btn_cancel = tk.Button(button_frame, text="Cancel", command=self.worker.cancel, 
+                                   bg="#F44336", fg="white", font=('Arial', 10, 'bold'), state=tk.DISABLED)
+        self.btn_cancel.pack(side=tk.LEFT, padx=5)
+        self.btn_export = tk.Button(button_frame, text="Export CSV", command=self.export_trace, 
+                                   bg="#2196F3", fg="white", font=('Arial', 10), state=tk.DISABLED)
+        self.btn_export.pack(side=tk.LEFT, padx=5)
+        
+        # Progress through max iterations
+        self.progress = ttk.Progressbar(main_frame, mode='determinate', length=400)
+        self.progress.pack(pady=(0, 10))
         
         # Create notebook for tabs
         self.notebook = ttk.Notebook(main_frame)
@@ -54,8 +72,7 @@ class SecantCalculator:
         results_tab = tk.Frame(self.notebook, bg="#f0f2f5")
         self.notebook.add(results_tab, text="Results")
         
-        self.result_box = scrolledtext.ScrolledText(results_tab, width=90, height=15, 
-                                                   wrap=tk.WORD, font=('Arial', 10), bg="white")
+        self.result_box = LogView(results_tab, width=90, height=15, font=('Arial', 10), bg="white")
         self.result_box.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Root display
@@ -63,12 +80,15 @@ class SecantCalculator:
                                          font=('Arial', 12, 'bold'), fg="#388E3C")
         self.root_result_label.pack(pady=5)
         
+        # Cost of the last run: evaluations of f and time spent inside it
+        self.evaluations_label = tk.Label(results_tab, text="", bg="#f0f2f5", font=('Arial', 9), fg="#555555")
+        self.evaluations_label.pack()
+        
         # Calculations tab
         calculations_tab = tk.Frame(self.notebook, bg="#f0f2f5")
         self.notebook.add(calculations_tab, text="Calculations")
         
-        self.calc_box = scrolledtext.ScrolledText(calculations_tab, width=90, height=15, 
-                                                wrap=tk.WORD, font=('Arial', 10), bg="white")
+        self.calc_box = LogView(calculations_tab, width=90, height=15, font=('Arial', 10), bg="white")
         self.calc_box.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Example function button
@@ -88,67 +108,81 @@ class SecantCalculator:
         self.max_iter_entry.delete(0, tk.END)
         self.max_iter_entry.insert(0, "50")
     
-    def evaluate_function(self, func_str, x_val):
-        """Evaluates the user-defined function at a given x value."""
-        x = x_val
+    def compile_function(self, func_str):
+        """Parses and compiles the user-defined function once."""
         try:
-            return eval(func_str, {'x': x, 'math': math, 'exp': math.exp, 'log': math.log, 
-                                 'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
-                                 'sqrt': math.sqrt})
-        except Exception as e:
-            messagebox.showerror("Error", f"Invalid function: {e}")
+            return compile_function(func_str)
+        except ExpressionError as e:
+            messagebox.showerror("Error", str(e))
             return None
     
-    def secant_method(self, func_str, xi_minus1, xi, eps, max_iter):
+    def secant_method(self, f, xi_minus1, xi, eps, max_iter):
         """Performs the secant method to find the root of the function."""
-        self.result_box.delete(1.0, tk.END)
-        self.calc_box.delete(1.0, tk.END)
+        self.result_box.clear()
+        self.calc_box.clear()
         self.root_result_label.config(text="")
-        
-        f_xi_minus1 = self.evaluate_function(func_str, xi_minus1)
-        f_xi = self.evaluate_function(func_str, xi)
-        
-        if f_xi_minus1 is None or f_xi is None:
-            return None
-        
-        # Display initial points
-        self.display_iteration(0, xi_minus1, xi, f_xi_minus1, f_xi, float('inf'))
-        self.display_calculations(0, xi_minus1, xi, f_xi_minus1, f_xi, None, None,float('inf'))
-        
-        for iter_count in range(1, max_iter + 1):
-            # Check for division by zero
-            if abs(f_xi_minus1 - f_xi) < 1e-20:
-                messagebox.showerror("Error", "Division by zero detected in Secant Method.")
-                return None
-            
-            # Secant formula
-            xi_plus1 = xi - (f_xi * (xi_minus1 - xi)) / (f_xi_minus1 - f_xi)
-            f_xi_plus1 = self.evaluate_function(func_str, xi_plus1)
-            
-            if f_xi_plus1 is None:
-                return None
-            
-            # Calculate error
-            error = abs((xi_plus1 - xi) / xi_plus1) * 100 if xi_plus1 != 0 else float('inf')
-            
+        self.evaluations_label.config(text="")
+        self.btn_export.config(state=tk.DISABLED)
+        self.max_iter = max_iter
+        self.progress.config(value=0, maximum=max_iter)
+        
+        # Solve on a worker thread; records arrive through show_step
+        self.f = instrument(f)
+        if self.worker.start(secant, self.f, xi_minus1, xi, eps, max_iter, trace=True):
+            self.btn_calculate.config(state=tk.DISABLED)
+            self.btn_cancel.config(state=tk.NORMAL)
+    
+    def show_step(self, step):
+        """Displays one iteration record streamed from the solver."""
+        if step.iteration == 0:
+            # Display initial points
+            self.display_iteration(0, step.xi_minus1, step.xi, step.f_xi_minus1, step.f_xi, step.error)
+        else:
             # Display iteration results
-            self.display_iteration(iter_count, xi, xi_plus1, f_xi, f_xi_plus1, error)
-            
-            # Show calculations for this step
-            self.display_calculations(iter_count, xi_minus1, xi, f_xi_minus1, f_xi, xi_plus1, f_xi_plus1, error)
-            
-            # Check stopping criteria
-            if error <= eps:
-                self.root_result_label.config(text=f"Root found: {xi_plus1:.8f} (after {iter_count} iterations)", fg="#388E3C")
-                return xi_plus1
-            
-            # Update points for next iteration
-            xi_minus1, f_xi_minus1 = xi, f_xi
-            xi, f_xi = xi_plus1, f_xi_plus1
+            self.display_iteration(step.iteration, step.xi, step.xi_plus1, step.f_xi, step.f_xi_plus1, step.error)
         
-        messagebox.showwarning("Warning", f"Maximum iterations ({max_iter}) reached without convergence.")
-        self.root_result_label.config(text=f"Approximate root: {xi:.8f} (max iterations reached)", fg="#FF5722")
-        return xi
+        # Show calculations for this step
+        self.display_calculations(step.iteration, step.xi_minus1, step.xi, step.f_xi_minus1, step.f_xi, step.xi_plus1, step.f_xi_plus1, step.error)
+        self.progress.config(value=step.iteration)
+    
+    def show_result(self, result):
+        """Shows the root once the solver has finished."""
+        self.finish()
+        self.trace = result.trace
+        self.btn_export.config(state=tk.NORMAL)
+        self.evaluations_label.config(text=self.f.summary())
+        if result.converged:
+            self.root_result_label.config(text=f"Root found: {result.root:.8f} (after {result.n_iter} iterations)", fg="#388E3C")
+        elif result.n_iter < self.max_iter:
+            # Stopped before max_iter: the secant denominator vanished
+            messagebox.showerror("Error", result.message)
+        else:
+            messagebox.showwarning("Warning", result.message)
+            self.root_result_label.config(text=f"Approximate root: {result.root:.8f} (max iterations reached)", fg="#FF5722")
+    
+    def show_error(self, error):
+        """Reports an exception raised by the solver."""
+        self.finish()
+        if isinstance(error, ValueError):
+            messagebox.showerror("Error", f"Invalid input: {error}")
+        else:
+            messagebox.showerror("Error", f"An error occurred: {error}")
+    
+    def show_cancelled(self):
+        """Marks a run stopped with the Cancel button."""
+        self.finish()
+        self.root_result_label.config(text="Calculation cancelled", fg="#FF5722")
+    
+    def export_trace(self):
+        """Saves the iterations of the last run as CSV."""
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
+        if path:
+            self.trace.to_csv(path)
+    
+    def finish(self):
+        """Re-enables the inputs after a run."""
+        self.btn_calculate.config(state=tk.NORMAL)
+        self.btn_cancel.config(state=tk.DISABLED)
     
     def display_iteration(self, iter_count, xi_minus1, xi, f_xi_minus1, f_xi, error):
         """Displays the iteration results in the results tab."""
@@ -161,8 +195,7 @@ class SecantCalculator:
                       f"xi = {xi:.8f}, f(xi) = {f_xi:.8f}\n"
                       f"Error = -\n\n")
         
-        self.result_box.insert(tk.END, result_text)
-        self.result_box.see(tk.END)
+        self.result_box.append(result_text)
     
     def display_calculations(self, iter_count, xi_minus1, xi, f_xi_minus1, f_xi, xi_plus1, f_xi_plus1, error):
         """Shows the detailed calculations for each step in the calculations tab."""
@@ -180,34 +213,20 @@ class SecantCalculator:
                         f"5. Evaluate error = abs(xi_plus1 - xi) / xi_plus1) * 100 = abs(({xi_plus1:.8f}-{xi:.8f})/{xi_plus1:.8f})*100 = {error:.8f}%\n\n")
                         
         
-        self.calc_box.insert(tk.END, calc_text)
-        self.calc_box.see(tk.END)
+        self.calc_box.append(calc_text)
     
     def start_secant(self):
         """Starts the secant method calculation with user inputs."""
-        func_str = self.function_entry.get()
+        f = self.compile_function(self.function_entry.get())
+        if f is None:
+            return
         try:
             xi_minus1 = float(self.xi_minus1_entry.get())
             xi = float(self.xi_entry.get())
             eps = float(self.eps_entry.get())
             max_iter = int(self.max_iter_entry.get())
             
-            if max_iter <= 0:
-                messagebox.showerror("Error", "Maximum iterations must be a positive integer.")
-                return
-            
-            if xi_minus1 == xi:
-                messagebox.showerror("Error", "Initial guesses must be different.")
-                return
-            
-            # Check initial points
-            f_xi_minus1 = self.evaluate_function(func_str, xi_minus1)
-            f_xi = self.evaluate_function(func_str, xi)
-            
-            if f_xi_minus1 is None or f_xi is None:
-                return
-            
-            self.secant_method(func_str, xi_minus1, xi, eps, max_iter)
+            self.secant_method(f, xi_minus1, xi, eps, max_iter)
             
         except ValueError as ve:
             messagebox.showerror("Error", f"Invalid input: {ve}")
@@ -215,9 +234,7 @@ class SecantCalculator:
             messagebox.showerror("Error", f"An error occurred: {e}")
 
 def run():
-    root = tk.Toplevel()
-    app = SecantCalculator(root)
-    root.mainloop()
+    windows.show(__name__, SecantCalculator)
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
@@ -0,0 +1,169 @@
+import numpy as np
+import tkinter as tk
+from tkinter import ttk, messagebox
+from numericalAnalysisCalculator.core.expression import ExpressionError
+from numericalAnalysisCalculator.core.systems import compile_system, newton_system
+from numericalAnalysisCalculator.calculators.logview import LogView
+from numericalAnalysisCalculator.calculators.worker import SolverWorker
+from numericalAnalysisCalculator.calculators import windows
+
+# Method names shown in the window -> newton_system(method=...)
+METHODS = {
+    "Newton (finite-difference Jacobian)": 'newton',
+    "Broyden (rank-one Jacobian updates)": 'broyden',
+}
+
+# Unknowns printed per iteration; longer vectors are abbreviated
+MAX_SHOWN = 8
+
+
+def format_vector(x):
+    """x as '[a, b, ...]', abbreviated for large systems."""
+    return np.array2string(np.asarray(x), precision=8, separator=', ', threshold=MAX_SHOWN, edgeitems=3)
+
+
+class NonlinearSystemSolver:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Nonlinear Systems Solver")
+        self.root.geometry("800x700")
+
+        self.method = tk.StringVar(value=next(iter(METHODS)))
+
+        self.worker = SolverWorker(self.root, self.show_step, self.show_result, self.show_error, self.show_cancelled)
+        self.setup_ui()
+        self.load_example()
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self.root, padding=10)
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Equations F(x) = 0, one per line
+        equations_frame = ttk.LabelFrame(main_frame, text="Equations F(x) = 0 (one per line)")
+        equations_frame.pack(fill=tk.X, pady=5)
+        self.equations_text = tk.Text(equations_frame, height=6, font=('Consolas', 10))
+        self.equations_text.pack(fill=tk.X, padx=5, pady=5)
+
+        params_frame = ttk.LabelFrame(main_frame, text="Parameters", padding=10)
+        params_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Label(params_frame, text="Variables:").grid(row=0, column=0, sticky=tk.W)
+        self.variables_entry = ttk.Entry(params_frame, width=30)
+        self.variables_entry.grid(row=0, column=1, sticky=tk.W, padx=(5,15))
+
+        ttk.Label(params_frame, text="Initial guess:").grid(row=0, column=2, sticky=tk.W)
+        self.x0_entry = ttk.Entry(params_frame, width=30)
+        self.x0_entry.grid(row=0, column=3, sticky=tk.W, padx=(5,0))
+
+        ttk.Label(params_frame, text="Tolerance (%):").grid(row=1, column=0, sticky=tk.W, pady=(8,0))
+        self.tol_entry = ttk.Entry(params_frame, width=15)
+        self.tol_entry.grid(row=1, column=1, sticky=tk.W, padx=(5,15), pady=(8,0))
+        self.tol_entry.insert(0, "1e-8")
+
+        ttk.Label(params_frame, text="Max iterations:").grid(row=1, column=2, sticky=tk.W, pady=(8,0))
+        self.max_iter_entry = ttk.Entry(params_frame, width=15)
+        self.max_iter_entry.grid(row=1, column=3, sticky=tk.W, padx=(5,0), pady=(8,0))
+        self.max_iter_entry.insert(0, "50")
+
+        ttk.Label(params_frame, text="Method:").grid(row=2, column=0, sticky=tk.W, pady=(8,0))
+        ttk.Combobox(params_frame, textvariable=self.method, values=list(METHODS), state='readonly',
+                     width=36).grid(row=2, column=1, columnspan=3, sticky=tk.W, padx=(5,0), pady=(8,0))
+
+        btn_frame = ttk.Frame(main_frame)
+        btn_frame.pack(fill=tk.X, pady=5)
+        self.solve_button = ttk.Button(btn_frame, text="Solve", command=self.solve)
+        self.solve_button.pack(side=tk.LEFT)
+        self.cancel_button = ttk.Button(btn_frame, text="Cancel", command=self.worker.cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Button(btn_frame, text="Example", command=self.load_example).pack(side=tk.LEFT, padx=5)
+        self.progress = ttk.Progressbar(btn_frame, mode='determinate', length=200)
+        self.progress.pack(side=tk.RIGHT)
+
+        self.solution_text = LogView(main_frame, height=18, font=('Consolas', 10))
+        self.solution_text.pack(fill=tk.BOTH, expand=True)
+
+        self.result_var = tk.StringVar()
+        ttk.Label(main_frame, textvariable=self.result_var, font=('Arial', 10, 'bold')).pack(anchor=tk.W, pady=(5,0))
+
+    def load_example(self):
+        """Circle x^2 + y^2 = 4 intersected with y = 1 - e^x"""
+        self.equations_text.delete("1.0", tk.END)
+        self.equations_text.insert("1.0", "x**2 + y**2 - 4\nexp(x) + y - 1")
+        self.variables_entry.delete(0, tk.END)
+        self.variables_entry.insert(0, "x, y")
+        self.x0_entry.delete(0, tk.END)
+        self.x0_entry.insert(0, "1, -1")
+
+    def solve(self):
+        self.solution_text.clear()
+        self.result_var.set("")
+        try:
+            equations = [line.strip() for line in self.equations_text.get("1.0", tk.END).splitlines() if line.strip()]
+            variables = [v.strip() for v in self.variables_entry.get().split(',') if v.strip()]
+            x0 = [float(v) for v in self.x0_entry.get().split(',') if v.strip()]
+            tol = float(self.tol_entry.get())
+            max_iter = int(self.max_iter_entry.get())
+            if len(equations) != len(variables):
+                raise ValueError(f"{len(equations)} equations for {len(variables)} unknowns")
+            if len(x0) != len(variables):
+                raise ValueError("The initial guess needs one value per variable")
+            F = compile_system(equations, variables)
+        except ExpressionError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        except ValueError as ve:
+            messagebox.showerror("Input Error", f"Invalid input: {ve}")
+            return
+
+        self.variables = variables
+        self.max_iter = max_iter
+        self.progress.config(value=0, maximum=max_iter)
+
+        # Solve on a worker thread; iterations arrive through show_step
+        if self.worker.start(newton_system, F, x0, None, tol, max_iter, METHODS[self.method.get()]):
+            self.solve_button.config(state=tk.DISABLED)
+            self.cancel_button.config(state=tk.NORMAL)
+
+    def show_step(self, step):
+        """Prints one streamed iteration"""
+        if step.iteration == 0:
+            self.solution_text.append(f"Start: x = {format_vector(step.x)}\n"
+                                      f"       max|F(x)| = {step.residual:.6e}\n\n")
+        else:
+            self.solution_text.append(f"Iteration {step.iteration} ({step.jacobian} Jacobian):\n"
+                                      f"  x = {format_vector(step.x)}\n"
+                                      f"  max|F(x)| = {step.residual:.6e}, max|dx| = {step.step:.6e}, "
+                                      f"error = {step.error:.8f}%\n\n")
+        self.progress.config(value=step.iteration)
+
+    def show_result(self, result):
+        """Prints the solution once the solver has finished"""
+        self.finish()
+        if not result.converged:
+            messagebox.showwarning("Warning", result.message)
+
+        self.solution_text.append("=== SOLUTION ===\n")
+        for name, value in zip(self.variables, result.x):
+            self.solution_text.append(f"{name} = {value:.10f}\n")
+        status = "Converged" if result.converged else "Not converged"
+        self.result_var.set(f"{status} after {result.n_iter} iterations: {result.evaluations} evaluations of F, "
+                            f"{result.jacobians} Jacobians formed")
+
+    def show_error(self, error):
+        self.finish()
+        messagebox.showerror("Error", str(error))
+
+    def show_cancelled(self):
+        self.finish()
+        self.solution_text.append("\nCalculation cancelled\n")
+
+    def finish(self):
+        """Re-enables Solve after a run"""
+        self.solve_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+
+def run():
+    windows.show(__name__, NonlinearSystemSolver)
+
+if __name__ == "__main__":
+    run()
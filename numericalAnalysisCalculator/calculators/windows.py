@@ -0,0 +1,54 @@
+"""The one Tk root and the pool of calculator windows shown from it.
+
+Each calculator's run() is
+
+    def run():
+        windows.show(__name__, BisectionCalculator)
+
+show() builds the window the first time only. Closing it hides it, and the
+next show() brings back the same window with its inputs and results, so
+reopening a calculator builds no widgets. A solve still running when the
+window is closed carries on, and its result is there when it is reopened.
+
+The launcher creates the root with get_root() and runs the only mainloop.
+A calculator started on its own (python -m ...calculators.newton) has no
+launcher: show() then hides the root, runs the loop itself and ends it when
+the window is closed.
+"""
+import tkinter as tk
+
+_root = None
+
+# Calculator windows by key (the module name), built on first use
+_windows = {}
+
+
+def get_root():
+    """The application's Tk root, created on the first call."""
+    global _root
+    if _root is None:
+        _root = tk.Tk()
+    return _root
+
+
+def show(key, build):
+    """Shows the window for key, building it with build(toplevel) the first time."""
+    window = _windows.get(key)
+    if window is not None and window.winfo_exists():
+        window.deiconify()
+        window.lift()
+        window.focus_set()
+        return window
+
+    standalone = _root is None
+    root = get_root()
+    if standalone:
+        root.withdraw()
+    window = tk.Toplevel(root)
+    build(window)
+    # Hide instead of destroy, so the next show() only has to map it again
+    window.protocol("WM_DELETE_WINDOW", root.destroy if standalone else window.withdraw)
+    _windows[key] = window
+    if standalone:
+        root.mainloop()
+    return window
@@ -0,0 +1,98 @@
+"""Runs core solvers on a background thread so the calculator windows stay responsive.
+
+The solver reports each iteration record through its callback; the worker
+puts them on a queue, and the Tk side drains that queue from root.after a
+slice at a time, so the window keeps repainting however long the solve runs.
+
+    self.worker = SolverWorker(self.root, on_step=self.show_step,
+                               on_done=self.show_result, on_error=self.show_error)
+    self.worker.start(bisection, f, xl, xu, eps, max_iter)
+    ...
+    self.worker.cancel()
+"""
+import queue
+import threading
+import time
+
+from numericalAnalysisCalculator.core.progress import SolveCancelled
+
+# Poll interval (about 60 frames per second) and the share of each frame spent rendering
+POLL_MS = 16
+FRAME_BUDGET = 0.010
+
+
+class SolverWorker:
+    """Background thread plus the queue and after() loop that feed its records to Tk."""
+
+    def __init__(self, root, on_step, on_done, on_error, on_cancel=None):
+        self.root = root
+        self.on_step = on_step
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self._cancel = threading.Event()
+        self._thread = None
+        # True from start() until the drain loop has handed on the run's last message;
+        # the thread may outlive that by a moment, but it has nothing left to report
+        self._draining = False
+
+    @property
+    def running(self):
+        return self._draining
+
+    def start(self, solver, *args, **kwargs):
+        """Runs solver(*args, record=False, callback=..., **kwargs) on a new thread."""
+        if self.running:
+            return False
+        self._cancel.clear()
+        # Each run has its own queue and drain loop, so no loop reads another run's records
+        out = queue.Queue()
+        self._draining = True
+        self._thread = threading.Thread(target=self._run, args=(solver, args, kwargs, out), daemon=True)
+        self._thread.start()
+        self.root.after(POLL_MS, self._drain, out)
+        return True
+
+    def cancel(self):
+        """Asks the running solver to stop at its next iteration."""
+        self._cancel.set()
+
+    def _run(self, solver, args, kwargs, out):
+        def report(step):
+            if self._cancel.is_set():
+                raise SolveCancelled()
+            out.put(('step', step))
+
+        try:
+            result = solver(*args, record=False, callback=report, **kwargs)
+        except SolveCancelled:
+            out.put(('cancelled', None))
+        except Exception as e:
+            out.put(('error', e))
+        else:
+            out.put(('done', result))
+
+    def _drain(self, out):
+        """Hands records from out to the window for at most one frame budget, then yields."""
+        deadline = time.perf_counter() + FRAME_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                kind, payload = out.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'step':
+                self.on_step(payload)
+                continue
+            # The last message of the run: the loop ends, and start() may run again
+            self._draining = False
+            if kind == 'done':
+                self.on_done(payload)
+                return
+            elif kind == 'error':
+                self.on_error(payload)
+                return
+            else:
+                if self.on_cancel is not None:
+                    self.on_cancel()
+                return
+        self.root.after(POLL_MS, self._drain, out)
@@ -0,0 +1,14 @@
+"""Headless numerical building blocks shared by the calculators.
+
+The matrix solvers live in core.linear and are not imported here, so the
+scalar methods can be used without NumPy.
+"""
+from numericalAnalysisCalculator.core.expression import Expression, ExpressionError, compile_function
+from numericalAnalysisCalculator.core.autodiff import compile_with_derivative
+from numericalAnalysisCalculator.core.polynomial import polynomial_coefficients, real_roots
+from numericalAnalysisCalculator.core.rootfinding import (
+    RootResult, bisection, brent, false_position, newton, safeguarded_newton, secant,
+)
+from numericalAnalysisCalculator.core.optimize import OptimumResult, brent_optimum, golden_section
+from numericalAnalysisCalculator.core.batch import solve_batch
+from numericalAnalysisCalculator.core.profiling import instrument, profile
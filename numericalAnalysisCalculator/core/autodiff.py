@@ -0,0 +1,219 @@
+"""Forward-mode automatic differentiation of user expressions.
+
+The validated expression AST is turned into straight-line code that carries a
+value and a derivative for every node, e.g. for "x*sin(x)":
+
+    def fdf(x):
+        _v1 = sin(x)
+        _d1 = (math.cos(x))
+        _v2 = x * _v1
+        _d2 = _v1 + x * _d1
+        return _v2, _d2
+
+so f(x) and f'(x) come out of a single call, each subexpression is computed
+once, and no dual-number objects are allocated. Derivative code calls through
+the 'math' name, so it works with both MATH_NAMESPACE and numpy_namespace().
+"""
+import ast
+
+from numericalAnalysisCalculator.core.expression import MATH_NAMESPACE, ExpressionError, parse_expression
+from numericalAnalysisCalculator.core.polynomial import (
+    compile_polynomial_with_derivative, tree_coefficients, worth_horner,
+)
+
+# d/du f(u) for one-argument functions, written in terms of u and the value v = f(u)
+_DERIVATIVES = {
+    'sin': 'math.cos({u})',
+    'cos': '-math.sin({u})',
+    'tan': '1.0 / math.cos({u})**2',
+    'exp': '{v}',
+    'log': '1.0 / {u}',
+    'log10': '1.0 / ({u} * math.log(10.0))',
+    'log2': '1.0 / ({u} * math.log(2.0))',
+    'sqrt': '0.5 / {v}',
+    'asin': '1.0 / math.sqrt(1.0 - {u}**2)',
+    'acos': '-1.0 / math.sqrt(1.0 - {u}**2)',
+    'atan': '1.0 / (1.0 + {u}**2)',
+    'sinh': 'math.cosh({u})',
+    'cosh': 'math.sinh({u})',
+    'tanh': '1.0 - {v}**2',
+    'abs': 'math.copysign(1.0, {u})',
+    'fabs': 'math.copysign(1.0, {u})',
+}
+
+
+def _times(a, b):
+    """Source for a * b, dropping a factor of exactly 1.0 (d/dx of x)."""
+    if a == '1.0':
+        return b
+    if b == '1.0':
+        return a
+    return f"{a} * {b}"
+
+
+def _is_zero(source):
+    """True when source is a number literal equal to zero, such as the exponent of x**0."""
+    try:
+        return float(source) == 0
+    except ValueError:
+        return False
+
+
+class _ForwardMode:
+    """Emits value/derivative assignments for each AST node."""
+
+    def __init__(self, wrt):
+        self.wrt = wrt
+        self.lines = []
+        self.count = 0
+
+    def emit(self, value, deriv):
+        """Binds value (and a non-zero derivative) to fresh temporaries."""
+        self.count += 1
+        v = f"_v{self.count}"
+        self.lines.append(f"{v} = {value}")
+        if deriv is None:
+            return v, None
+        d = f"_d{self.count}"
+        self.lines.append(f"{d} = {deriv}")
+        return v, d
+
+    def visit(self, node):
+        """Returns (value, derivative) source snippets; derivative None means zero."""
+        if isinstance(node, ast.Constant):
+            return repr(node.value), None
+        if isinstance(node, ast.Name):
+            return node.id, ('1.0' if node.id == self.wrt else None)
+        if isinstance(node, ast.Attribute):
+            return ast.unparse(node), None
+        if isinstance(node, ast.UnaryOp):
+            a, da = self.visit(node.operand)
+            if isinstance(node.op, ast.USub):
+                return self.emit(f"-{a}", None if da is None else f"-{da}")
+            return a, da
+        if isinstance(node, ast.BinOp):
+            return self.binop(node)
+        if isinstance(node, ast.Call):
+            return self.call(node)
+        raise ExpressionError(f"Cannot differentiate '{type(node).__name__}'")
+
+    def binop(self, node):
+        a, da = self.visit(node.left)
+        b, db = self.visit(node.right)
+        op = node.op
+        if isinstance(op, (ast.Add, ast.Sub)):
+            sign = '+' if isinstance(op, ast.Add) else '-'
+            if da is None and db is None:
+                deriv = None
+            elif db is None:
+                deriv = da
+            elif da is None:
+                deriv = db if sign == '+' else f"-{db}"
+            else:
+                deriv = f"{da} {sign} {db}"
+            return self.emit(f"{a} {sign} {b}", deriv)
+        if isinstance(op, ast.Mult):
+            terms = [t for t in (da and _times(da, b), db and _times(a, db)) if t]
+            return self.emit(f"{a} * {b}", " + ".join(terms) or None)
+        if isinstance(op, ast.Div):
+            if db is None:
+                return self.emit(f"{a} / {b}", da and f"{da} / {b}")
+            self.count += 1
+            v = f"_v{self.count}"
+            self.lines.append(f"{v} = {a} / {b}")
+            d = f"_d{self.count}"
+            numerator = f"-{v} * {db}" if da is None else f"{da} - {v} * {db}"
+            self.lines.append(f"{d} = ({numerator}) / {b}")
+            return v, d
+        if isinstance(op, ast.Pow):
+            return self.power(a, da, b, db)
+        if isinstance(op, ast.Mod):
+            if db is not None:
+                raise ExpressionError("Cannot differentiate '%' with a variable divisor")
+            return self.emit(f"{a} % {b}", da)
+        if isinstance(op, ast.FloorDiv):
+            return self.emit(f"{a} // {b}", None)
+        raise ExpressionError(f"Cannot differentiate '{type(op).__name__}'")
+
+    def power(self, a, da, b, db):
+        if da is None and db is None or db is None and _is_zero(b):
+            # d/dx u**0 is 0 everywhere; the power rule would give 0 * u ** -1, which fails at u = 0
+            return self.emit(f"{a} ** {b}", None)
+        if db is None:
+            return self.emit(f"{a} ** {b}", _times(f"{b} * {a} ** ({b} - 1)", da))
+        self.count += 1
+        v = f"_v{self.count}"
+        d = f"_d{self.count}"
+        self.lines.append(f"{v} = {a} ** {b}")
+        if da is None:
+            self.lines.append(f"{d} = {v} * math.log({a}) * {db}")
+        else:
+            self.lines.append(f"{d} = {v} * ({db} * math.log({a}) + {b} * {da} / {a})")
+        return v, d
+
+    def call(self, node):
+        name = node.func.attr if isinstance(node.func, ast.Attribute) else node.func.id
+        func = ast.unparse(node.func)
+        args = [self.visit(arg) for arg in node.args]
+        call = f"{func}({', '.join(a for a, _ in args)})"
+        if all(d is None for _, d in args):
+            return self.emit(call, None)
+
+        if name == 'pow' and len(args) == 2:
+            (a, da), (b, db) = args
+            return self.power(a, da, b, db)
+        if name == 'log' and len(args) == 2:
+            (u, du), (base, dbase) = args
+            if dbase is not None:
+                raise ExpressionError("Cannot differentiate log() with a variable base")
+            return self.emit(call, f"{du} / ({u} * math.log({base}))")
+        if name not in _DERIVATIVES or len(args) != 1:
+            raise ExpressionError(f"Cannot differentiate '{name}'")
+
+        (u, du), = args
+        self.count += 1
+        v = f"_v{self.count}"
+        d = f"_d{self.count}"
+        self.lines.append(f"{v} = {call}")
+        self.lines.append(f"{d} = {_times('(' + _DERIVATIVES[name].format(u=u, v=v) + ')', du)}")
+        return v, d
+
+
+def derivative_source(tree, variables=('x',), wrt=None, name='fdf'):
+    """Source of a function returning (f, df/dwrt) for a validated expression tree."""
+    wrt = wrt or variables[0]
+    mode = _ForwardMode(wrt)
+    value, deriv = mode.visit(tree.body)
+    body = mode.lines + [f"return {value}, {deriv if deriv is not None else '0.0 * ' + value}"]
+    return f"def {name}({', '.join(variables)}):\n" + "\n".join(f"    {line}" for line in body)
+
+
+def _horner_coefficients(tree, variables, wrt, namespace):
+    if len(variables) == 1 and wrt in (None, variables[0]):
+        coeffs = tree_coefficients(tree, variables[0], namespace, expanded_only=True)
+        if coeffs is not None and worth_horner(coeffs):
+            return coeffs
+    return None
+
+
+def horner_coefficients(source, variables=('x',), wrt=None, namespace=MATH_NAMESPACE):
+    """The coefficients compile_with_derivative evaluates by Horner's scheme, or None."""
+    tree = parse_expression(source, tuple(variables), namespace)
+    return _horner_coefficients(tree, tuple(variables), wrt, namespace)
+
+
+def compile_with_derivative(source, variables=('x',), wrt=None, namespace=MATH_NAMESPACE):
+    """Returns a callable giving (f(x), f'(x)) from one fused evaluation.
+
+    A polynomial in a single variable, written as a sum of c*x**k terms, gets
+    its exact derivative from the coefficients and both values from one
+    Horner pass (see horner_coefficients).
+    """
+    tree = parse_expression(source, tuple(variables), namespace)
+    coeffs = _horner_coefficients(tree, tuple(variables), wrt, namespace)
+    if coeffs is not None:
+        return compile_polynomial_with_derivative(coeffs, variables[0])
+    code = compile(derivative_source(tree, tuple(variables), wrt), f"<f, f': {source}>", 'exec')
+    scope = {'__builtins__': {}, **namespace}
+    exec(code, scope)
+    return scope['fdf']
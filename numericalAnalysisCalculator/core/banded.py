@@ -0,0 +1,146 @@
+"""Banded and tridiagonal systems without dense storage.
+
+A matrix with lower bandwidth l and upper bandwidth u is kept row by row in
+an n x (l + u + 1) array W, with A[i, j] at W[i, j - i + l]; the diagonal
+is column l. Elimination without row exchanges stays inside the band, so
+the factors overwrite W: O(n (l + u)) memory and O(n l u) work instead of
+O(n^2) and O(n^3).
+
+    lu = BandedLU.from_dense(A)       # or BandedLU(W, l, u)
+    x = lu.solve(b)
+    x = thomas(lower, diagonal, upper, d)   # tridiagonal, l = u = 1
+
+No pivoting is done, which is stable for diagonally dominant and for
+symmetric positive definite matrices; core.structured only sends those
+here and uses the sparse LU with pivoting for the rest.
+"""
+import numpy as np
+
+
+def _check_pivot(value, i):
+    if value == 0:
+        raise ValueError(f"Zero pivot in row {i+1}: the banded matrix needs pivoting")
+
+
+def bandwidth(A):
+    """(lower, upper) bandwidth of a dense matrix: the farthest nonzero below and above the diagonal."""
+    rows, cols = np.nonzero(np.asarray(A))
+    if rows.size == 0:
+        return 0, 0
+    offsets = cols - rows
+    return int(max(0, -offsets.min())), int(max(0, offsets.max()))
+
+
+def thomas(lower, diagonal, upper, d):
+    """Solves a tridiagonal system by the Thomas algorithm in O(n).
+
+    lower[i] is A[i+1, i] and upper[i] is A[i, i+1] (n - 1 entries each);
+    d may be a vector or an (n, k) matrix of right-hand sides.
+    """
+    n = len(diagonal)
+    d = np.asarray(d, dtype=float)
+    if d.shape[0] != n or len(lower) != n - 1 or len(upper) != n - 1:
+        raise ValueError("Tridiagonal system needs n diagonal entries, n - 1 off-diagonal entries and n rows in d")
+    a = [float(v) for v in lower]
+    b = [float(v) for v in diagonal]
+    c = [float(v) for v in upper]
+    rhs = list(d)
+
+    # Forward sweep: c'[i] = c[i] / (b[i] - a[i-1] c'[i-1])
+    cp = [0.0] * n
+    _check_pivot(b[0], 0)
+    if n > 1:
+        cp[0] = c[0] / b[0]
+    rhs[0] = rhs[0] / b[0]
+    for i in range(1, n):
+        denominator = b[i] - a[i - 1] * cp[i - 1]
+        _check_pivot(denominator, i)
+        if i < n - 1:
+            cp[i] = c[i] / denominator
+        rhs[i] = (rhs[i] - a[i - 1] * rhs[i - 1]) / denominator
+
+    # Back substitution
+    for i in range(n - 2, -1, -1):
+        rhs[i] = rhs[i] - cp[i] * rhs[i + 1]
+    return np.array(rhs)
+
+
+class BandedLU:
+    """A = LU of a banded matrix, stored in the band and reused for any number of right-hand sides."""
+
+    def __init__(self, W, lower, upper):
+        W = np.array(W, dtype=float)
+        if W.ndim != 2 or W.shape[1] != lower + upper + 1:
+            raise ValueError("Band storage must have lower + upper + 1 columns")
+        self.n = W.shape[0]
+        self.lower = lower
+        self.upper = upper
+        self.W = W
+        self._factor()
+
+    @classmethod
+    def from_dense(cls, A, lower=None, upper=None):
+        A = np.asarray(A, dtype=float)
+        if lower is None or upper is None:
+            lower, upper = bandwidth(A)
+        return cls(to_band(A, lower, upper), lower, upper)
+
+    @classmethod
+    def from_csr(cls, A, lower, upper):
+        n = A.shape[0]
+        W = np.zeros((n, lower + upper + 1))
+        rows = A.row_indices()
+        W[rows, A.indices - rows + lower] = A.data
+        return cls(W, lower, upper)
+
+    @property
+    def nbytes(self):
+        return self.W.nbytes
+
+    def _factor(self):
+        W, n, l, u = self.W, self.n, self.lower, self.upper
+        if l == 0:
+            for k in range(n):
+                _check_pivot(W[k, 0], k)
+            return
+        # Row t below the pivot row holds column k at W[k + t, l - t]; the
+        # entries it updates follow in the next u columns of W
+        t = np.arange(1, l + 1)
+        cols = (l - t)[:, None] + np.arange(u + 1)
+        for k in range(n - 1):
+            pivot = W[k, l]
+            _check_pivot(pivot, k)
+            r = min(l, n - 1 - k)
+            rows = k + t[:r, None]
+            block = W[rows, cols[:r]]
+            block[:, 0] /= pivot
+            block[:, 1:] -= np.outer(block[:, 0], W[k, l + 1:])
+            W[rows, cols[:r]] = block
+        _check_pivot(W[n - 1, l], n - 1)
+
+    def solve(self, b):
+        """Solves Ax = b for a vector or the columns of an (n, k) matrix b."""
+        W, n, l, u = self.W, self.n, self.lower, self.upper
+        x = np.array(b, dtype=float)
+        if x.shape[0] != n:
+            raise ValueError("Right-hand side must have one row per row of A")
+        # Ly = b, L unit lower with the multipliers left of the diagonal
+        for i in range(1, n):
+            lo = max(0, i - l)
+            x[i] -= W[i, l - (i - lo):l] @ x[lo:i]
+        # Ux = y
+        for i in range(n - 1, -1, -1):
+            hi = min(n, i + u + 1)
+            x[i] = (x[i] - W[i, l + 1:l + 1 + hi - i - 1] @ x[i + 1:hi]) / W[i, l]
+        return x
+
+
+def to_band(A, lower, upper):
+    """Band storage W of a dense matrix, A[i, j] at W[i, j - i + lower]."""
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    W = np.zeros((n, lower + upper + 1))
+    for offset in range(-lower, upper + 1):
+        i = np.arange(max(0, -offset), min(n, n - offset))
+        W[i, offset + lower] = A[i, i + offset]
+    return W
@@ -0,0 +1,82 @@
+"""Batch API: run one method over many problems without any GUI.
+
+    from numericalAnalysisCalculator.core import solve_batch
+    problems = [{'f': "x**2 - 2", 'xl': 0, 'xu': 10, 'eps': 1e-8}, ...]
+    for result in solve_batch('bisection', problems): ...
+
+Function strings are compiled once per distinct expression, and iteration
+records are skipped unless record=True. The methods are those of the
+registry with the BATCH capability. Problems for a DERIVATIVE method without
+a 'df' entry get their derivative by automatic differentiation, and system
+methods (newton_system) take F as a list of equation strings plus 'variables'.
+"""
+import inspect
+from functools import lru_cache
+
+from numericalAnalysisCalculator import registry
+from numericalAnalysisCalculator.core.autodiff import compile_with_derivative
+from numericalAnalysisCalculator.core.expression import compile_function
+
+# Problem keys that hold expressions to compile
+FUNCTION_KEYS = ('f', 'df')
+
+
+def get_solver(method):
+    """Returns the solver function of a batch-capable method in the registry; imported on first use."""
+    entry = registry.get(method)
+    if not entry.has(registry.BATCH):
+        raise ValueError(f"Method '{method}' cannot run in a batch; choose from "
+                         f"{', '.join(registry.names(capability=registry.BATCH))}")
+    return entry.load_solver()
+
+
+@lru_cache(maxsize=None)
+def _takes_record(solver):
+    # Direct solvers such as solve_structured keep no iteration records
+    return 'record' in inspect.signature(solver).parameters
+
+
+def call_solver(solver, kwargs, record=False):
+    """solver(**kwargs), with record= passed to the solvers that keep iteration records."""
+    if _takes_record(solver):
+        return solver(record=record, **kwargs)
+    return solver(**kwargs)
+
+
+def prepare(method, problem, compiled):
+    """Solver keyword arguments for one problem dict, with its expressions compiled.
+
+    compiled maps sources to compiled functions and is shared between
+    problems, so a repeated expression is compiled once.
+    """
+    kwargs = dict(problem)
+    entry = registry.get(method)
+    if entry.has(registry.DERIVATIVE) and kwargs.get('df') is None and isinstance(kwargs.get('f'), str):
+        # No derivative given: differentiate f automatically, fused with f itself
+        source = kwargs['f']
+        if ('fdf', source) not in compiled:
+            compiled['fdf', source] = compile_with_derivative(source)
+        kwargs['f'], kwargs['df'] = compiled['fdf', source], None
+    if entry.kind == 'system' and not callable(kwargs.get('F')):
+        # F given as one expression per equation, in the unknowns listed under 'variables'
+        from numericalAnalysisCalculator.core.systems import compile_system
+        key = ('system', tuple(kwargs['F']), tuple(kwargs['variables']))
+        if key not in compiled:
+            compiled[key] = compile_system(kwargs['F'], kwargs['variables'])
+        kwargs['F'] = compiled[key]
+        del kwargs['variables']
+    for key in FUNCTION_KEYS:
+        value = kwargs.get(key)
+        if isinstance(value, str):
+            if value not in compiled:
+                compiled[value] = compile_function(value)
+            kwargs[key] = compiled[value]
+    return kwargs
+
+
+def solve_batch(method, problems, record=False):
+    """Yields the result of method for each problem dict, in order."""
+    solver = get_solver(method)
+    compiled = {}
+    for problem in problems:
+        yield call_solver(solver, prepare(method, problem, compiled), record)
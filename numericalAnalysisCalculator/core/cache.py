@@ -0,0 +1,119 @@
+"""LRU cache of LU factorizations keyed by matrix content.
+
+Workloads that send the same coefficient matrix with different right-hand
+sides only pay for the first factorization:
+
+    cache = FactorizationCache(max_bytes=64 * 2**20)
+    lu, hit = cache.lookup(A)
+    x = lu.solve(b)
+    cache.stats()  # {'hits': ..., 'misses': ..., 'entries': ..., 'bytes': ...}
+
+A solver that factors A itself (the stepwise displays) uses peek(), which
+never factors, and hands its factors back with store().
+
+Keys are a BLAKE2 digest of A's bytes together with its shape, dtype and the
+pivoting flag. Entries are evicted least-recently-used first once the stored
+factors exceed max_bytes; a factorization larger than the whole budget is
+returned but not stored.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from numericalAnalysisCalculator.core.linear import LUFactorization
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+
+
+def matrix_key(A, pivoting=True):
+    """Content key for A: digest of its bytes plus shape, dtype and pivoting flag."""
+    A = np.ascontiguousarray(A, dtype=float)
+    digest = hashlib.blake2b(A.data, digest_size=16).hexdigest()
+    return (digest, A.shape, bool(pivoting))
+
+
+def _size(lu):
+    return lu.lu.nbytes + lu.perm.nbytes
+
+
+class FactorizationCache:
+    """Holds finished LUFactorization objects under a memory budget."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _find(self, key):
+        with self._lock:
+            lu = self._entries.get(key)
+            if lu is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+            return lu
+
+    def _insert(self, key, lu):
+        with self._lock:
+            if key not in self._entries and _size(lu) <= self.max_bytes:
+                self._entries[key] = lu
+                self.bytes += _size(lu)
+                self._evict()
+
+    def lookup(self, A, pivoting=True):
+        """Returns (factorization of A, True if it came from the cache)."""
+        key = matrix_key(A, pivoting)
+        lu = self._find(key)
+        if lu is not None:
+            return lu, True
+        lu = LUFactorization(A, pivoting)
+        self._insert(key, lu)
+        return lu, False
+
+    def peek(self, A, pivoting=True):
+        """Returns the cached factorization of A, or None; never factors A."""
+        return self._find(matrix_key(A, pivoting))
+
+    def store(self, A, lu, pivoting=True):
+        """Adds a factorization of A computed elsewhere."""
+        self._insert(matrix_key(A, pivoting), lu)
+
+    def get(self, A, pivoting=True):
+        """Returns the factorization of A, factoring it only on a miss."""
+        return self.lookup(A, pivoting)[0]
+
+    def resize(self, max_bytes):
+        """Changes the memory budget, evicting entries if it shrank."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._entries:
+            _, lu = self._entries.popitem(last=False)
+            self.bytes -= _size(lu)
+
+    def clear(self):
+        """Drops every entry and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = self.hits = self.misses = 0
+
+    def stats(self):
+        """Hit/miss counts and current size."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self._entries), 'bytes': self.bytes}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared by the Gauss elimination and LU windows
+default_cache = FactorizationCache()
@@ -0,0 +1,124 @@
+"""Parses, validates and compiles user-entered expressions such as f(x) once.
+
+Polynomials in a single variable written as a sum of c*x**k terms are
+compiled to Horner form (see core.polynomial), which is faster than
+evaluating the powers as written. Factored polynomials keep their own form.
+"""
+import ast
+import math
+
+from numericalAnalysisCalculator.core.polynomial import compile_polynomial, tree_coefficients, worth_horner
+
+# Names a user expression may reference besides its variables
+MATH_NAMESPACE = {
+    'math': math,
+    'pi': math.pi, 'e': math.e,
+    'abs': abs,
+    'exp': math.exp, 'log': math.log, 'log10': math.log10, 'sqrt': math.sqrt,
+    'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+    'asin': math.asin, 'acos': math.acos, 'atan': math.atan,
+    'sinh': math.sinh, 'cosh': math.cosh, 'tanh': math.tanh,
+}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Attribute,
+    ast.Constant, ast.Load,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.Mod, ast.FloorDiv,
+    ast.UAdd, ast.USub,
+)
+
+
+class ExpressionError(ValueError):
+    """Raised when an expression cannot be parsed or uses something not allowed."""
+
+
+def parse_expression(source, variables=('x',), namespace=MATH_NAMESPACE):
+    """Parses source into an AST and checks every node against the whitelist."""
+    if not source or not source.strip():
+        raise ExpressionError("Function is empty")
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid function: {e.msg}") from None
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ExpressionError(f"Invalid function: '{type(node).__name__}' is not allowed")
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise ExpressionError(f"Invalid function: constant {node.value!r} is not a number")
+        if isinstance(node, ast.Name) and node.id not in variables and node.id not in namespace:
+            raise ExpressionError(f"Invalid function: unknown name '{node.id}'")
+        if isinstance(node, ast.Attribute):
+            if not (isinstance(node.value, ast.Name) and node.value.id == 'math'
+                    and not node.attr.startswith('_') and hasattr(math, node.attr)):
+                raise ExpressionError(f"Invalid function: attribute '{node.attr}' is not allowed")
+        if isinstance(node, ast.Call) and node.keywords:
+            raise ExpressionError("Invalid function: keyword arguments are not allowed")
+    return tree
+
+
+def _compile_lambda(tree, variables, namespace, source):
+    """Wraps the validated expression body in a lambda and compiles it to a real function."""
+    args = ast.arguments(posonlyargs=[], args=[ast.arg(arg=v) for v in variables],
+                         kwonlyargs=[], kw_defaults=[], defaults=[])
+    lam = ast.Expression(body=ast.Lambda(args=args, body=tree.body))
+    ast.fix_missing_locations(lam)
+    code = compile(lam, f"<f: {source}>", 'eval')
+    return eval(code, {'__builtins__': {}, **namespace})
+
+
+class Expression:
+    """A user expression parsed and compiled once, callable as a plain function."""
+
+    def __init__(self, source, variables=('x',), namespace=MATH_NAMESPACE):
+        self.source = source
+        self.variables = tuple(variables)
+        self.namespace = namespace
+        self.tree = parse_expression(source, self.variables, namespace)
+        # Coefficients, highest degree first, when f is an expanded polynomial in its only variable
+        self.coefficients = None
+        if len(self.variables) == 1:
+            self.coefficients = tree_coefficients(self.tree, self.variables[0], namespace, expanded_only=True)
+        if self.coefficients is not None and worth_horner(self.coefficients):
+            self.func = compile_polynomial(self.coefficients, self.variables[0])
+        else:
+            self.func = _compile_lambda(self.tree, self.variables, namespace, source)
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+    def __repr__(self):
+        return f"Expression({self.source!r})"
+
+
+def compile_function(source, variables=('x',), namespace=MATH_NAMESPACE):
+    """Returns a fast callable for source, e.g. compile_function("x**2 - 2")(1.5)."""
+    return Expression(source, variables, namespace).func
+
+
+# math names whose NumPy ufunc is spelled differently
+_NUMPY_ALIASES = {'asin': 'arcsin', 'acos': 'arccos', 'atan': 'arctan', 'atan2': 'arctan2',
+                  'asinh': 'arcsinh', 'acosh': 'arccosh', 'atanh': 'arctanh', 'pow': 'power'}
+_numpy_namespace = None
+
+
+def numpy_namespace():
+    """Same names as MATH_NAMESPACE but bound to NumPy ufuncs, so expressions work on arrays."""
+    global _numpy_namespace
+    if _numpy_namespace is None:
+        import types
+        import numpy as np
+
+        def to_numpy(name, value):
+            return getattr(np, _NUMPY_ALIASES.get(name, name), value)
+
+        math_shim = types.SimpleNamespace(**{name: to_numpy(name, getattr(math, name))
+                                             for name in dir(math) if not name.startswith('_')})
+        _numpy_namespace = {name: to_numpy(name, value) for name, value in MATH_NAMESPACE.items()}
+        _numpy_namespace['math'] = math_shim
+    return _numpy_namespace
+
+
+def compile_vectorized(source, variables=('x',)):
+    """Like compile_function, but the callable accepts and returns NumPy arrays."""
+    return Expression(source, variables, numpy_namespace()).func
@@ -0,0 +1,243 @@
+"""Iterative solvers for Ax = b: Jacobi, Gauss-Seidel, SOR and conjugate gradient.
+
+    result = jacobi(A, b)
+    result = sor(A, b, omega=1.5, x0=previous.x)     # warm start
+    result = conjugate_gradient(matvec, b)           # matrix-free
+
+A may be a dense array, a core.sparse.CSRMatrix or any other object with
+A @ x. Jacobi and conjugate gradient also take a plain callable A(x) -> Ax
+(matrix-free); Jacobi then needs diagonal=. Gauss-Seidel and SOR need the
+entries of A below the diagonal, so they take a dense array or a CSRMatrix.
+
+Each iteration costs a matrix-vector product and O(n) vector work, and
+nothing of size n^2 is formed for a sparse or matrix-free A. The stationary
+methods are written in correction form,
+
+    x <- x + M^-1 (b - Ax),   M = D (Jacobi), D / omega + L (SOR, omega = 1: Gauss-Seidel),
+
+so the residual they report is the one they use. Jacobi and Gauss-Seidel
+converge for diagonally dominant A, SOR for symmetric positive definite A
+and 0 < omega < 2, and conjugate gradient for symmetric positive definite
+A, in at most n steps in exact arithmetic.
+
+A solve stops when the relative residual ||b - Ax|| / ||b|| (2-norm) is at
+most tol. The error of each step is the relative change of x in percent
+(max norm), as in the other solvers.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from numericalAnalysisCalculator.core.linear import _solve_triangular
+from numericalAnalysisCalculator.core.progress import StepLog
+from numericalAnalysisCalculator.core.sparse import CSRMatrix
+from numericalAnalysisCalculator.core.trace import Trace
+
+# Iteration records keep a copy of x only for systems up to this size
+RECORD_LIMIT = 1000
+
+
+@dataclass
+class IterativeStep:
+    """State after one iteration; x is a copy of the iterate for small systems, else None."""
+    iteration: int
+    residual: float
+    error: float
+    x: np.ndarray = None
+
+
+@dataclass
+class IterativeResult:
+    """Outcome of an iterative solve; residual is the final relative residual."""
+    x: np.ndarray
+    converged: bool
+    n_iter: int
+    iterations: list = field(default_factory=list)
+    message: str = ""
+    trace: Trace = None
+    residual: float = float('inf')
+    matvecs: int = 0
+
+
+def _matvec(A):
+    """A(x) for a callable A, A @ x otherwise."""
+    if callable(A):
+        return A
+    if isinstance(A, (list, tuple)):
+        A = np.asarray(A, dtype=float)
+    return lambda x: A @ x
+
+
+def _diagonal(A, diagonal=None):
+    if diagonal is not None:
+        return np.asarray(diagonal, dtype=float)
+    if isinstance(A, (list, tuple, np.ndarray)):
+        return np.diag(np.asarray(A, dtype=float)).copy()
+    if hasattr(A, 'diagonal'):
+        return np.asarray(A.diagonal(), dtype=float)
+    raise ValueError("A matrix-free operator needs its diagonal (diagonal=...)")
+
+
+class _JacobiSplitting:
+    """M = D."""
+
+    def __init__(self, d):
+        if np.any(d == 0):
+            raise ValueError("Zero on the diagonal of A: Jacobi needs a nonzero diagonal")
+        self.inverse = 1.0 / d
+
+    def solve(self, r):
+        return r * self.inverse
+
+
+class _DenseSORSplitting:
+    """M = D / omega + L for a dense A, solved by blocked forward substitution."""
+
+    def __init__(self, A, omega):
+        self.T = np.tril(A, -1)
+        d = np.diag(A)
+        if np.any(d == 0):
+            raise ValueError("Zero on the diagonal of A: Gauss-Seidel and SOR need a nonzero diagonal")
+        self.T[np.diag_indices_from(self.T)] = d / omega
+
+    def solve(self, r):
+        return _solve_triangular(self.T, r, lower=True, unit_diagonal=False)
+
+
+class _SparseSORSplitting:
+    """M = D / omega + L for a CSRMatrix, solved row by row over the stored entries."""
+
+    def __init__(self, A, omega):
+        d = A.diagonal()
+        if np.any(d == 0):
+            raise ValueError("Zero on the diagonal of A: Gauss-Seidel and SOR need a nonzero diagonal")
+        self.inverse = (omega / d).tolist()
+        rows = A.row_indices()
+        below = A.indices < rows
+        cols, values = A.indices[below].tolist(), A.data[below].tolist()
+        indptr = np.searchsorted(rows[below], np.arange(A.shape[0] + 1)).tolist()
+        # Entries left of the diagonal as (column, value) pairs, one tuple per row
+        self.rows = [tuple(zip(cols[start:end], values[start:end])) for start, end in zip(indptr, indptr[1:])]
+
+    def solve(self, r):
+        y = r.tolist()
+        for i, (row, inverse) in enumerate(zip(self.rows, self.inverse)):
+            total = y[i]
+            for j, v in row:
+                total -= v * y[j]
+            y[i] = total * inverse
+        return np.array(y)
+
+
+def _sor_splitting(A, omega):
+    if not 0 < omega < 2:
+        raise ValueError("SOR needs 0 < omega < 2")
+    if isinstance(A, CSRMatrix):
+        return _SparseSORSplitting(A, omega)
+    if callable(A):
+        raise ValueError("Gauss-Seidel and SOR need the entries of A: pass an array or a CSRMatrix")
+    A = np.asarray(A, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square")
+    return _DenseSORSplitting(A, omega)
+
+
+def _start(b, x0):
+    b = np.asarray(b, dtype=float)
+    if b.ndim != 1:
+        raise ValueError("Vector b must be one-dimensional")
+    if x0 is None:
+        x = np.zeros_like(b)
+    else:
+        x = np.array(x0, dtype=float)
+        if x.shape != b.shape:
+            raise ValueError("The initial guess x0 must have one entry per entry of b")
+    norm_b = np.linalg.norm(b)
+    return b, x, norm_b if norm_b > 0 else 1.0
+
+
+def _record(steps, i, residual, error, x):
+    if steps.enabled:
+        steps.append(IterativeStep(i, residual, error, x.copy() if x.size <= RECORD_LIMIT else None))
+
+
+def _stationary(A, b, splitting, x0, tol, max_iter, record, callback, trace):
+    """x <- x + M^-1 (b - Ax) until the relative residual reaches tol."""
+    if max_iter <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+    b, x, norm_b = _start(b, x0)
+    matvec = _matvec(A)
+    steps = StepLog(record, callback, Trace.for_record(IterativeStep) if trace else None)
+    error = float('inf')
+    # A diverging iterate overflows; that is reported as divergence, not warned about
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(max_iter + 1):
+            r = b - matvec(x)
+            residual = float(np.linalg.norm(r) / norm_b)
+            _record(steps, i, residual, error, x)
+            if residual <= tol:
+                return IterativeResult(x, True, i, steps, trace=steps.trace, residual=residual, matvecs=i + 1)
+            if not np.isfinite(residual):
+                return IterativeResult(x, False, i, steps, "The iteration diverged: A is not diagonally dominant enough.",
+                                       steps.trace, residual, i + 1)
+            if i == max_iter:
+                break
+            dx = splitting.solve(r)
+            x = x + dx
+            scale = np.abs(x).max()
+            error = float(np.abs(dx).max() / scale * 100) if scale else float('inf')
+    return IterativeResult(x, False, max_iter, steps, f"Maximum iterations ({max_iter}) reached without convergence.",
+                           steps.trace, residual, max_iter + 1)
+
+
+def jacobi(A, b, x0=None, tol=1e-8, max_iter=1000, diagonal=None, record=True, callback=None, trace=False):
+    """Solves Ax = b by Jacobi iteration; diagonal= is needed for a matrix-free A."""
+    return _stationary(A, b, _JacobiSplitting(_diagonal(A, diagonal)), x0, tol, max_iter, record, callback, trace)
+
+
+def gauss_seidel(A, b, x0=None, tol=1e-8, max_iter=1000, record=True, callback=None, trace=False):
+    """Solves Ax = b by Gauss-Seidel iteration (SOR with omega = 1)."""
+    return _stationary(A, b, _sor_splitting(A, 1.0), x0, tol, max_iter, record, callback, trace)
+
+
+def sor(A, b, omega=1.5, x0=None, tol=1e-8, max_iter=1000, record=True, callback=None, trace=False):
+    """Solves Ax = b by successive over-relaxation with factor omega in (0, 2)."""
+    return _stationary(A, b, _sor_splitting(A, omega), x0, tol, max_iter, record, callback, trace)
+
+
+def conjugate_gradient(A, b, x0=None, tol=1e-8, max_iter=1000, record=True, callback=None, trace=False):
+    """Solves Ax = b for symmetric positive definite A by the conjugate gradient method."""
+    if max_iter <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+    b, x, norm_b = _start(b, x0)
+    matvec = _matvec(A)
+    steps = StepLog(record, callback, Trace.for_record(IterativeStep) if trace else None)
+    r = b - matvec(x)
+    p = r.copy()
+    rr = r @ r
+    error = float('inf')
+    # Overflow or NaN on an indefinite A ends the solve through the p^T A p check
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(max_iter + 1):
+            residual = float(np.sqrt(rr) / norm_b)
+            _record(steps, i, residual, error, x)
+            if residual <= tol:
+                return IterativeResult(x, True, i, steps, trace=steps.trace, residual=residual, matvecs=i + 1)
+            if i == max_iter:
+                break
+            Ap = matvec(p)
+            pAp = p @ Ap
+            if not pAp > 0:
+                return IterativeResult(x, False, i, steps, "p^T A p <= 0: A is not symmetric positive definite.",
+                                       steps.trace, residual, i + 2)
+            alpha = rr / pAp
+            dx = alpha * p
+            x = x + dx
+            r -= alpha * Ap
+            rr_new = r @ r
+            p = r + (rr_new / rr) * p
+            rr = rr_new
+            scale = np.abs(x).max()
+            error = float(np.abs(dx).max() / scale * 100) if scale else float('inf')
+    return IterativeResult(x, False, max_iter, steps, f"Maximum iterations ({max_iter}) reached without convergence.",
+                           steps.trace, residual, max_iter + 1)
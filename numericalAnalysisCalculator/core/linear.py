@@ -0,0 +1,436 @@
+"""Headless direct solvers for Ax = b: Gauss elimination and LU decomposition.
+
+Steps are recorded as plain records (with matrix snapshots) so a front end can
+replay them; pass record=False to skip the snapshots for large systems, and
+callback=... to receive each step as it is produced (see core.progress).
+
+Without steps, a system of at least STRUCTURED_MIN_SIZE unknowns whose A is
+banded or sparse is handed to core.structured (Thomas, band or sparse LU)
+instead of dense elimination; result.method says which solver ran.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from numericalAnalysisCalculator.core.progress import StepLog
+
+
+@dataclass
+class EliminationStep:
+    """A row swap ('pivot') or a row operation ('eliminate') during elimination."""
+    kind: str
+    row: int
+    pivot_row: int
+    numerator: float = 0.0
+    denominator: float = 0.0
+    multiplier: float = 0.0
+    # The changed row from the pivot column on, after the operation; a display
+    # replays the steps on its own copy of the matrix
+    values: object = None
+
+
+@dataclass
+class SubstitutionStep:
+    """One unknown solved during forward ('forward') or back ('back') substitution."""
+    kind: str
+    row: int
+    rhs: float
+    total: float
+    diagonal: float
+    value: float
+
+
+@dataclass
+class LinearResult:
+    """Solution of Ax = b with the factors and the recorded steps.
+
+    Without recorded steps lu_solve does not form the dense L and P:
+    factors holds the packed LUFactorization, whose L and P properties
+    build them on demand. A system solved by core.structured (method is not
+    'dense') has no dense factors, and U is None.
+    """
+    x: np.ndarray
+    U: np.ndarray
+    L: np.ndarray = None
+    P: np.ndarray = None
+    c: np.ndarray = None
+    steps: list = field(default_factory=list)
+    cached: bool = False
+    method: str = 'dense'
+    factors: object = None
+
+
+def _as_system(A, b):
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square")
+    if b.shape != (A.shape[0],):
+        raise ValueError("Vector b must have one entry per row of A")
+    return A, b
+
+
+def _check_pivot(value, i):
+    if value == 0:
+        raise ValueError(f"Zero pivot in row {i+1}: the matrix is singular"
+                         " (try enabling partial pivoting)")
+
+
+def back_substitution(U, c, steps=None):
+    """Solves the upper-triangular system Ux = c."""
+    n = len(c)
+    x = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        total = U[i, i+1:n] @ x[i+1:n]
+        x[i] = (c[i] - total) / U[i, i]
+        if steps is not None:
+            steps.append(SubstitutionStep('back', i, c[i], total, U[i, i], x[i]))
+    return x
+
+
+def forward_substitution(L, b, steps=None):
+    """Solves the unit lower-triangular system Lc = b."""
+    n = len(b)
+    c = np.zeros(n)
+    for i in range(n):
+        total = np.sum(L[i, :i] * c[:i])
+        c[i] = b[i] - total
+        if steps is not None:
+            steps.append(SubstitutionStep('forward', i, b[i], total, 1.0, c[i]))
+    return c
+
+
+# Panel width of the blocked elimination used when no steps are recorded
+BLOCK_SIZE = 64
+
+
+def _pivot(M, i, pivoting):
+    """Swaps the largest |entry| of column i (rows i..) into row i; returns the row swapped in."""
+    max_row = i
+    if pivoting:
+        max_row = np.argmax(np.abs(M[i:, i])) + i
+        if max_row != i:
+            M[[i, max_row]] = M[[max_row, i]]
+    _check_pivot(M[i, i], i)
+    return max_row
+
+
+def _factor_blocked(M, n, pivoting, block=BLOCK_SIZE):
+    """Right-looking blocked elimination of the first n columns of M, in place.
+
+    Each panel of `block` columns is eliminated with rank-1 updates restricted
+    to the panel; the rows and columns to its right (including any extra
+    right-hand-side columns of M) are then brought up to date with one
+    triangular solve and one matrix product. The multipliers are left below
+    the diagonal, so M[:, :n] ends up holding L and U packed together.
+    Returns the row permutation and the number of row swaps.
+    """
+    perm = np.arange(n)
+    swaps = 0
+    for k0 in range(0, n, block):
+        k1 = min(k0 + block, n)
+        for i in range(k0, k1):
+            max_row = _pivot(M, i, pivoting)
+            if max_row != i:
+                perm[[i, max_row]] = perm[[max_row, i]]
+                swaps += 1
+            M[i+1:, i] /= M[i, i]
+            M[i+1:, i+1:k1] -= np.outer(M[i+1:, i], M[i, i+1:k1])
+
+        # U12 = L11^-1 A12 for the panel rows, then A22 -= L21 U12
+        for i in range(k0, k1):
+            M[i+1:k1, k1:] -= np.outer(M[i+1:k1, i], M[i, k1:])
+        M[k1:, k1:] -= M[k1:, k0:k1] @ M[k0:k1, k1:]
+    return perm, swaps
+
+
+def _solve_triangular(T, B, lower, unit_diagonal, block=BLOCK_SIZE):
+    """Solves T X = B for triangular T; B may be a vector or an (n, k) matrix.
+
+    Within a block of rows each row is solved for all right-hand sides at
+    once; the rest of the system is then updated with one matrix product.
+    """
+    X = np.array(B, dtype=float)
+    n = T.shape[0]
+    starts = range(0, n, block) if lower else reversed(range(0, n, block))
+    for k0 in starts:
+        k1 = min(k0 + block, n)
+        rows = range(k0, k1) if lower else range(k1 - 1, k0 - 1, -1)
+        for i in rows:
+            if lower:
+                X[i] -= T[i, k0:i] @ X[k0:i]
+            else:
+                X[i] -= T[i, i+1:k1] @ X[i+1:k1]
+            if not unit_diagonal:
+                X[i] /= T[i, i]
+        if lower:
+            X[k1:] -= T[k1:, k0:k1] @ X[k0:k1]
+        else:
+            X[:k0] -= T[:k0, k0:k1] @ X[k0:k1]
+    return X
+
+
+class LUFactorization:
+    """PA = LU computed once and reused for any number of right-hand sides.
+
+    L (unit lower) and U are stored packed in one n x n array together with
+    the pivot vector, so each new b costs two triangular solves, O(n^2),
+    instead of a fresh O(n^3) factorization:
+
+        lu = LUFactorization(A)
+        X = lu.solve(B)            # B is (n,) or (n, k)
+        y = lu.solve(c, trans=True)  # solves A^T y = c
+    """
+
+    def __init__(self, A, pivoting=True):
+        A = np.array(A, dtype=float)
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("Matrix A must be square")
+        self.n = A.shape[0]
+        self.pivoting = pivoting
+        self.norm1 = np.abs(A).sum(axis=0).max() if self.n else 0.0
+        self.lu = A
+        self.perm, self.swaps = _factor_blocked(self.lu, self.n, pivoting)
+
+    @classmethod
+    def from_packed(cls, A, lu, perm, pivoting=True):
+        """Wraps factors computed elsewhere: L below and U on and above the diagonal of lu, PA = LU."""
+        self = cls.__new__(cls)
+        self.n = lu.shape[0]
+        self.pivoting = pivoting
+        self.norm1 = np.abs(A).sum(axis=0).max() if self.n else 0.0
+        self.lu = lu
+        self.perm = perm
+        # Row swaps that give perm: n minus the number of its cycles
+        seen = np.zeros(self.n, dtype=bool)
+        cycles = 0
+        for start in range(self.n):
+            if not seen[start]:
+                cycles += 1
+                i = start
+                while not seen[i]:
+                    seen[i] = True
+                    i = perm[i]
+        self.swaps = self.n - cycles
+        return self
+
+    @property
+    def L(self):
+        return np.tril(self.lu, -1) + np.eye(self.n)
+
+    @property
+    def U(self):
+        return np.triu(self.lu)
+
+    @property
+    def P(self):
+        return np.eye(self.n)[self.perm]
+
+    def solve(self, B, trans=False):
+        """Solves AX = B (or A^T X = B with trans=True) for one or many columns of B."""
+        B = np.asarray(B, dtype=float)
+        if B.shape[0] != self.n:
+            raise ValueError("Right-hand side must have one row per row of A")
+        if not trans:
+            # LUx = Pb
+            c = _solve_triangular(self.lu, B[self.perm], lower=True, unit_diagonal=True)
+            return _solve_triangular(self.lu, c, lower=False, unit_diagonal=False)
+        # A^T = U^T L^T P, so U^T y = b, L^T z = y, x = P^T z
+        y = _solve_triangular(self.lu.T, B, lower=True, unit_diagonal=False)
+        z = _solve_triangular(self.lu.T, y, lower=False, unit_diagonal=True)
+        x = np.empty_like(z)
+        x[self.perm] = z
+        return x
+
+    def det(self):
+        """Determinant of A from the diagonal of U and the parity of the row swaps."""
+        sign = -1.0 if self.swaps % 2 else 1.0
+        return sign * np.prod(np.diag(self.lu))
+
+    def inverse_norm1_estimate(self, max_iter=5):
+        """Estimates ||A^-1||_1 with Hager's method, using only solves with the factors."""
+        n = self.n
+        x = np.full(n, 1.0 / n)
+        estimate = 0.0
+        for _ in range(max_iter):
+            y = self.solve(x)
+            estimate = np.abs(y).sum()
+            z = self.solve(np.where(y >= 0, 1.0, -1.0), trans=True)
+            j = np.argmax(np.abs(z))
+            if np.abs(z[j]) <= z @ x:
+                break
+            x = np.zeros(n)
+            x[j] = 1.0
+        return estimate
+
+    def condition_estimate(self):
+        """Estimated 1-norm condition number ||A||_1 ||A^-1||_1."""
+        return self.norm1 * self.inverse_norm1_estimate()
+
+
+# Systems at least this large are checked for band or sparse structure when no steps are recorded
+STRUCTURED_MIN_SIZE = 64
+
+
+def _solve_structured(A, b):
+    """Solves with core.structured when A is banded or sparse; None when dense elimination suits it.
+
+    The result has no dense factors (U is None).
+    """
+    n = A.shape[0]
+    if n < STRUCTURED_MIN_SIZE:
+        return None
+    from numericalAnalysisCalculator.core import structured
+    from numericalAnalysisCalculator.core.sparse import as_csr
+
+    # More nonzeros than any band narrow enough for band storage: dense, without converting A
+    if np.count_nonzero(A) > structured.BAND_LIMIT * n * n:
+        return None
+    A = as_csr(A)
+    method = structured.choose_method(structured.analyze(A))
+    if method == 'dense':
+        return None
+    return LinearResult(structured.solve_structured(A, b, method).x, None, method=method)
+
+
+def _solve_from_cache(cache, A, b, pivoting, record, callback):
+    """Looks A up in a FactorizationCache; on a hit, goes straight to substitution.
+
+    A stepwise solve only peeks: on a miss it returns None and the caller
+    factors A itself, once, and stores the factors afterwards.
+    """
+    stepwise = record or callback is not None
+    if stepwise:
+        lu = cache.peek(A, pivoting)
+        if lu is None:
+            return None
+        steps = StepLog(record, callback)
+        L, U = lu.L, lu.U
+        c = forward_substitution(L, b[lu.perm], steps)
+        x = back_substitution(U, c, steps)
+        return LinearResult(x, U, L, lu.P, c, steps, cached=True)
+    lu, hit = cache.lookup(A, pivoting)
+    return _packed_result(lu, b, cached=hit)
+
+
+def _packed_result(lu, b, cached=False):
+    """Solves with the packed factors of lu; the result keeps them instead of dense L and P."""
+    c = _solve_triangular(lu.lu, b[lu.perm], lower=True, unit_diagonal=True)
+    x = _solve_triangular(lu.lu, c, lower=False, unit_diagonal=False)
+    return LinearResult(x, np.triu(lu.lu), c=c, cached=cached, factors=lu)
+
+
+def gauss_elimination(A, b, pivoting=True, record=True, cache=None, callback=None):
+    """Solves the n x n system Ax = b by forward elimination on [A|b] and back substitution.
+
+    With record=False the blocked elimination is used; with record=True each
+    pivot column is eliminated by one rank-1 update and replayed row by row.
+    With a FactorizationCache, a matrix seen before skips elimination: b is
+    reduced with the cached factors and the result has cached=True. A
+    stepwise elimination stores its factors in the cache for the next solve.
+    """
+    A, b = _as_system(A, b)
+    if not record and callback is None:
+        result = _solve_structured(A, b)
+        if result is not None:
+            return result
+    if cache is not None:
+        result = _solve_from_cache(cache, A, b, pivoting, record, callback)
+        if result is not None:
+            if record:
+                # Gauss elimination only shows the back substitution
+                result.steps = [s for s in result.steps if s.kind == 'back']
+            return result
+    n = len(b)
+    Ab = np.column_stack((A, b))
+
+    if not record and callback is None:
+        _factor_blocked(Ab, n, pivoting)
+        U = np.triu(Ab[:, :n])
+        x = _solve_triangular(U, Ab[:, n], lower=False, unit_diagonal=False)
+        return LinearResult(x, U, c=Ab[:, n])
+
+    steps = StepLog(record, callback)
+    # Multipliers and row order, kept for the cache as packed LU factors
+    multipliers = np.zeros((n, n))
+    perm = np.arange(n)
+    for i in range(n):
+        max_row = _pivot(Ab, i, pivoting)
+        if max_row != i:
+            multipliers[[i, max_row]] = multipliers[[max_row, i]]
+            perm[[i, max_row]] = perm[[max_row, i]]
+            steps.append(EliminationStep('pivot', i, max_row))
+
+        numerators = Ab[i+1:, i].copy()
+        m = numerators / Ab[i, i]
+        multipliers[i+1:, i] = m
+        # Eliminate column i from every row below the pivot with one rank-1 update
+        Ab[i+1:, i:] -= np.outer(m, Ab[i, i:])
+        # One step per row operation, holding only the row it changed
+        for k, j in enumerate(range(i+1, n)):
+            steps.append(EliminationStep('eliminate', j, i, numerators[k], Ab[i, i], m[k],
+                                         Ab[j, i:].copy()))
+
+    if cache is not None:
+        cache.store(A, LUFactorization.from_packed(A, np.triu(Ab[:, :n]) + multipliers, perm, pivoting), pivoting)
+    x = back_substitution(Ab[:, :n], Ab[:, n], steps)
+    return LinearResult(x, Ab[:, :n], c=Ab[:, n], steps=steps)
+
+
+def lu_decompose(A, pivoting=True, steps=None):
+    """Factors PA = LU; returns (L, U, P) and appends steps to the given list."""
+    if steps is None:
+        lu = LUFactorization(A, pivoting)
+        return lu.L, lu.U, lu.P
+    A = np.array(A, dtype=float)
+    n = A.shape[0]
+    L = np.eye(n)
+    U = A.copy()
+    P = np.eye(n)
+
+    for i in range(n):
+        if pivoting:
+            max_row = np.argmax(np.abs(U[i:, i])) + i
+            if max_row != i:
+                U[[i, max_row], i:] = U[[max_row, i], i:]
+                if i > 0:
+                    L[[i, max_row], :i] = L[[max_row, i], :i]
+                P[[i, max_row]] = P[[max_row, i]]
+                if steps is not None:
+                    steps.append(EliminationStep('pivot', i, max_row))
+        _check_pivot(U[i, i], i)
+
+        for j in range(i+1, n):
+            numerator = U[j, i]
+            L[j, i] = U[j, i] / U[i, i]
+            U[j, i:] -= L[j, i] * U[i, i:]
+            if steps is not None:
+                steps.append(EliminationStep('eliminate', j, i, numerator, U[i, i], L[j, i],
+                                             U[j, i:].copy()))
+    return L, U, P
+
+
+def lu_solve(A, b, pivoting=True, record=True, cache=None, callback=None):
+    """Solves Ax = b via PA = LU, then Lc = Pb and Ux = c.
+
+    With a FactorizationCache, a matrix seen before reuses its factors and
+    only the substitution steps are recorded (the result has cached=True).
+    """
+    A, b = _as_system(A, b)
+    if not record and callback is None:
+        result = _solve_structured(A, b)
+        if result is not None:
+            return result
+    if cache is not None:
+        result = _solve_from_cache(cache, A, b, pivoting, record, callback)
+        if result is not None:
+            return result
+    if not record and callback is None:
+        return _packed_result(LUFactorization(A, pivoting), b)
+    steps = StepLog(record, callback)
+    L, U, P = lu_decompose(A, pivoting, steps)
+    if cache is not None:
+        cache.store(A, LUFactorization.from_packed(A, np.tril(L, -1) + U, np.argmax(P, axis=1), pivoting), pivoting)
+    c = forward_substitution(L, P @ b, steps)
+    x = back_substitution(U, c, steps)
+    return LinearResult(x, U, L, P, c, steps)
@@ -0,0 +1,221 @@
+"""Headless one-dimensional optimization: golden-section search and Brent's method.
+
+Both search [xl, xu] for the maximum (or, with maximize=False, the minimum)
+of a unimodal f, and return an OptimumResult. Golden-section search shrinks
+the interval by the same factor R every iteration, for one new evaluation
+of f. Brent's method fits a parabola through its three best points and
+jumps to the parabola's vertex, falling back to a golden-section step when
+that would not shrink the interval fast enough. It usually needs a fraction
+of the evaluations for the same accuracy.
+
+eps is the approximate relative error in percent, as in core.rootfinding:
+golden-section search stops when (1 - R) * (xu - xl) / |x| is at most eps,
+and Brent's method when x is that close to both ends of its interval.
+Golden-section search has no relative error at an optimum x = 0, so there
+max_iter ends the search; Brent's tolerance adds ABS_TOL. golden_section()
+without eps runs exactly max_iter iterations.
+"""
+import math
+import sys
+from dataclasses import dataclass, field
+
+from numericalAnalysisCalculator.core.progress import StepLog
+from numericalAnalysisCalculator.core.trace import Trace
+
+R = (math.sqrt(5) - 1) / 2  # Golden ratio
+
+# Below the square root of machine precision, f values no longer tell points apart
+SQRT_EPSILON = math.sqrt(sys.float_info.epsilon)
+
+# Absolute width added to Brent's tolerance, so an optimum at 0 still converges
+ABS_TOL = 1e-10
+
+
+@dataclass
+class GoldenStep:
+    """State at the start of one golden-section iteration and the side kept."""
+    iteration: int
+    xl: float
+    f_xl: float
+    x1: float
+    f_x1: float
+    x2: float
+    f_x2: float
+    xu: float
+    f_xu: float
+    d: float
+    keep: str
+    error: float
+
+
+@dataclass
+class BrentOptimumStep:
+    """One iteration of Brent's method: the interval and best point x at its start,
+    and the point u tried, found by a 'parabolic' or a 'golden' step."""
+    iteration: int
+    xl: float
+    xu: float
+    x: float
+    fx: float
+    u: float
+    f_u: float
+    kind: str
+    error: float
+
+
+@dataclass
+class OptimumResult:
+    """Best point found and the final interval.
+
+    x1, x2 and d are the interior points and step of golden-section search
+    (None for Brent's method); error is the final relative error in percent.
+    """
+    x: float
+    fx: float
+    xl: float
+    xu: float
+    n_iter: int
+    x1: float = None
+    x2: float = None
+    d: float = None
+    iterations: list = field(default_factory=list)
+    trace: Trace = None
+    converged: bool = True
+    message: str = ""
+    error: float = float('inf')
+
+
+def _check(xl, xu, max_iter):
+    if xl >= xu:
+        raise ValueError("Lower bound must be less than upper bound")
+    if max_iter <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+
+
+def _width_error(width, x):
+    """width relative to |x|, in percent."""
+    return width / abs(x) * 100 if x != 0 else float('inf')
+
+
+def golden_section(f, xl, xu, max_iter=8, maximize=True, eps=None, record=True, callback=None, trace=False):
+    """Searches [xl, xu] for the maximum (or minimum) of a unimodal f.
+
+    Stops once the relative error is at most eps percent, or after max_iter
+    iterations; without eps it always runs max_iter. With trace=True,
+    result.trace holds the records column by column (see core.trace).
+    """
+    _check(xl, xu, max_iter)
+
+    # Initial setup
+    d = R * (xu - xl)
+    x1, x2 = xl + d, xu - d
+    fx1, fx2 = f(x1), f(x2)
+
+    steps = StepLog(record, callback, Trace.for_record(GoldenStep) if trace else None)
+    # Endpoint values are only needed for the records; each later endpoint is
+    # a former interior point, so its value is already known
+    f_xl, f_xu = (f(xl), f(xu)) if steps.enabled else (None, None)
+    for i in range(max_iter):
+        better_left = (maximize and fx1 > fx2) or (not maximize and fx1 < fx2)
+        x_opt, f_opt = (x1, fx1) if better_left else (x2, fx2)
+        if steps.enabled:
+            error = _width_error((1 - R) * (xu - xl), x_opt)
+            steps.append(GoldenStep(i + 1, xl, f_xl, x1, fx1, x2, fx2, xu, f_xu, d,
+                                    'left' if better_left else 'right', error))
+
+        if better_left:
+            xl, f_xl, x2, fx2 = x2, fx2, x1, fx1
+            d = R * (xu - xl)
+            x1 = xl + d
+            fx1 = f(x1)
+        else:
+            xu, f_xu, x1, fx1 = x1, fx1, x2, fx2
+            d = R * (xu - xl)
+            x2 = xu - d
+            fx2 = f(x2)
+
+        error = _width_error((1 - R) * (xu - xl), x_opt)
+        if eps is not None and error <= eps:
+            return OptimumResult(x_opt, f_opt, xl, xu, i + 1, x1, x2, d, steps, steps.trace, error=error)
+
+    if eps is None:
+        return OptimumResult(x_opt, f_opt, xl, xu, max_iter, x1, x2, d, steps, steps.trace, error=error)
+    return OptimumResult(x_opt, f_opt, xl, xu, max_iter, x1, x2, d, steps, steps.trace, False,
+                         f"Maximum iterations ({max_iter}) reached without convergence.", error)
+
+
+def brent_optimum(f, xl, xu, max_iter=100, maximize=True, eps=1e-6, record=True, callback=None, trace=False):
+    """Searches [xl, xu] for the maximum (or minimum) of f with Brent's method.
+
+    x is the best point so far, w the second best and v the one before w.
+    Each step tries the vertex of the parabola through x, w and v, and takes
+    a golden-section step into the larger side of [xl, xu] instead when the
+    vertex falls outside the interval or the steps stop halving every
+    second iteration. Stops when x is within eps percent (and at least the
+    square root of machine precision) of both ends of the interval.
+    """
+    _check(xl, xu, max_iter)
+    # Minimize g = sign * f; records and the result keep the sign of f
+    sign = -1 if maximize else 1
+    a, b = xl, xu
+    x = w = v = a + (1 - R) * (b - a)
+    fx = fw = fv = sign * f(x)
+    # d is the last step, e the one before it
+    d = e = 0.0
+
+    steps = StepLog(record, callback, Trace.for_record(BrentOptimumStep) if trace else None)
+    for i in range(max_iter + 1):
+        m = 0.5 * (a + b)
+        # Done when both ends are within 2 * tol of x
+        tol = 0.5 * (max(eps / 100, SQRT_EPSILON) * abs(x) + ABS_TOL)
+        error = _width_error(max(x - a, b - x), x)
+        if max(x - a, b - x) <= 2 * tol:
+            return OptimumResult(x, sign * fx, a, b, i, iterations=steps, trace=steps.trace, error=error)
+        if i == max_iter:
+            break
+
+        kind = 'golden'
+        if abs(e) > tol:
+            # Vertex of the parabola through (x, fx), (w, fw), (v, fv) is x + p / q
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            e_before, e = e, d
+            # Take it only inside (a, b) and shorter than half the step before last
+            if abs(p) < abs(0.5 * q * e_before) and q * (a - x) < p < q * (b - x):
+                kind = 'parabolic'
+                d = p / q
+                if (x + d) - a < 2 * tol or b - (x + d) < 2 * tol:
+                    d = math.copysign(tol, m - x)
+        if kind == 'golden':
+            e = (a - x) if x >= m else (b - x)
+            d = (1 - R) * e
+
+        # Never evaluate closer than tol to x
+        u = x + d if abs(d) >= tol else x + math.copysign(tol, d)
+        fu = sign * f(u)
+        if steps.enabled:
+            steps.append(BrentOptimumStep(i + 1, a, b, x, sign * fx, u, sign * fu, kind, error))
+
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv, w, fw, x, fx = w, fw, x, fx, u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv, w, fw = w, fw, u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+    return OptimumResult(x, sign * fx, a, b, max_iter, iterations=steps, trace=steps.trace, converged=False,
+                         message=f"Maximum iterations ({max_iter}) reached without convergence.", error=error)
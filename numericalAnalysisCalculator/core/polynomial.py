@@ -0,0 +1,279 @@
+"""Polynomial fast path: coefficients, Horner evaluation and companion-matrix roots.
+
+Expressions such as "4*x**3 - 6*x**2 + 7*x - 2.3" are recognised from their
+AST and reduced to coefficients, highest degree first:
+
+    polynomial_coefficients("4*x**3 - 6*x**2 + 7*x - 2.3")   # [4, -6, 7, -2.3]
+    p = compile_polynomial([4, -6, 7, -2.3])                # ((4*x - 6)*x + 7)*x - 2.3
+    pdp = compile_polynomial_with_derivative([4, -6, 7, -2.3])
+    pdp(0.5)                                                # (p(0.5), p'(0.5)) in one pass
+    real_roots([1, -6, 11, -6])                             # [1.0, 2.0, 3.0]
+
+Horner code is plain arithmetic, so the same function works on floats and on
+NumPy arrays. core.expression and core.autodiff switch to it automatically
+for polynomials written out as a sum of c*x**k terms; roots need NumPy, which
+is imported on first use.
+
+Factored input such as (x - 2)**7 or (x - 1)*(x + 3) is never expanded for
+evaluation: near a multiple root the expanded coefficients cancel
+catastrophically ((x - 2)**7 at 2.001 comes out as -1.4e-13 instead of
+1e-21), while the factored form stays accurate.
+"""
+import ast
+import math
+
+# Highest power expanded when reducing x**n; larger powers keep the generic path
+MAX_DEGREE = 64
+
+
+def _add(p, q):
+    if len(p) < len(q):
+        p, q = q, p
+    return [a + b for a, b in zip(p, q)] + p[len(q):]
+
+
+def _scale(p, c):
+    return [a * c for a in p]
+
+
+def _multiply(p, q):
+    out = [0] * (len(p) + len(q) - 1)
+    for i, a in enumerate(p):
+        for j, b in enumerate(q):
+            out[i + j] += a * b
+    return out
+
+
+def _constant(p):
+    """The value of p if it has no x terms, else None."""
+    if all(a == 0 for a in p[1:]):
+        return p[0]
+    return None
+
+
+def _reduce(node, variable, namespace):
+    """Coefficients of node, lowest degree first, or None if it is not a polynomial."""
+    if isinstance(node, ast.Constant):
+        return [node.value]
+    if isinstance(node, ast.Name):
+        if node.id == variable:
+            return [0, 1]
+        value = namespace.get(node.id)
+        return [value] if isinstance(value, (int, float)) else None
+    if isinstance(node, ast.UnaryOp):
+        p = _reduce(node.operand, variable, namespace)
+        if p is None:
+            return None
+        return _scale(p, -1) if isinstance(node.op, ast.USub) else p
+    if not isinstance(node, ast.BinOp):
+        return None
+
+    p = _reduce(node.left, variable, namespace)
+    q = _reduce(node.right, variable, namespace)
+    if p is None or q is None:
+        return None
+    op = node.op
+    if isinstance(op, ast.Add):
+        return _add(p, q)
+    if isinstance(op, ast.Sub):
+        return _add(p, _scale(q, -1))
+    if isinstance(op, ast.Mult):
+        return _multiply(p, q)
+    if isinstance(op, ast.Div):
+        c = _constant(q)
+        if not c:
+            return None
+        return [a / c for a in p]
+    if isinstance(op, ast.Pow):
+        n = _constant(q)
+        if isinstance(n, float) and n.is_integer():
+            n = int(n)
+        if not isinstance(n, int) or n < 0 or n * (len(p) - 1) > MAX_DEGREE:
+            return None
+        out = [1]
+        for _ in range(n):
+            out = _multiply(out, p)
+        return out
+    return None
+
+
+def _is_constant(node, variable, namespace):
+    if isinstance(node, ast.Constant):
+        return True
+    if isinstance(node, ast.Name):
+        return node.id != variable and isinstance(namespace.get(node.id), (int, float))
+    if isinstance(node, ast.UnaryOp):
+        return _is_constant(node.operand, variable, namespace)
+    if isinstance(node, ast.BinOp):
+        return _is_constant(node.left, variable, namespace) and _is_constant(node.right, variable, namespace)
+    return False
+
+
+def _is_monomial(node, variable, namespace):
+    """True for c, x, x**k and products or quotients of those with constants: c*x**k, x**k/c."""
+    if _is_constant(node, variable, namespace):
+        return True
+    if isinstance(node, ast.Name):
+        return node.id == variable
+    if isinstance(node, ast.UnaryOp):
+        return _is_monomial(node.operand, variable, namespace)
+    if not isinstance(node, ast.BinOp):
+        return False
+    if isinstance(node.op, ast.Pow):
+        return (isinstance(node.left, ast.Name) and node.left.id == variable
+                and _is_constant(node.right, variable, namespace))
+    if isinstance(node.op, ast.Mult):
+        # At most one factor holds x, so no sums or powers of x are multiplied out
+        return ((_is_constant(node.left, variable, namespace) and _is_monomial(node.right, variable, namespace))
+                or (_is_monomial(node.left, variable, namespace) and _is_constant(node.right, variable, namespace)))
+    if isinstance(node.op, ast.Div):
+        return _is_monomial(node.left, variable, namespace) and _is_constant(node.right, variable, namespace)
+    return False
+
+
+def is_expanded(node, variable, namespace):
+    """True when node is a sum or difference of monomials, e.g. 4*x**3 - 6*x**2 + 7*x - 2.3."""
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.Add, ast.Sub)):
+        return is_expanded(node.left, variable, namespace) and is_expanded(node.right, variable, namespace)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        return is_expanded(node.operand, variable, namespace)
+    return _is_monomial(node, variable, namespace)
+
+
+def worth_horner(coeffs):
+    """True when Horner's scheme beats the original expression.
+
+    Horner costs one multiply-add per degree, so a sparse high-degree polynomial
+    such as x**10 - 1 is faster left as a few powers.
+    """
+    return len(coeffs) - 1 < 2 * sum(1 for c in coeffs if c != 0)
+
+
+def tree_coefficients(tree, variable='x', namespace=None, expanded_only=False):
+    """Coefficients of a validated expression tree in variable, highest degree first.
+
+    Returns None when the expression is not a polynomial of degree one or more,
+    or, with expanded_only=True, when it is not written as a sum of monomials.
+    """
+    namespace = namespace or {}
+    if expanded_only and not is_expanded(tree.body, variable, namespace):
+        return None
+    p = _reduce(tree.body, variable, namespace)
+    if p is None or any(not math.isfinite(a) for a in p):
+        return None
+    while len(p) > 1 and p[-1] == 0:
+        p.pop()
+    if len(p) < 2:
+        return None
+    return p[::-1]
+
+
+def polynomial_coefficients(source, variable='x'):
+    """Coefficients of the expression source, highest degree first, or None."""
+    from numericalAnalysisCalculator.core.expression import MATH_NAMESPACE, parse_expression
+    return tree_coefficients(parse_expression(source, (variable,)), variable, MATH_NAMESPACE)
+
+
+def horner_source(coeffs, variable='x'):
+    """Horner form of the polynomial as a Python expression, e.g. '(4 * x - 6) * x + 7'."""
+    expr = variable if coeffs[0] == 1 else f"{coeffs[0]!r} * {variable}"
+    for c in coeffs[1:-1]:
+        expr = f"({expr}{_offset(c)}) * {variable}" if c != 0 else f"{expr} * {variable}"
+    return expr + _offset(coeffs[-1])
+
+
+def _offset(c):
+    if c == 0:
+        return ""
+    return f" + {c!r}" if c > 0 else f" - {-c!r}"
+
+
+def compile_polynomial(coeffs, variable='x'):
+    """Returns p(x) evaluated by Horner's scheme; works on floats and NumPy arrays."""
+    code = compile(f"lambda {variable}: {horner_source(coeffs, variable)}", f"<p: {coeffs}>", 'eval')
+    return eval(code, {'__builtins__': {}})
+
+
+def derivative_coefficients(coeffs):
+    """Coefficients of p', highest degree first."""
+    n = len(coeffs) - 1
+    return [c * (n - i) for i, c in enumerate(coeffs[:-1])] or [0]
+
+
+def compile_polynomial_with_derivative(coeffs, variable='x'):
+    """Returns a callable giving (p(x), p'(x)) from one Horner pass."""
+    lines = [f"d = {coeffs[0]!r}", f"p = {coeffs[0]!r} * {variable}{_offset(coeffs[1])}"]
+    for c in coeffs[2:]:
+        lines.append(f"d = d * {variable} + p")
+        lines.append(f"p = p * {variable}{_offset(c)}")
+    source = f"def pdp({variable}):\n" + "".join(f"    {line}\n" for line in lines) + "    return p, d\n"
+    scope = {'__builtins__': {}}
+    exec(compile(source, f"<p, p': {coeffs}>", 'exec'), scope)
+    return scope['pdp']
+
+
+def polynomial_string(coeffs, variable='x'):
+    """Readable form of the polynomial, e.g. '12*x**2 - 12*x + 7'."""
+    n = len(coeffs) - 1
+    terms = []
+    for i, c in enumerate(coeffs):
+        if c == 0:
+            continue
+        power = n - i
+        magnitude = abs(c)
+        if power == 0:
+            body = f"{magnitude:g}"
+        else:
+            body = variable if power == 1 else f"{variable}**{power}"
+            if magnitude != 1:
+                body = f"{magnitude:g}*{body}"
+        sign = '-' if c < 0 else '+'
+        terms.append(f"{sign} {body}" if terms else (f"-{body}" if c < 0 else body))
+    return " ".join(terms) or "0"
+
+
+def polynomial_roots(coeffs):
+    """All complex roots, as the eigenvalues of the companion matrix."""
+    import numpy as np
+
+    coeffs = np.trim_zeros(np.asarray(coeffs, dtype=float), 'f')
+    if coeffs.size == 0:
+        raise ValueError("The zero polynomial has no isolated roots.")
+    # Trailing zero coefficients are roots at x = 0
+    zeros = coeffs.size - np.trim_zeros(coeffs, 'b').size
+    coeffs = np.trim_zeros(coeffs, 'b')
+    n = coeffs.size - 1
+    roots = np.zeros(n + zeros, dtype=complex)
+    if n > 0:
+        companion = np.diag(np.ones(n - 1), -1)
+        companion[0, :] = -coeffs[1:] / coeffs[0]
+        roots[:n] = np.linalg.eigvals(companion)
+    return roots
+
+
+def real_roots(coeffs, xl=None, xu=None, polish=True, tol=1e-8):
+    """Sorted real roots, repeated by multiplicity, optionally only those in [xl, xu].
+
+    Eigenvalues with an imaginary part below tol (relative to their size) count
+    as real; with polish=True each is refined by a few Newton steps on the
+    Horner form, which restores full accuracy for simple roots.
+    """
+    pdp = compile_polynomial_with_derivative(list(coeffs)) if polish and len(coeffs) > 1 else None
+    roots = []
+    for z in polynomial_roots(coeffs):
+        if abs(z.imag) > tol * max(1.0, abs(z)):
+            continue
+        x = float(z.real)
+        if pdp is not None:
+            for _ in range(3):
+                p, d = pdp(x)
+                if d == 0 or p == 0:
+                    break
+                x_new = x - p / d
+                # Only accept steps that reduce |p|, e.g. not near a multiple root
+                if abs(pdp(x_new)[0]) >= abs(p):
+                    break
+                x = x_new
+        if (xl is None or x >= xl) and (xu is None or x <= xu):
+            roots.append(x)
+    return sorted(roots)
@@ -0,0 +1,104 @@
+"""Counting and timing the user function inside any solver.
+
+    f = instrument(compile_function("x**3 - 2*x - 5"))
+    bisection(f, 2, 3)
+    f.calls, f.seconds          # evaluations and wall time spent inside f
+
+    result, report = profile(bisection, compile_function("x**3 - 2*x - 5"), 2, 3, per_call=True)
+    print(report.summary())     # evaluations, time in f vs. solver overhead
+    report.histogram(bins=8)    # per-call times, log-spaced bins
+
+An instrumented function is a drop-in replacement for f; for Newton with a
+fused f, f' function (df=None) each call counts as one evaluation.
+"""
+import math
+import time
+from array import array
+from dataclasses import dataclass
+
+
+class CountedFunction:
+    """Wraps f, counting calls and (with timing=True) the time spent inside it."""
+
+    def __init__(self, f, timing=True, per_call=False):
+        self.f = f
+        self.timing = timing or per_call
+        self.calls = 0
+        self.seconds = 0.0
+        self.call_times = array('d') if per_call else None
+
+    def __call__(self, *args):
+        self.calls += 1
+        if not self.timing:
+            return self.f(*args)
+        start = time.perf_counter()
+        try:
+            return self.f(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.seconds += elapsed
+            if self.call_times is not None:
+                self.call_times.append(elapsed)
+
+    def reset(self):
+        self.calls = 0
+        self.seconds = 0.0
+        if self.call_times is not None:
+            self.call_times = array('d')
+
+    def summary(self):
+        """One line for display, e.g. '44 evaluations of f, 0.021 ms inside f'."""
+        text = f"{self.calls} evaluations of f"
+        if self.timing:
+            text += f", {self.seconds * 1e3:.3f} ms inside f"
+        return text
+
+
+def instrument(f, timing=True, per_call=False):
+    """Returns f wrapped in a CountedFunction; per_call=True also keeps every call's time."""
+    return CountedFunction(f, timing, per_call)
+
+
+@dataclass
+class ProfileReport:
+    """Where the time of one solve went."""
+    evaluations: int
+    total_seconds: float
+    f_seconds: float
+    call_times: array = None
+
+    @property
+    def overhead_seconds(self):
+        """Time spent in the solver itself, outside f."""
+        return max(0.0, self.total_seconds - self.f_seconds)
+
+    def histogram(self, bins=10):
+        """Per-call times as (low, high, count) in log-spaced bins; needs per_call=True."""
+        if not self.call_times:
+            return []
+        low, high = min(self.call_times), max(self.call_times)
+        low = max(low, 1e-9)
+        if high <= low:
+            return [(low, high, len(self.call_times))]
+        width = math.log(high / low) / bins
+        counts = [0] * bins
+        for t in self.call_times:
+            i = int(math.log(max(t, low) / low) / width)
+            counts[min(i, bins - 1)] += 1
+        return [(low * math.exp(width * i), low * math.exp(width * (i + 1)), c)
+                for i, c in enumerate(counts)]
+
+    def summary(self):
+        share = self.f_seconds / self.total_seconds * 100 if self.total_seconds else 0.0
+        return (f"{self.evaluations} evaluations, {self.total_seconds * 1e3:.3f} ms total: "
+                f"{self.f_seconds * 1e3:.3f} ms in f ({share:.0f}%), "
+                f"{self.overhead_seconds * 1e3:.3f} ms solver overhead")
+
+
+def profile(solver, f, *args, per_call=False, **kwargs):
+    """Runs solver(f, *args, **kwargs) with f instrumented; returns (result, ProfileReport)."""
+    counted = instrument(f, per_call=per_call)
+    start = time.perf_counter()
+    result = solver(counted, *args, **kwargs)
+    total = time.perf_counter() - start
+    return result, ProfileReport(counted.calls, total, counted.seconds, counted.call_times)
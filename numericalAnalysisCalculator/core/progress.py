@@ -0,0 +1,39 @@
+"""Progress reporting and cancellation for the core solvers.
+
+Every solver accepts callback=...; it is called with each iteration record as
+soon as the record is produced, whether or not records are kept (record=True).
+Raising SolveCancelled from the callback stops the solver; the exception
+propagates to the caller. Solvers that take trace=True also copy each record
+into a columnar core.trace.Trace.
+"""
+
+
+class SolveCancelled(Exception):
+    """Raised from a progress callback to stop a running solver."""
+
+
+class StepLog(list):
+    """Iteration records of one solve, reported to an optional callback as they are added.
+
+    With keep=False the records are only passed to the callback (and trace),
+    not stored.
+    """
+
+    def __init__(self, keep=True, callback=None, trace=None):
+        super().__init__()
+        self.keep = keep
+        self.callback = callback
+        self.trace = trace
+
+    @property
+    def enabled(self):
+        """True when a record would be stored or reported, i.e. worth building."""
+        return self.keep or self.callback is not None or self.trace is not None
+
+    def append(self, step):
+        if self.keep:
+            super().append(step)
+        if self.trace is not None:
+            self.trace.append(step)
+        if self.callback is not None:
+            self.callback(step)
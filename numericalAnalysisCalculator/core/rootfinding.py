@@ -0,0 +1,474 @@
+"""Headless root finders: bisection, false position, Brent, Newton (plain and
+safeguarded) and secant.
+
+Every solver takes a plain callable f (see core.expression.compile_function) and
+returns a RootResult. The approximate relative error is in percent, exactly as
+shown in the calculator windows. Pass record=False to skip building the
+per-iteration records when only the root is needed, and callback=... to
+receive each record as it is produced (see core.progress). With trace=True
+the records are also kept column by column in result.trace (see core.trace),
+which is far smaller than the record list for long runs.
+"""
+import math
+import sys
+from dataclasses import dataclass, field
+
+from numericalAnalysisCalculator.core.progress import StepLog
+from numericalAnalysisCalculator.core.trace import Trace
+
+# Brent's method keeps its bracket within this many halvings of bisection's, so it never
+# needs more than that many evaluations over bisection, whatever the multiplicity of the root
+BISECTION_SLACK = 1
+
+
+@dataclass
+class BracketStep:
+    """State of one bisection/false-position iteration."""
+    iteration: int
+    xl: float
+    xu: float
+    xr: float
+    f_xl: float
+    f_xu: float
+    f_xr: float
+    xr_old: float
+    error: float
+
+
+@dataclass
+class BrentStep(BracketStep):
+    """One Brent iteration: the bracket [xl, xu], the new point xr and how it was found.
+
+    xr_old is the best estimate b before the step (one end of the bracket), a is
+    the third point used for interpolation, and kind is 'inverse quadratic',
+    'secant', 'safeguarded' (an interpolated point moved toward the midpoint)
+    or 'bisection'.
+    """
+    a: float
+    f_a: float
+    kind: str
+
+
+@dataclass
+class NewtonStep:
+    """State of one Newton iteration."""
+    iteration: int
+    x: float
+    fx: float
+    dfx: float
+    error: float
+
+
+@dataclass
+class SafeguardedStep(NewtonStep):
+    """One safeguarded Newton iteration.
+
+    kind says how x was reached: 'start', 'newton', 'damped' (a Newton step
+    shortened by backtracking) or 'bisection'; xl and xu are the bracket after
+    the step, or None without one.
+    """
+    kind: str
+    xl: float
+    xu: float
+
+
+@dataclass
+class SecantStep:
+    """State of one secant iteration; iteration 0 holds the initial points."""
+    iteration: int
+    xi_minus1: float
+    xi: float
+    f_xi_minus1: float
+    f_xi: float
+    xi_plus1: float
+    f_xi_plus1: float
+    error: float
+
+
+@dataclass
+class RootResult:
+    """Outcome of a root finder."""
+    root: float
+    converged: bool
+    n_iter: int
+    iterations: list = field(default_factory=list)
+    message: str = ""
+    trace: Trace = None
+
+
+def relative_error(new, old):
+    """Approximate relative error |(new - old) / new| in percent."""
+    if old is None or new == 0:
+        return float('inf')
+    return abs((new - old) / new) * 100
+
+
+def _check_iterations(max_iter):
+    if max_iter <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+
+
+def _new_trace(record_class, trace):
+    return Trace.for_record(record_class) if trace else None
+
+
+def _bracketing(f, xl, xu, eps, max_iter, next_point, record, callback, trace, rescale=None):
+    """Shared loop of bisection and false position.
+
+    rescale(f_kept, f_replaced, f_new) gives the new function value of an
+    endpoint that is kept for the second iteration in a row (modified false
+    position); the records show the values actually used.
+    """
+    _check_iterations(max_iter)
+    if xl >= xu:
+        raise ValueError("Lower bound must be less than upper bound.")
+
+    f_xl = f(xl)
+    f_xu = f(xu)
+    if f_xl * f_xu >= 0:
+        raise ValueError("The function must have opposite signs at the bounds.")
+
+    steps = StepLog(record, callback, _new_trace(BracketStep, trace))
+    xrold = None
+    replaced = None  # endpoint replaced by the previous iteration
+    for iter_count in range(1, max_iter + 1):
+        xr = next_point(xl, xu, f_xl, f_xu)
+        f_xr = f(xr)
+        error = 0.0 if f_xr == 0 else relative_error(xr, xrold)
+
+        if steps.enabled:
+            steps.append(BracketStep(iter_count, xl, xu, xr, f_xl, f_xu, f_xr, xrold, error))
+
+        if error <= eps:
+            return RootResult(xr, True, iter_count, steps, trace=steps.trace)
+
+        # Keep the half that still brackets the root
+        if f_xl * f_xr < 0:
+            if rescale is not None and replaced == 'xu':
+                f_xl = rescale(f_xl, f_xu, f_xr)
+            xu, f_xu = xr, f_xr
+            replaced = 'xu'
+        else:
+            if rescale is not None and replaced == 'xl':
+                f_xu = rescale(f_xu, f_xl, f_xr)
+            xl, f_xl = xr, f_xr
+            replaced = 'xl'
+
+        xrold = xr
+
+    return RootResult(xrold, False, max_iter, steps,
+                      f"Maximum iterations ({max_iter}) reached without convergence.", steps.trace)
+
+
+def _bisection_point(xl, xu, f_xl, f_xu):
+    return (xl + xu) / 2.0
+
+
+def _false_position_point(xl, xu, f_xl, f_xu):
+    return xu - ((f_xu * (xl - xu)) / (f_xl - f_xu))
+
+
+def _illinois(f_kept, f_replaced, f_new):
+    return f_kept / 2
+
+
+def _pegasus(f_kept, f_replaced, f_new):
+    return f_kept * f_replaced / (f_replaced + f_new)
+
+
+def _anderson_bjorck(f_kept, f_replaced, f_new):
+    m = 1 - f_new / f_replaced
+    return f_kept * (m if m > 0 else 0.5)
+
+
+# Modified false position: how the value of an endpoint kept twice in a row is scaled down
+FALSE_POSITION_VARIANTS = {
+    'standard': None,
+    'illinois': _illinois,
+    'pegasus': _pegasus,
+    'anderson-bjorck': _anderson_bjorck,
+}
+
+
+def bisection(f, xl, xu, eps=1e-6, max_iter=100, record=True, callback=None, trace=False):
+    """Finds a root of f in [xl, xu] by halving the bracket."""
+    return _bracketing(f, xl, xu, eps, max_iter, _bisection_point, record, callback, trace)
+
+
+def false_position(f, xl, xu, eps=1e-6, max_iter=100, record=True, callback=None, trace=False,
+                   variant='standard'):
+    """Finds a root of f in [xl, xu] with regula falsi.
+
+    variant 'illinois', 'pegasus' or 'anderson-bjorck' scales down the function
+    value of an endpoint that stays fixed for two iterations in a row, so the
+    method does not stall on one side of a convex or concave f.
+    """
+    try:
+        rescale = FALSE_POSITION_VARIANTS[variant]
+    except KeyError:
+        raise ValueError(f"Unknown false position variant '{variant}'; "
+                         f"choose from {', '.join(FALSE_POSITION_VARIANTS)}") from None
+    return _bracketing(f, xl, xu, eps, max_iter, _false_position_point, record, callback, trace, rescale)
+
+
+def brent(f, xl, xu, eps=1e-6, max_iter=100, record=True, callback=None, trace=False, xtol=1e-12):
+    """Finds a root of f in [xl, xu] with Brent's method.
+
+    Each step tries inverse quadratic interpolation (a secant step when only two
+    distinct points are known) and falls back to bisection whenever the new point
+    would not shrink the bracket fast enough. The new point is also kept close
+    enough to the midpoint that the bracket is never wider than bisection's after
+    as many steps, give or take BISECTION_SLACK halvings ('safeguarded' steps):
+    on a multiple root, where interpolation converges only linearly, Brent then
+    costs no more than bisection. The root stays bracketed, so it is as safe as
+    bisection but usually converges superlinearly. Stops when the
+    relative error is at most eps percent, when x moves by at most the absolute
+    tolerance xtol (so a root at 0 converges too), or when the bracket cannot
+    get narrower.
+    """
+    _check_iterations(max_iter)
+    if xl >= xu:
+        raise ValueError("Lower bound must be less than upper bound.")
+
+    # b is the best estimate, c the other end of the bracket, a the previous b
+    a, b, c = xl, xu, xu
+    fa, fb = f(a), f(b)
+    fc = fb
+    if fa * fb >= 0:
+        raise ValueError("The function must have opposite signs at the bounds.")
+
+    steps = StepLog(record, callback, _new_trace(BrentStep, trace))
+    d = e = b - a
+    # Widest bracket allowed after the next step: bisection's, halved once per step
+    budget = (xu - xl) * 2 ** BISECTION_SLACK
+    for iter_count in range(1, max_iter + 1):
+        if (fb > 0) == (fc > 0):
+            # The root is between a and b: a becomes the other end of the bracket
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        # Smallest step that still changes b, relative to eps (percent) and machine precision,
+        # plus half of xtol as in zeroin
+        tol = 2 * sys.float_info.epsilon * abs(b) + 0.5 * eps / 100 * abs(b) + 0.5 * xtol + sys.float_info.min
+        m = 0.5 * (c - b)
+        if abs(m) <= tol:
+            return RootResult(b, True, iter_count - 1, steps, trace=steps.trace)
+
+        budget *= 0.5
+
+        kind = 'bisection'
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                kind = 'secant'
+                p, q = 2 * m * s, 1 - s
+            else:
+                kind = 'inverse quadratic'
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            # Accept the interpolated point only if it lies well inside the bracket
+            # and the steps keep shrinking; otherwise bisect
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                kind = 'bisection'
+        if kind == 'bisection':
+            d = e = m
+        # Points within radius of the midpoint b + m leave a bracket no wider than budget
+        radius = budget - abs(m)
+        if radius <= 0:
+            kind = 'bisection'
+            d = e = m
+        elif abs(d - m) > radius:
+            kind = 'safeguarded'
+            d = e = m + math.copysign(radius, d - m)
+
+        (xl, f_xl), (xu, f_xu) = sorted(((b, fb), (c, fc)))
+        a_used, fa_used, b_old = a, fa, b
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = f(b)
+        error = 0.0 if fb == 0 else relative_error(b, b_old)
+
+        if steps.enabled:
+            steps.append(BrentStep(iter_count, xl, xu, b, f_xl, f_xu, fb, b_old, error,
+                                   a_used, fa_used, kind))
+
+        if error <= eps or abs(b - b_old) <= xtol:
+            return RootResult(b, True, iter_count, steps, trace=steps.trace)
+
+    return RootResult(b, False, max_iter, steps,
+                      f"Maximum iterations ({max_iter}) reached without convergence.", steps.trace)
+
+
+def newton(f, df, x0, eps=1e-6, max_iter=100, record=True, callback=None, trace=False):
+    """Finds a root of f from x0 using the derivative df.
+
+    With df=None, f must return (f(x), f'(x)) from one call, as produced by
+    core.autodiff.compile_with_derivative.
+    """
+    _check_iterations(max_iter)
+    fdf = f if df is None else (lambda x: (f(x), df(x)))
+
+    steps = StepLog(record, callback, _new_trace(NewtonStep, trace))
+    x = x0
+    x_prev = 0
+    for i in range(max_iter):
+        fx, dfx = fdf(x)
+        if abs(dfx) < 1e-15:
+            return RootResult(x, False, i, steps, "Derivative is zero. Method cannot continue.", steps.trace)
+
+        x_next = x - (fx / dfx)
+        error = relative_error(x, x_prev)
+        x_prev = x
+
+        if steps.enabled:
+            steps.append(NewtonStep(i, x, fx, dfx, error))
+
+        if error < eps:
+            return RootResult(x, True, i + 1, steps, trace=steps.trace)
+
+        x = x_next
+
+    return RootResult(x, False, max_iter, steps,
+                      f"Maximum iterations ({max_iter}) reached without convergence.", steps.trace)
+
+
+def _try_point(fdf, x):
+    """(f(x), f'(x)), or NaNs where f cannot be evaluated, so the step is rejected."""
+    try:
+        return fdf(x)
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return math.nan, math.nan
+
+
+def safeguarded_newton(f, df, x0=None, xl=None, xu=None, eps=1e-6, max_iter=100, backtrack=True,
+                       max_backtracks=10, record=True, callback=None, trace=False):
+    """Newton's method that cannot run away from the root.
+
+    With a bracket [xl, xu] (f must change sign over it), a step that leaves
+    the bracket, meets a zero derivative or does not reduce |f| is replaced by
+    a bisection step, and the bracket shrinks around every new point; x0
+    defaults to the midpoint. With backtrack=True a Newton step that does not
+    reduce |f| is first halved up to max_backtracks times. Near a simple root
+    the full Newton step is always taken, so convergence stays quadratic.
+    df works as in newton().
+    """
+    _check_iterations(max_iter)
+    fdf = f if df is None else (lambda x: (f(x), df(x)))
+
+    steps = StepLog(record, callback, _new_trace(SafeguardedStep, trace))
+    bracketed = xl is not None and xu is not None
+    if bracketed:
+        if xl >= xu:
+            raise ValueError("Lower bound must be less than upper bound.")
+        f_xl = fdf(xl)[0]
+        f_xu = fdf(xu)[0]
+        if f_xl * f_xu > 0:
+            raise ValueError("The function must have opposite signs at the bounds.")
+        if f_xl == 0:
+            return RootResult(xl, True, 0, steps, trace=steps.trace)
+        if f_xu == 0:
+            return RootResult(xu, True, 0, steps, trace=steps.trace)
+        if x0 is None or not xl <= x0 <= xu:
+            x0 = (xl + xu) / 2
+    elif x0 is None:
+        raise ValueError("An initial guess or a bracket is required.")
+
+    x, kind = x0, 'start'
+    fx, dfx = fdf(x)
+    x_prev = 0
+    for i in range(max_iter):
+        # Shrink the bracket to the side of x that still changes sign
+        if bracketed:
+            if fx * f_xl > 0:
+                xl, f_xl = x, fx
+            else:
+                xu, f_xu = x, fx
+
+        error = 0.0 if fx == 0 else relative_error(x, x_prev)
+        if steps.enabled:
+            steps.append(SafeguardedStep(i, x, fx, dfx, error, kind,
+                                         xl if bracketed else None, xu if bracketed else None))
+        if error < eps:
+            return RootResult(x, True, i + 1, steps, trace=steps.trace)
+
+        x_next = None
+        if abs(dfx) >= 1e-15:
+            step = fx / dfx
+            x_next, kind = x - step, 'newton'
+            if bracketed and not xl <= x_next <= xu:
+                x_next = None
+            else:
+                f_next, df_next = _try_point(fdf, x_next)
+                # Steps below the tolerance are at rounding level and need not reduce |f|
+                if relative_error(x_next, x) >= eps:
+                    # Backtracking: halve the step until |f| decreases
+                    tries = max_backtracks if backtrack else 0
+                    while not abs(f_next) < abs(fx) and tries > 0:
+                        step /= 2
+                        x_next, kind = x - step, 'damped'
+                        f_next, df_next = _try_point(fdf, x_next)
+                        tries -= 1
+                    if not abs(f_next) < abs(fx):
+                        if not bracketed and not math.isfinite(f_next):
+                            return RootResult(x, False, i + 1, steps,
+                                              "The Newton step left the domain of f.", steps.trace)
+                        if bracketed:
+                            x_next = None
+
+        if x_next is None:
+            if not bracketed:
+                return RootResult(x, False, i + 1, steps, "Derivative is zero. Method cannot continue.",
+                                  steps.trace)
+            x_next, kind = (xl + xu) / 2, 'bisection'
+            f_next, df_next = fdf(x_next)
+
+        x_prev = x
+        x, fx, dfx = x_next, f_next, df_next
+
+    return RootResult(x, False, max_iter, steps,
+                      f"Maximum iterations ({max_iter}) reached without convergence.", steps.trace)
+
+
+def secant(f, xi_minus1, xi, eps=1e-6, max_iter=100, record=True, callback=None, trace=False):
+    """Finds a root of f from two starting points xi-1 and xi."""
+    _check_iterations(max_iter)
+    if xi_minus1 == xi:
+        raise ValueError("Initial guesses must be different.")
+
+    f_xi_minus1 = f(xi_minus1)
+    f_xi = f(xi)
+
+    steps = StepLog(record, callback, _new_trace(SecantStep, trace))
+    if steps.enabled:
+        steps.append(SecantStep(0, xi_minus1, xi, f_xi_minus1, f_xi, None, None, float('inf')))
+
+    for iter_count in range(1, max_iter + 1):
+        if abs(f_xi_minus1 - f_xi) < 1e-20:
+            return RootResult(xi, False, iter_count - 1, steps,
+                              "Division by zero detected in Secant Method.", steps.trace)
+
+        xi_plus1 = xi - (f_xi * (xi_minus1 - xi)) / (f_xi_minus1 - f_xi)
+        f_xi_plus1 = f(xi_plus1)
+        error = relative_error(xi_plus1, xi)
+
+        if steps.enabled:
+            steps.append(SecantStep(iter_count, xi_minus1, xi, f_xi_minus1, f_xi,
+                                    xi_plus1, f_xi_plus1, error))
+
+        if error <= eps:
+            return RootResult(xi_plus1, True, iter_count, steps, trace=steps.trace)
+
+        xi_minus1, f_xi_minus1 = xi, f_xi
+        xi, f_xi = xi_plus1, f_xi_plus1
+
+    return RootResult(xi, False, max_iter, steps,
+                      f"Maximum iterations ({max_iter}) reached without convergence.", steps.trace)
@@ -0,0 +1,198 @@
+"""Finding every root of f in [a, b]: a sign-change scan plus parallel refinement.
+
+    result = find_all_roots("4*x**3 - 6*x**2 + 7*x - 2.3", -10, 10)
+    result.roots        # every real root found, in increasing order
+    result.brackets     # the (xl, xu) subintervals they were refined from
+
+f is sampled on a grid of n subintervals (with NumPy in one call when f is an
+expression string or vectorized=True). Every subinterval whose end values
+differ in sign becomes a bracket, which is refined with bisection, false
+position, Brent or the secant method from core.rootfinding. The scan runs in
+this process by default. With more than one worker, and enough work to pay
+for starting the processes, the brackets are refined in a
+ProcessPoolExecutor, a chunk of brackets per task. Expression strings are
+compiled once in each worker process. A callable f must then be picklable,
+i.e. defined at module level.
+
+The scan cannot see a root where f touches zero without changing sign
+(a double root), or two roots inside one subinterval; a larger n resolves
+roots closer together. Sign changes across a pole, as for tan(x) at pi/2,
+are refined but then rejected because |f| grows instead of vanishing.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from numericalAnalysisCalculator.core.expression import compile_function, compile_vectorized
+from numericalAnalysisCalculator.core.rootfinding import RootResult, bisection, brent, false_position, secant
+
+# Method name -> refinement kernel; each is called as solver(f, xl, xu, eps, max_iter, ...)
+REFINE_METHODS = {
+    'bisection': bisection,
+    'false_position': false_position,
+    'brent': brent,
+    'secant': secant,
+}
+
+# Tasks per worker, so a few slow brackets do not leave the other processes idle
+CHUNKS_PER_WORKER = 4
+
+# Below these sizes a process pool costs more to start than it saves:
+# brackets to refine, and grid points when a scalar callable is sampled
+PARALLEL_MIN_BRACKETS = 16
+PARALLEL_MIN_POINTS = 20000
+
+# Errors a user function raises outside its domain, e.g. log(-1) or 1/0
+_DOMAIN_ERRORS = (ValueError, ZeroDivisionError, OverflowError)
+
+
+@dataclass
+class ScanResult:
+    """Roots found in [a, b] and the per-bracket results they came from."""
+    roots: list
+    results: list = field(default_factory=list)
+    brackets: list = field(default_factory=list)
+    n: int = 0
+
+
+# Expression strings compiled in this process, keyed by source
+_compiled = {}
+
+
+def _resolve(f):
+    """Returns a scalar callable for f, compiling an expression string once per process."""
+    if isinstance(f, str):
+        if f not in _compiled:
+            _compiled[f] = compile_function(f)
+        return _compiled[f]
+    return f
+
+
+def _sample_point(f, x):
+    try:
+        return float(f(x))
+    except _DOMAIN_ERRORS:
+        return math.nan
+
+
+def _sample_chunk(f, xs):
+    """Evaluates f at each of xs; points outside the domain of f give NaN."""
+    f = _resolve(f)
+    return [_sample_point(f, x) for x in xs]
+
+
+def _sample(f, x, vectorized, executor, workers):
+    """f on the whole grid x, as a float array."""
+    if isinstance(f, str) or vectorized:
+        g = compile_vectorized(f) if isinstance(f, str) else f
+        with np.errstate(all='ignore'):
+            return np.broadcast_to(np.asarray(g(x), dtype=float), x.shape)
+    if executor is None:
+        return np.array(_sample_chunk(f, x.tolist()))
+    chunks = np.array_split(x, workers * CHUNKS_PER_WORKER)
+    values = executor.map(_sample_chunk, [f] * len(chunks), [c.tolist() for c in chunks])
+    return np.concatenate([np.asarray(v, dtype=float) for v in values])
+
+
+def _refine(f, solver, bracket, eps, max_iter, record, options):
+    """Refines one (xl, xu, f(xl), f(xu)) bracket into a RootResult."""
+    xl, xu, f_xl, f_xu = bracket
+    try:
+        result = solver(f, xl, xu, eps, max_iter, record=record, **options)
+        f_root = f(result.root) if result.converged else 0.0
+    except _DOMAIN_ERRORS as e:
+        return RootResult(math.nan, False, 0, message=str(e))
+    if result.converged and not xl <= result.root <= xu:
+        result.converged = False
+        result.message = "The iterates left the bracket; the root belongs to another subinterval."
+    elif result.converged and abs(f_root) > max(abs(f_xl), abs(f_xu)):
+        result.converged = False
+        result.message = "f changes sign across a discontinuity here, not a root."
+    return result
+
+
+def _refine_chunk(f, method, brackets, eps, max_iter, record, options):
+    """Refines a list of brackets; runs in a worker process."""
+    f = _resolve(f)
+    solver = REFINE_METHODS[method]
+    return [_refine(f, solver, bracket, eps, max_iter, record, options) for bracket in brackets]
+
+
+def _chunks(items, count):
+    size = max(1, -(-len(items) // count))
+    return [(i, items[i:i + size]) for i in range(0, len(items), size)]
+
+
+def find_all_roots(f, a, b, n=1000, method='brent', eps=1e-6, max_iter=100, workers=1,
+                   vectorized=False, record=False, callback=None, **options):
+    """Returns a ScanResult with every root of f found by scanning [a, b] in n steps.
+
+    f is an expression string or a callable (vectorized=True if it accepts
+    NumPy arrays). workers is the number of processes: 1 (the default)
+    scans in this process, None uses one per core. A pool is only started
+    for large scans (see PARALLEL_MIN_BRACKETS). callback(result) receives each
+    bracket's RootResult as soon as it is refined, in completion order.
+    Extra keyword options are passed to the refinement method, e.g.
+    variant='illinois' for false position.
+    """
+    if method not in REFINE_METHODS:
+        raise ValueError(f"Unknown refinement method '{method}'; choose from {', '.join(REFINE_METHODS)}")
+    if a >= b:
+        raise ValueError("Lower bound must be less than upper bound.")
+    if n < 1:
+        raise ValueError("The number of subintervals must be a positive integer.")
+    if max_iter <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError("The number of workers must be a positive integer.")
+
+    x = np.linspace(a, b, n + 1)
+    executor = None
+    try:
+        # Scalar callables are sampled point by point, which is worth spreading over the pool
+        if workers > 1 and len(x) >= PARALLEL_MIN_POINTS and not (isinstance(f, str) or vectorized):
+            executor = ProcessPoolExecutor(workers)
+        fx = _sample(f, x, vectorized, executor, workers)
+
+        # Grid points where f is exactly zero are roots already
+        results = [RootResult(float(x[i]), True, 0, message="f is exactly zero at this grid point.")
+                   for i in np.flatnonzero(fx == 0)]
+        brackets = [(float(x[i]), float(x[i])) for i in np.flatnonzero(fx == 0)]
+        for result in results:
+            if callback is not None:
+                callback(result)
+
+        change = np.flatnonzero(np.sign(fx[:-1]) * np.sign(fx[1:]) < 0)
+        pending = [(float(x[i]), float(x[i + 1]), float(fx[i]), float(fx[i + 1])) for i in change]
+        refined = [None] * len(pending)
+
+        if workers > 1 and len(pending) >= PARALLEL_MIN_BRACKETS:
+            if executor is None:
+                executor = ProcessPoolExecutor(min(workers, len(pending)))
+            futures = {executor.submit(_refine_chunk, f, method, chunk, eps, max_iter, record, options): start
+                       for start, chunk in _chunks(pending, workers * CHUNKS_PER_WORKER)}
+            for future in as_completed(futures):
+                start = futures[future]
+                for offset, result in enumerate(future.result()):
+                    refined[start + offset] = result
+                    if callback is not None:
+                        callback(result)
+        else:
+            g = _resolve(f)
+            solver = REFINE_METHODS[method]
+            for i, bracket in enumerate(pending):
+                refined[i] = _refine(g, solver, bracket, eps, max_iter, record, options)
+                if callback is not None:
+                    callback(refined[i])
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    # Merge exact grid zeros and refined brackets in increasing x
+    merged = sorted(zip(brackets + [p[:2] for p in pending], results + refined), key=lambda item: item[0][0])
+    roots = sorted(r.root for _, r in merged if r.converged)
+    return ScanResult(roots, [r for _, r in merged], [bracket for bracket, _ in merged], n)
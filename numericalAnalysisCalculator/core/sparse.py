@@ -0,0 +1,260 @@
+"""Compressed sparse row matrices and a sparse LU factorization.
+
+    A = CSRMatrix.from_diagonals([-1, 2, -1], [-1, 0, 1], n=10000)
+    lu = SparseLU(A)            # reverse Cuthill-McKee ordering + threshold pivoting
+    x = lu.solve(b)
+
+Only the nonzeros are stored: values in data, their columns in indices, and
+row i in data[indptr[i]:indptr[i+1]]. SparseLU reorders the unknowns with
+reverse Cuthill-McKee, which gathers the nonzeros near the diagonal and so
+keeps the fill-in of elimination inside a narrow band. It then eliminates
+row by row on dictionaries of nonzeros. The pivot is the sparsest row whose
+entry is at least PIVOT_THRESHOLD times the largest in its column (threshold
+partial pivoting).
+"""
+from collections import deque
+
+import numpy as np
+
+# A candidate pivot must be at least this fraction of the largest entry in its column
+PIVOT_THRESHOLD = 0.1
+
+
+class CSRMatrix:
+    """n x m matrix in compressed sparse row form."""
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = tuple(shape)
+        if self.indptr.size != self.shape[0] + 1:
+            raise ValueError("indptr must have one entry per row plus one")
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype=float)
+        if A.ndim != 2:
+            raise ValueError("Matrix A must be two-dimensional")
+        rows, cols = np.nonzero(A)
+        return cls.from_coo(rows, cols, A[rows, cols], A.shape)
+
+    @classmethod
+    def from_coo(cls, rows, cols, values, shape):
+        """Builds the matrix from (row, column, value) triplets; duplicates are summed."""
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+        values = np.asarray(values, dtype=float)
+        order = np.lexsort((cols, rows))
+        rows, cols, values = rows[order], cols[order], values[order]
+        if rows.size:
+            # Sum duplicate entries
+            first = np.ones(rows.size, dtype=bool)
+            first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            starts = np.flatnonzero(first)
+            values = np.add.reduceat(values, starts)
+            rows, cols = rows[starts], cols[starts]
+        indptr = np.zeros(shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(values, cols, indptr, shape)
+
+    @classmethod
+    def from_diagonals(cls, diagonals, offsets, n):
+        """n x n matrix with constant or array diagonals at the given offsets (0 = main)."""
+        rows, cols, values = [], [], []
+        for diagonal, k in zip(diagonals, offsets):
+            i = np.arange(max(0, -k), min(n, n - k))
+            rows.append(i)
+            cols.append(i + k)
+            values.append(np.broadcast_to(np.asarray(diagonal, dtype=float), i.shape))
+        return cls.from_coo(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), (n, n))
+
+    @property
+    def nnz(self):
+        return self.data.size
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + self.indices.nbytes + self.indptr.nbytes
+
+    def row_indices(self):
+        """Row index of every stored entry."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def diagonal(self):
+        d = np.zeros(min(self.shape))
+        rows = self.row_indices()
+        on = rows == self.indices
+        d[rows[on]] = self.data[on]
+        return d
+
+    def to_dense(self):
+        A = np.zeros(self.shape)
+        A[self.row_indices(), self.indices] = self.data
+        return A
+
+    def transpose(self):
+        return CSRMatrix.from_coo(self.indices, self.row_indices(), self.data, self.shape[::-1])
+
+    def permute(self, perm):
+        """P A P^T for the ordering perm: row/column perm[i] of A becomes row/column i."""
+        inverse = np.empty_like(perm)
+        inverse[perm] = np.arange(perm.size)
+        return CSRMatrix.from_coo(inverse[self.row_indices()], inverse[self.indices], self.data, self.shape)
+
+    def __matmul__(self, x):
+        """A @ x for a vector or an (m, k) matrix x."""
+        x = np.asarray(x, dtype=float)
+        products = self.data.reshape((-1,) + (1,) * (x.ndim - 1)) * x[self.indices]
+        out = np.zeros((self.shape[0],) + x.shape[1:])
+        # Sum each row's run of products; reduceat needs the empty rows left out
+        starts = self.indptr[:-1]
+        nonempty = starts < self.indptr[1:]
+        if products.shape[0]:
+            out[nonempty] = np.add.reduceat(products, starts[nonempty], axis=0)
+        return out
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+def laplacian(m, dimensions=1):
+    """Finite-difference Laplacian -u'' on m points (1D, tridiagonal) or an m x m grid (2D, five-point).
+
+    Symmetric positive definite, with zero boundary values; the 2D matrix
+    has m^2 rows, ordered row by row through the grid.
+    """
+    if dimensions == 1:
+        return CSRMatrix.from_diagonals([-1, 2, -1], [-1, 0, 1], m)
+    if dimensions != 2:
+        raise ValueError("The Laplacian is built in 1 or 2 dimensions")
+    n = m * m
+    # Grid neighbours across the end of a grid row are not coupled
+    side = np.tile(np.r_[np.full(m - 1, -1.0), 0.0], m)[:n - 1]
+    return CSRMatrix.from_diagonals([-1, side, 4, side, -1], [-m, -1, 0, 1, m], n)
+
+
+def as_csr(A):
+    """A as a CSRMatrix (dense arrays are converted)."""
+    return A if isinstance(A, CSRMatrix) else CSRMatrix.from_dense(A)
+
+
+def reverse_cuthill_mckee(A):
+    """Ordering of the unknowns that narrows the band of the symmetric pattern of A."""
+    n = A.shape[0]
+    rows = A.row_indices()
+    # Neighbours in the pattern of A + A^T, without the diagonal
+    pattern = CSRMatrix.from_coo(np.concatenate([rows, A.indices]), np.concatenate([A.indices, rows]),
+                                 np.ones(2 * A.nnz), (n, n))
+    degree = np.diff(pattern.indptr)
+    neighbours = [pattern.indices[pattern.indptr[i]:pattern.indptr[i + 1]] for i in range(n)]
+
+    order = []
+    visited = np.zeros(n, dtype=bool)
+    # Each connected component starts from its node of lowest degree
+    for start in np.argsort(degree, kind='stable'):
+        if visited[start]:
+            continue
+        visited[start] = True
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            new = [j for j in neighbours[i] if not visited[j]]
+            new.sort(key=lambda j: degree[j])
+            for j in new:
+                visited[j] = True
+                queue.append(j)
+    return np.array(order[::-1], dtype=np.intp)
+
+
+class SparseLU:
+    """PAQ = LU of a sparse square matrix, reused for any number of right-hand sides.
+
+    Q is the fill-reducing column ordering (reverse Cuthill-McKee, or
+    ordering=None to keep the given order) and P the row pivoting. The
+    factors are kept as lists of nonzeros, so memory grows with the fill-in
+    rather than with n^2.
+    """
+
+    def __init__(self, A, ordering='rcm'):
+        A = as_csr(A)
+        n = A.shape[0]
+        if A.shape != (n, n):
+            raise ValueError("Matrix A must be square")
+        self.n = n
+        self.order = reverse_cuthill_mckee(A) if ordering == 'rcm' else np.arange(n)
+        A = A.permute(self.order)
+
+        rows = [dict(zip(A.indices[A.indptr[i]:A.indptr[i + 1]].tolist(),
+                         A.data[A.indptr[i]:A.indptr[i + 1]].tolist())) for i in range(n)]
+        col_rows = [set() for _ in range(n)]
+        for i, row in enumerate(rows):
+            for j in row:
+                col_rows[j].add(i)
+
+        # pivot_rows[k]: row eliminated at step k; eliminations[k]: (row, multiplier) pairs
+        self.pivot_rows = []
+        self.eliminations = []
+        self.upper = []
+        for k in range(n):
+            candidates = col_rows[k]
+            if not candidates:
+                raise ValueError(f"Zero pivot in column {k+1}: the matrix is singular")
+            largest = max(abs(rows[r][k]) for r in candidates)
+            if largest == 0:
+                raise ValueError(f"Zero pivot in column {k+1}: the matrix is singular")
+            p = min((r for r in candidates if abs(rows[r][k]) >= PIVOT_THRESHOLD * largest),
+                    key=lambda r: (len(rows[r]), r))
+            pivot_row = rows[p]
+            for j in pivot_row:
+                col_rows[j].discard(p)
+            pivot = pivot_row[k]
+            others = [(j, v) for j, v in pivot_row.items() if j != k]
+
+            eliminated = []
+            for r in list(candidates):
+                row = rows[r]
+                m = row.pop(k) / pivot
+                col_rows[k].discard(r)
+                for j, v in others:
+                    if j in row:
+                        row[j] -= m * v
+                    else:
+                        row[j] = -m * v
+                        col_rows[j].add(r)
+                eliminated.append((r, m))
+
+            self.pivot_rows.append(p)
+            self.eliminations.append(eliminated)
+            self.upper.append((pivot, others))
+            rows[p] = None
+
+    @property
+    def fill(self):
+        """Nonzeros in L and U together."""
+        return sum(len(e) for e in self.eliminations) + sum(1 + len(o) for _, o in self.upper)
+
+    def solve(self, b):
+        """Solves Ax = b for a vector or the columns of an (n, k) matrix b."""
+        b = np.asarray(b, dtype=float)
+        if b.shape[0] != self.n:
+            raise ValueError("Right-hand side must have one row per row of A")
+        # The unknowns and equations were both renumbered by the ordering
+        c = list(b[self.order])
+        for p, eliminated in zip(self.pivot_rows, self.eliminations):
+            cp = c[p]
+            for r, m in eliminated:
+                c[r] = c[r] - m * cp
+
+        y = [None] * self.n
+        for k in range(self.n - 1, -1, -1):
+            pivot, others = self.upper[k]
+            total = c[self.pivot_rows[k]]
+            for j, v in others:
+                total = total - v * y[j]
+            y[k] = total / pivot
+
+        x = np.empty_like(b)
+        x[self.order] = np.array(y)
+        return x
@@ -0,0 +1,226 @@
+"""Streams problems from JSONL or CSV through the batch solvers and writes the results.
+
+    python -m numericalAnalysisCalculator problems.jsonl -o results.jsonl --workers 4
+
+    for result in solve_stream(read_jsonl(open('problems.jsonl'))): ...
+
+Each problem names its method and gives the solver's keyword arguments, as
+in core.batch.solve_batch:
+
+    {"method": "bisection", "f": "x**2 - 2", "xl": 0, "xu": 2, "eps": 1e-8}
+    {"method": "newton", "f": "cos(x) - x", "x0": 1}
+    {"method": "lu", "A": [[4, 1], [1, 3]], "b": [1, 2]}
+    {"method": "newton_system", "F": ["x**2 + y**2 - 4", "exp(x) + y - 1"], "variables": ["x", "y"], "x0": [1, -1]}
+
+An optional "id" is copied to the result. In CSV the columns are these keys;
+numbers are converted, cells holding JSON lists (matrices, vectors) are
+decoded and empty cells are left out, so one file can mix methods.
+
+Every stage is a generator: problems are read, solved and written one at a
+time, so memory stays constant however long the input is. Each result is a
+dict with the input position "index", the method, the id if given and the
+fields of the solver's result (a field named like one of these, or like
+"error", is written as result_<name>). Iteration records, traces and factor
+matrices are left out, and non-finite numbers become null. A problem that
+fails gives an "error" entry instead of stopping the run.
+
+With workers > 1, chunks of chunk_size problems are solved in a process
+pool, at most PREFETCH chunks per worker at a time. Results are yielded as
+chunks finish, so their order may differ from the input; "index" gives the
+original position.
+"""
+import csv
+import json
+import math
+import os
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import fields, is_dataclass
+from itertools import islice
+
+from numericalAnalysisCalculator.core.batch import call_solver, get_solver, prepare
+
+CHUNK_SIZE = 256
+
+# Chunks queued per worker, so the pool never waits for input and the input is never read far ahead
+PREFETCH = 2
+
+# Compiled expressions kept per process; the least recently used are dropped first
+COMPILE_CACHE_SIZE = 1024
+
+# Result fields that are not written: per-iteration records, traces and factors, so that
+# every linear method writes the same fields whether or not it formed its factors
+SKIPPED_FIELDS = ('iterations', 'steps', 'trace', 'U', 'L', 'P', 'factors')
+
+# Keys of a problem that are not solver arguments
+META_KEYS = ('method', 'id')
+
+# Keys of a result record; solver result fields with these names get a result_ prefix
+RECORD_KEYS = ('index', 'method', 'id', 'error')
+
+# Marks a value that is not written, such as a matrix of factors
+_OMIT = object()
+
+
+class _CompiledCache(OrderedDict):
+    """The compiled dict of core.batch.prepare, bounded to the most recently used entries."""
+
+    def __init__(self, size=COMPILE_CACHE_SIZE):
+        super().__init__()
+        self.size = size
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.size:
+            self.popitem(last=False)
+
+
+def read_jsonl(lines):
+    """Yields one problem dict per non-blank line of JSON; a bad line yields {'error': ...}."""
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            problem = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {'error': f"line {number}: {e}"}
+            continue
+        yield problem if isinstance(problem, dict) else {'error': f"line {number}: not a JSON object"}
+
+
+def _convert(cell):
+    """A CSV cell as a number, a decoded JSON list or the string itself."""
+    text = cell.strip()
+    for parse in (int, float):
+        try:
+            return parse(text)
+        except ValueError:
+            pass
+    if text.startswith('['):
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass
+    return text
+
+
+def read_csv(lines):
+    """Yields one problem dict per CSV row, keyed by the header row."""
+    for row in csv.DictReader(lines):
+        yield {key.strip(): _convert(value) for key, value in row.items()
+               if key and value is not None and value.strip()}
+
+
+def _plain(value):
+    """value as JSON-ready data, or _OMIT when it is not written."""
+    if is_dataclass(value):
+        return {f.name: _plain(getattr(value, f.name)) for f in fields(value)}
+    if hasattr(value, 'ndim'):
+        # NumPy arrays and scalars: vectors and numbers only, not matrices
+        return _plain(value.tolist()) if value.ndim <= 1 else _OMIT
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    return _OMIT
+
+
+def result_record(result):
+    """The fields of a solver result worth writing, as plain data."""
+    record = {}
+    for f in fields(result):
+        if f.name in SKIPPED_FIELDS:
+            continue
+        value = _plain(getattr(result, f.name))
+        if value is not _OMIT:
+            record[f.name] = value
+    return record
+
+
+def solve_problem(index, problem, compiled):
+    """Solves one problem dict; returns its result record, or one with 'error' if it failed."""
+    out = {'index': index, 'method': problem.get('method')}
+    if 'id' in problem:
+        out['id'] = problem['id']
+    if 'error' in problem:
+        out['error'] = problem['error']
+        return out
+    try:
+        method = problem['method']
+        solver = get_solver(method)
+        kwargs = prepare(method, {k: v for k, v in problem.items() if k not in META_KEYS}, compiled)
+        for key, value in result_record(call_solver(solver, kwargs)).items():
+            # A result field named like a record key (StructuredResult.method,
+            # OptimumResult.error) becomes result_<name>
+            out[f"result_{key}" if key in RECORD_KEYS else key] = value
+    except KeyError as e:
+        out['error'] = f"missing {e}"
+    except Exception as e:
+        out['error'] = f"{type(e).__name__}: {e}"
+    return out
+
+
+# Compiled expressions of a pool worker process, reused across its chunks
+_worker_compiled = None
+
+
+def _solve_chunk(chunk):
+    global _worker_compiled
+    if _worker_compiled is None:
+        _worker_compiled = _CompiledCache()
+    return [solve_problem(index, problem, _worker_compiled) for index, problem in chunk]
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def solve_stream(problems, workers=1, chunk_size=CHUNK_SIZE):
+    """Yields a result record for each problem dict; workers=None uses every CPU."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+    numbered = enumerate(problems)
+    if workers == 1:
+        compiled = _CompiledCache()
+        for index, problem in numbered:
+            yield solve_problem(index, problem, compiled)
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = set()
+        for chunk in _chunks(numbered, chunk_size):
+            pending.add(executor.submit(_solve_chunk, chunk))
+            if len(pending) >= workers * PREFETCH:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def write_jsonl(results, out):
+    """Writes each result record as one line of JSON; returns (count, failed)."""
+    count = failed = 0
+    for record in results:
+        out.write(json.dumps(record) + '\n')
+        count += 1
+        failed += 'error' in record
+    out.flush()
+    return count, failed
@@ -0,0 +1,142 @@
+"""Storage-aware Ax = b: picks the tridiagonal, banded, sparse or dense solver from A.
+
+    result = solve_structured(A, b)     # A dense or a core.sparse.CSRMatrix
+    result.method, result.x
+    factors = factorize(A)              # reuse for more right-hand sides: factors.solve(B)
+
+analyze() measures the bandwidth, the number of nonzeros and the diagonal
+dominance without forming a dense copy of a CSRMatrix. The choice is:
+
+- 'tridiagonal': bandwidth (1, 1) and diagonally dominant -> Thomas algorithm
+- 'banded': a narrow band (l + u + 1 <= BAND_LIMIT * n) and diagonally
+  dominant -> band LU without pivoting
+- 'sparse': few nonzeros per row (density <= SPARSE_DENSITY) -> sparse LU
+  with fill-reducing ordering and threshold pivoting
+- 'dense': everything else -> core.linear.LUFactorization
+
+Band and tridiagonal solvers skip pivoting, which needs the dominance test.
+A banded matrix that fails it goes to the sparse LU, whose fill stays
+inside a band after reordering.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from numericalAnalysisCalculator.core.banded import BandedLU, thomas
+from numericalAnalysisCalculator.core.linear import LUFactorization
+from numericalAnalysisCalculator.core.sparse import CSRMatrix, SparseLU, as_csr
+
+# Largest band (l + u + 1) as a share of n for which band storage pays off
+BAND_LIMIT = 0.25
+
+# Largest share of nonzero entries for the sparse path
+SPARSE_DENSITY = 0.05
+
+METHODS = ('tridiagonal', 'banded', 'sparse', 'dense')
+
+
+@dataclass
+class Structure:
+    """Shape of the nonzeros of a square matrix."""
+    n: int
+    nnz: int
+    lower: int
+    upper: int
+    diagonally_dominant: bool
+
+    @property
+    def density(self):
+        return self.nnz / (self.n * self.n) if self.n else 1.0
+
+
+@dataclass
+class StructuredResult:
+    """Solution of Ax = b and the solver that produced it."""
+    x: np.ndarray
+    method: str
+    structure: Structure
+    factor_bytes: int = 0
+
+
+def analyze(A):
+    """Returns the Structure of A (dense array or CSRMatrix)."""
+    A = as_csr(A)
+    n = A.shape[0]
+    if A.shape != (n, n):
+        raise ValueError("Matrix A must be square")
+    rows = A.row_indices()
+    nonzero = A.data != 0
+    offsets = A.indices[nonzero] - rows[nonzero]
+    lower = int(max(0, -offsets.min())) if offsets.size else 0
+    upper = int(max(0, offsets.max())) if offsets.size else 0
+
+    # Row or column diagonal dominance: |a_ii| >= sum of the other |a_ij|
+    magnitude = np.abs(A.data)
+    diagonal = np.abs(A.diagonal())
+    row_sums = np.bincount(rows, weights=magnitude, minlength=n) - diagonal
+    col_sums = np.bincount(A.indices, weights=magnitude, minlength=n) - diagonal
+    dominant = bool(np.all(diagonal > 0) and (np.all(diagonal >= row_sums) or np.all(diagonal >= col_sums)))
+    return Structure(n, int(nonzero.sum()), lower, upper, dominant)
+
+
+def choose_method(structure):
+    """Name of the solver used for a matrix with this Structure."""
+    s = structure
+    if s.n > 2 and s.diagonally_dominant:
+        if s.lower <= 1 and s.upper <= 1:
+            return 'tridiagonal'
+        if s.lower + s.upper + 1 <= BAND_LIMIT * s.n:
+            return 'banded'
+    if s.density <= SPARSE_DENSITY:
+        return 'sparse'
+    return 'dense'
+
+
+class _Tridiagonal:
+    """Thomas algorithm behind the same solve(B) interface as the other factorizations."""
+
+    def __init__(self, A):
+        A = as_csr(A)
+        n = A.shape[0]
+        rows = A.row_indices()
+        # band[k + 1, i] = A[i, i + k] for k = -1, 0, 1
+        band = np.zeros((3, n))
+        band[A.indices - rows + 1, rows] = A.data
+        self.lower, self.diagonal, self.upper = band[0, 1:], band[1], band[2, :-1]
+        self.nbytes = band.nbytes
+
+    def solve(self, B):
+        return thomas(self.lower, self.diagonal, self.upper, B)
+
+
+def factorize(A, method='auto'):
+    """Factors A with the chosen (or named) solver; returns (factors, method, structure)."""
+    structure = analyze(A)
+    if method == 'auto':
+        method = choose_method(structure)
+    if method == 'tridiagonal':
+        factors = _Tridiagonal(A)
+    elif method == 'banded':
+        factors = BandedLU.from_csr(as_csr(A), structure.lower, structure.upper)
+    elif method == 'sparse':
+        factors = SparseLU(A)
+    elif method == 'dense':
+        factors = LUFactorization(A.to_dense() if isinstance(A, CSRMatrix) else A)
+    else:
+        raise ValueError(f"Unknown method '{method}'; choose from auto, {', '.join(METHODS)}")
+    return factors, method, structure
+
+
+def solve_structured(A, b, method='auto'):
+    """Solves Ax = b with the solver suited to the structure of A."""
+    factors, method, structure = factorize(A, method)
+    b = np.asarray(b, dtype=float)
+    if b.shape[0] != structure.n:
+        raise ValueError("Vector b must have one entry per row of A")
+    if isinstance(factors, SparseLU):
+        factor_bytes = 16 * factors.fill
+    elif isinstance(factors, LUFactorization):
+        factor_bytes = factors.lu.nbytes
+    else:
+        factor_bytes = factors.nbytes
+    return StructuredResult(factors.solve(b), method, structure, factor_bytes)
@@ -0,0 +1,222 @@
+"""Nonlinear systems F(x) = 0: Newton's method and Broyden's quasi-Newton method.
+
+    F = compile_system(["x**2 + y**2 - 4", "exp(x) + y - 1"], ('x', 'y'))
+    result = newton_system(F, [1.0, -1.0])
+    result = newton_system(F, [1.0, -1.0], method='broyden')
+
+Each Newton step solves J dx = -F(x) with core.linear.LUFactorization. The
+Jacobian J comes from a callable jacobian(x) when one is given, otherwise
+from forward differences, one column per unknown. When F accepts a matrix of
+points as columns (vectorized=True, as compile_system produces), a whole
+batch of columns costs one call of F.
+
+Broyden's method forms and factors J only at the start (and on a restart).
+After each step it applies a rank-one update to the inverse, kept as
+H = J0^-1 + sum of u w^T. A step then costs one LU solve with the original
+factors plus O(n) per update instead of a new O(n^3) factorization.
+
+The error is the relative change of x in percent (max norm), as in the
+scalar solvers, and a zero residual also counts as converged.
+"""
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from numericalAnalysisCalculator.core.expression import compile_vectorized
+from numericalAnalysisCalculator.core.linear import LUFactorization
+from numericalAnalysisCalculator.core.progress import StepLog
+from numericalAnalysisCalculator.core.trace import Trace
+
+# Relative finite-difference step, about sqrt(machine epsilon)
+FD_STEP = 1.4901161193847656e-08
+
+# Broyden updates kept before the Jacobian is formed and factored again
+MAX_UPDATES = 30
+
+
+@dataclass
+class SystemStep:
+    """State of one iteration; x is a copy of the iterate."""
+    iteration: int
+    x: np.ndarray
+    residual: float
+    step: float
+    error: float
+    jacobian: str
+
+
+@dataclass
+class SystemResult:
+    """Outcome of a nonlinear system solve."""
+    x: np.ndarray
+    converged: bool
+    n_iter: int
+    iterations: list = field(default_factory=list)
+    message: str = ""
+    trace: Trace = None
+    evaluations: int = 0
+    jacobians: int = 0
+
+
+def compile_system(sources, variables):
+    """Compiles one expression per equation into F(x) -> array.
+
+    x may be one point of shape (n,) or a batch of points as the columns of
+    an (n, k) array, in which case F returns an (m, k) array.
+    """
+    variables = tuple(variables)
+    funcs = [compile_vectorized(source, variables) for source in sources]
+
+    def F(x):
+        x = np.asarray(x, dtype=float)
+        values = [np.broadcast_to(np.asarray(f(*x), dtype=float), x.shape[1:]) for f in funcs]
+        return np.stack(values)
+
+    F.vectorized = True
+    return F
+
+
+def finite_difference_jacobian(F, x, fx=None, vectorized=False, batch=None):
+    """Forward-difference Jacobian of F at x, one column per unknown.
+
+    With vectorized=True, F is called once for each batch of columns (all n
+    by default); otherwise once per column.
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.size
+    fx = np.asarray(F(x) if fx is None else fx, dtype=float)
+    h = FD_STEP * np.maximum(np.abs(x), 1.0)
+    # Use the step actually representable in floating point
+    h = (x + h) - x
+    J = np.empty((fx.size, n))
+    if not vectorized:
+        for j in range(n):
+            xj = x.copy()
+            xj[j] += h[j]
+            J[:, j] = (np.asarray(F(xj), dtype=float) - fx) / h[j]
+        return J
+    batch = batch or n
+    for start in range(0, n, batch):
+        cols = np.arange(start, min(start + batch, n))
+        X = np.repeat(x[:, None], cols.size, axis=1)
+        X[cols, np.arange(cols.size)] += h[cols]
+        J[:, cols] = (np.asarray(F(X), dtype=float) - fx[:, None]) / h[cols]
+    return J
+
+
+class _BroydenInverse:
+    """H = J0^-1 + sum(u w^T), applied through the LU factors of J0."""
+
+    def __init__(self, lu):
+        self.lu = lu
+        self.us = []
+        self.ws = []
+
+    def solve(self, v):
+        """H v."""
+        out = self.lu.solve(v)
+        for u, w in zip(self.us, self.ws):
+            out += u * (w @ v)
+        return out
+
+    def solve_transposed(self, v):
+        """H^T v."""
+        out = self.lu.solve(v, trans=True)
+        for u, w in zip(self.us, self.ws):
+            out += w * (u @ v)
+        return out
+
+    def update(self, dx, dF):
+        """Good Broyden update of the inverse; returns False if it would be singular."""
+        H_dF = self.solve(dF)
+        denominator = dx @ H_dF
+        if denominator == 0 or not np.isfinite(denominator):
+            return False
+        self.ws.append(self.solve_transposed(dx))
+        self.us.append((dx - H_dF) / denominator)
+        return True
+
+
+def newton_system(F, x0, jacobian=None, eps=1e-8, max_iter=50, method='newton', vectorized=None,
+                  record=True, callback=None, trace=False):
+    """Solves F(x) = 0 from x0 with Newton's method or method='broyden'.
+
+    jacobian(x) gives the exact Jacobian; without it finite differences are
+    used, batched over columns when F is vectorized (the default for
+    functions from compile_system).
+    """
+    if method not in ('newton', 'broyden'):
+        raise ValueError(f"Unknown method '{method}'; choose 'newton' or 'broyden'")
+    if max_iter <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+    if vectorized is None:
+        vectorized = getattr(F, 'vectorized', False)
+
+    evaluations = 0
+
+    def evaluate(x):
+        nonlocal evaluations
+        evaluations += 1
+        return np.asarray(F(x), dtype=float)
+
+    def form_jacobian(x, fx):
+        nonlocal evaluations
+        if jacobian is not None:
+            return np.asarray(jacobian(x), dtype=float), 'analytic'
+        n = x.size
+        evaluations += 1 if vectorized else n
+        return finite_difference_jacobian(F, x, fx, vectorized), 'finite difference'
+
+    x = np.array(x0, dtype=float).ravel()
+    fx = evaluate(x)
+    if fx.shape != x.shape:
+        raise ValueError("The system must have as many equations as unknowns")
+
+    steps = StepLog(record, callback, Trace.for_record(SystemStep) if trace else None)
+    jacobians = 0
+    inverse = None
+    kind = 'start'
+    error = float('inf')
+    for i in range(max_iter):
+        residual = np.abs(fx).max()
+        if steps.enabled:
+            steps.append(SystemStep(i, x.copy(), residual, 0.0 if i == 0 else step_norm, error, kind))
+        if residual == 0 or error <= eps:
+            return SystemResult(x, True, i, steps, trace=steps.trace,
+                                evaluations=evaluations, jacobians=jacobians)
+
+        if method == 'newton' or inverse is None or len(inverse.us) >= MAX_UPDATES:
+            J, kind = form_jacobian(x, fx)
+            jacobians += 1
+            try:
+                lu = LUFactorization(J)
+            except ValueError:
+                return SystemResult(x, False, i, steps, "The Jacobian is singular.", steps.trace,
+                                    evaluations, jacobians)
+            inverse = _BroydenInverse(lu)
+        else:
+            kind = 'broyden'
+
+        dx = -inverse.solve(fx)
+        if not np.all(np.isfinite(dx)):
+            return SystemResult(x, False, i, steps, "The Jacobian is singular.", steps.trace,
+                                evaluations, jacobians)
+        x_new = x + dx
+        fx_new = evaluate(x_new)
+
+        step_norm = np.abs(dx).max()
+        scale = np.abs(x_new).max()
+        error = step_norm / scale * 100 if scale else float('inf')
+        if method == 'broyden':
+            # Start again from a fresh Jacobian if the residual grew or the update failed
+            if np.abs(fx_new).max() > residual or not inverse.update(dx, fx_new - fx):
+                inverse = None
+        x, fx = x_new, fx_new
+
+    residual = np.abs(fx).max()
+    if steps.enabled:
+        steps.append(SystemStep(max_iter, x.copy(), residual, step_norm, error, kind))
+    converged = residual == 0 or error <= eps
+    return SystemResult(x, converged, max_iter, steps,
+                        "" if converged else f"Maximum iterations ({max_iter}) reached without convergence.",
+                        steps.trace, evaluations, jacobians)
@@ -0,0 +1,94 @@
+"""Compact, columnar storage for iteration records.
+
+A Trace keeps one typed array per field of a record class instead of one
+Python object per iteration, so a million bisection steps take about 72 MB
+(nine 8-byte columns) rather than gigabytes of objects and strings:
+
+    result = bisection(f, 0, 1, eps=1e-12, max_iter=10**6, record=False, trace=True)
+    result.trace.column('xr')        # array('d', [...])
+    result.trace[3]                  # {'iteration': 4, 'xl': ..., ...}
+    result.trace.to_csv('run.csv')
+
+Columns are array('d') (array('q') for int fields), which over-allocate on
+append so growth is geometric and amortized O(1). Missing values (None,
+e.g. xr_old on the first bisection step) are stored as NaN. Fields that are
+neither int nor float, such as GoldenStep.keep, are not stored.
+"""
+import csv
+import math
+from array import array
+from dataclasses import fields
+
+_TYPECODES = {int: 'q', 'int': 'q', float: 'd', 'float': 'd'}
+
+
+class Trace:
+    """Per-field arrays holding the numeric state of every iteration."""
+
+    def __init__(self, names, typecodes=None):
+        self.names = tuple(names)
+        typecodes = typecodes or ['d'] * len(self.names)
+        self.columns = {name: array(code) for name, code in zip(self.names, typecodes)}
+        self._arrays = [self.columns[name] for name in self.names]
+
+    @classmethod
+    def for_record(cls, record_class):
+        """Trace with one column per int/float field of a record dataclass."""
+        names, codes = [], []
+        for f in fields(record_class):
+            if f.type in _TYPECODES:
+                names.append(f.name)
+                codes.append(_TYPECODES[f.type])
+        return cls(names, codes)
+
+    def append(self, record):
+        """Stores the fields of one record object."""
+        for name, column in zip(self.names, self._arrays):
+            value = getattr(record, name)
+            column.append(math.nan if value is None else value)
+
+    def append_row(self, *values):
+        """Stores one iteration given as values in column order."""
+        for value, column in zip(values, self._arrays):
+            column.append(math.nan if value is None else value)
+
+    def __len__(self):
+        return len(self._arrays[0]) if self._arrays else 0
+
+    def column(self, name):
+        """The array holding field name for every iteration."""
+        return self.columns[name]
+
+    def __getitem__(self, index):
+        """One iteration as a {field: value} dict."""
+        return {name: column[index] for name, column in zip(self.names, self._arrays)}
+
+    def rows(self):
+        """Yields each iteration as a tuple in column order."""
+        return zip(*self._arrays)
+
+    @property
+    def nbytes(self):
+        """Memory used by the stored values."""
+        return sum(column.itemsize * len(column) for column in self._arrays)
+
+    def to_dict(self):
+        """{field: list of values}, e.g. for json.dump."""
+        return {name: column.tolist() for name, column in self.columns.items()}
+
+    def to_numpy(self):
+        """{field: ndarray} viewing the columns without copying (requires NumPy).
+
+        The trace cannot grow while these views are alive.
+        """
+        import numpy as np
+        return {name: np.frombuffer(column, dtype=column.typecode) for name, column in self.columns.items()}
+
+    def to_csv(self, file):
+        """Writes a header row and one row per iteration to a path or open file."""
+        if isinstance(file, str):
+            with open(file, 'w', newline='') as fh:
+                return self.to_csv(fh)
+        writer = csv.writer(file)
+        writer.writerow(self.names)
+        writer.writerows(self.rows())
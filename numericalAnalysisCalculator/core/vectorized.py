@@ -0,0 +1,105 @@
+"""Vectorized bisection and false position over many brackets at once.
+
+Each lane is one (xl, xu) bracket, optionally with its own parameter values
+p for f(x, p). All active lanes advance together with NumPy array updates;
+a lane drops out of the working set as soon as it converges, so converged
+lanes are never evaluated again. f must accept arrays, e.g.
+
+    f = compile_vectorized("x**2 - p", ('x', 'p'))
+    res = bisection_batch(f, 0.0, 10.0, eps=1e-8, params=(np.linspace(1, 100, 100000),))
+
+Lanes whose bracket is invalid (xl >= xu or no sign change) are reported with
+n_iter 0, converged False and a NaN root instead of raising.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class BatchRootResult:
+    """Per-lane roots, convergence flags and iteration counts, shaped like the input."""
+    root: np.ndarray
+    converged: np.ndarray
+    n_iter: np.ndarray
+    valid: np.ndarray
+
+
+def _evaluate(f, x, params):
+    return np.broadcast_to(np.asarray(f(x, *params), dtype=float), x.shape)
+
+
+def _bracketing_batch(f, xl, xu, eps, max_iter, params, next_point):
+    """Shared vectorized loop; mirrors rootfinding._bracketing lane by lane."""
+    if max_iter <= 0:
+        raise ValueError("Maximum iterations must be a positive integer.")
+
+    arrays = np.broadcast_arrays(np.asarray(xl, dtype=float), np.asarray(xu, dtype=float),
+                                 *[np.asarray(p, dtype=float) for p in params])
+    shape = arrays[0].shape
+    xl, xu, *params = [a.ravel().copy() for a in arrays]
+    n = xl.size
+
+    root = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    n_iter = np.zeros(n, dtype=int)
+
+    f_xl = _evaluate(f, xl, params).copy()
+    f_xu = _evaluate(f, xu, params).copy()
+    valid = (xl < xu) & (f_xl * f_xu < 0)
+
+    # Working set: compacted state of the lanes still iterating
+    lanes = np.flatnonzero(valid)
+    xl, xu, f_xl, f_xu = xl[lanes], xu[lanes], f_xl[lanes], f_xu[lanes]
+    params = [p[lanes] for p in params]
+    xrold = np.full(lanes.size, np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for iter_count in range(1, max_iter + 1):
+            if lanes.size == 0:
+                break
+
+            xr = next_point(xl, xu, f_xl, f_xu)
+            f_xr = _evaluate(f, xr, params)
+            error = np.where(f_xr == 0, 0.0,
+                             np.where(np.isnan(xrold) | (xr == 0), np.inf,
+                                      np.abs((xr - xrold) / xr) * 100))
+
+            root[lanes] = xr
+            n_iter[lanes] = iter_count
+            done = error <= eps
+            converged[lanes[done]] = True
+
+            # Keep the half that still brackets the root
+            left = f_xl * f_xr < 0
+            xu = np.where(left, xr, xu)
+            f_xu = np.where(left, f_xr, f_xu)
+            xl = np.where(left, xl, xr)
+            f_xl = np.where(left, f_xl, f_xr)
+            xrold = xr
+
+            if done.any():
+                keep = ~done
+                lanes, xl, xu, f_xl, f_xu, xrold = (a[keep] for a in (lanes, xl, xu, f_xl, f_xu, xrold))
+                params = [p[keep] for p in params]
+
+    return BatchRootResult(root.reshape(shape), converged.reshape(shape),
+                           n_iter.reshape(shape), valid.reshape(shape))
+
+
+def _bisection_point(xl, xu, f_xl, f_xu):
+    return (xl + xu) / 2.0
+
+
+def _false_position_point(xl, xu, f_xl, f_xu):
+    return xu - ((f_xu * (xl - xu)) / (f_xl - f_xu))
+
+
+def bisection_batch(f, xl, xu, eps=1e-6, max_iter=100, params=()):
+    """Bisection on every (xl, xu[, params]) lane; inputs broadcast against each other."""
+    return _bracketing_batch(f, xl, xu, eps, max_iter, params, _bisection_point)
+
+
+def false_position_batch(f, xl, xu, eps=1e-6, max_iter=100, params=()):
+    """False position on every (xl, xu[, params]) lane; inputs broadcast against each other."""
+    return _bracketing_batch(f, xl, xu, eps, max_iter, params, _false_position_point)
@@ -1,38 +1,32 @@
-import tkinter as tk
 from tkinter import ttk
-from calculators import BisectUPdated, FalsePosUpdated, newton, secantUpdated, GE, LUDec, goldenSectionSearch
+from numericalAnalysisCalculator import registry
+from numericalAnalysisCalculator.calculators import windows
+
 
 class CalculatorApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Calculator Launcher")
-        self.root.geometry("400x400")
+        # Room for the title and every button
+        self.root.geometry(f"400x{80 + 48 * len(registry.windows())}")
         
         self.create_widgets()
     
     def create_widgets(self):
         ttk.Label(self.root, text="Select Calculator Type", font=('Arial', 16)).pack(pady=20)
         
-        # Create buttons for each calculator
-        calculators = [
-            ("Bisection Method", BisectUPdated.run),
-            ("The False Position Method", FalsePosUpdated.run),
-            ("Newton Method", newton.run),
-            ("Secant Method", secantUpdated.run),
-            ("Gauss Elimination", GE.run),
-            ("LU Decomposistion", LUDec.run),
-            ("Golden-Section Search", goldenSectionSearch.run)
-        ]
-        
-        for name, command in calculators:
+        # One button per window in the registry; its module is imported and its window built on the
+        # first click, later clicks re-show that same window
+        for method in registry.windows():
             ttk.Button(
                 self.root, 
-                text=name, 
-                command=command,
+                text=method.label, 
+                command=method.open_window,
                 width=40
             ).pack(pady=10)
 
 if __name__ == "__main__":
-    root = tk.Tk()
+    # The shared root: calculator windows are Toplevels of it and run in this one mainloop
+    root = windows.get_root()
     app = CalculatorApp(root)
     root.mainloop()
\ No newline at end of file
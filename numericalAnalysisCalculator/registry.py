@@ -0,0 +1,166 @@
+"""Registry of the calculator methods: name, headless solver, window and capabilities.
+
+The launcher, the command line and the benchmarks all list methods from
+here. Solvers and windows are given as 'module:attribute' paths and are only
+imported when first used, so the registry itself loads no calculator code:
+
+    from numericalAnalysisCalculator import registry
+    registry.get('bisection').load_solver()
+    [m.name for m in registry.methods(kind='root', capability=registry.DERIVATIVE)]
+
+A plugin registers further methods with the decorator (or register()):
+
+    from numericalAnalysisCalculator.registry import BATCH, BRACKETING, method
+
+    @method('ridders', kind='root', capabilities=(BRACKETING, BATCH))
+    def ridders(f, xl, xu, eps=1e-6, max_iter=100, record=True, callback=None, trace=False): ...
+
+Plugin modules are listed, comma-separated, in the environment variable
+NUMERICAL_CALCULATOR_PLUGINS and imported the first time the registry is
+queried.
+Keep them small: a plugin's own solvers and windows can be registered by
+path, too.
+"""
+import importlib
+import os
+from dataclasses import dataclass
+
+# Capabilities a method can declare
+BRACKETING = 'bracketing'    # works inside an interval [xl, xu] known to hold the answer
+DERIVATIVE = 'derivative'    # needs f' (solve_batch differentiates f when df is not given)
+MATRIX = 'matrix'            # takes a matrix A and a vector b
+BATCH = 'batch'              # its solver runs headless through solve_batch, the CLI and the benchmarks
+
+# Kinds of problem, used to group methods in the benchmarks
+KINDS = ('root', 'optimum', 'linear', 'sparse', 'iterative', 'system')
+
+PLUGINS_VARIABLE = 'NUMERICAL_CALCULATOR_PLUGINS'
+
+
+def _load(path):
+    """The object at 'package.module:attribute'."""
+    module_name, _, attribute = path.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+@dataclass(frozen=True)
+class Method:
+    """One registered method.
+
+    solver and window are 'module:attribute' paths (or the objects
+    themselves). label is the launcher button; methods sharing a window
+    give it on one of them only.
+    """
+    name: str
+    kind: str
+    solver: object = None
+    window: object = None
+    label: str = None
+    capabilities: frozenset = frozenset()
+
+    def has(self, capability):
+        return capability in self.capabilities
+
+    def load_solver(self):
+        if self.solver is None:
+            raise ValueError(f"Method '{self.name}' has no headless solver")
+        return _load(self.solver) if isinstance(self.solver, str) else self.solver
+
+    def open_window(self):
+        if self.window is None:
+            raise ValueError(f"Method '{self.name}' has no window")
+        (_load(self.window) if isinstance(self.window, str) else self.window)()
+
+
+_methods = {}
+_plugins_loaded = False
+
+
+def register(name, kind, solver=None, window=None, label=None, capabilities=()):
+    """Adds (or replaces) a method; returns its Method."""
+    if kind not in KINDS:
+        raise ValueError(f"Unknown kind '{kind}'; choose from {', '.join(KINDS)}")
+    entry = Method(name, kind, solver, window, label, frozenset(capabilities))
+    _methods[name] = entry
+    return entry
+
+
+def method(name, kind, **options):
+    """Decorator registering the decorated function as the solver of a method."""
+    def decorate(solver):
+        register(name, kind, solver=solver, **options)
+        return solver
+    return decorate
+
+
+def load_plugins():
+    """Imports the plugin modules named in PLUGINS_VARIABLE, once."""
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+    for module_name in os.environ.get(PLUGINS_VARIABLE, '').split(','):
+        if module_name.strip():
+            importlib.import_module(module_name.strip())
+
+
+def get(name):
+    """The Method registered under name."""
+    load_plugins()
+    try:
+        return _methods[name]
+    except KeyError:
+        raise ValueError(f"Unknown method '{name}'; choose from {', '.join(_methods)}") from None
+
+
+def methods(kind=None, capability=None):
+    """Registered methods in registration order, optionally of one kind or with one capability."""
+    load_plugins()
+    return [m for m in _methods.values()
+            if (kind is None or m.kind == kind) and (capability is None or m.has(capability))]
+
+
+def names(kind=None, capability=None):
+    return tuple(m.name for m in methods(kind, capability))
+
+
+def windows():
+    """Methods that have a launcher button, in registration order."""
+    return [m for m in methods() if m.label is not None and m.window is not None]
+
+
+# Built-in methods, in launcher order
+_CORE = 'numericalAnalysisCalculator.core'
+_WINDOWS = 'numericalAnalysisCalculator.calculators'
+
+register('bisection', 'root', f'{_CORE}.rootfinding:bisection', f'{_WINDOWS}.BisectUPdated:run',
+         "Bisection Method", (BRACKETING, BATCH))
+register('false_position', 'root', f'{_CORE}.rootfinding:false_position', f'{_WINDOWS}.FalsePosUpdated:run',
+         "The False Position Method", (BRACKETING, BATCH))
+register('brent', 'root', f'{_CORE}.rootfinding:brent', f'{_WINDOWS}.brent:run',
+         "Brent's Method", (BRACKETING, BATCH))
+register('newton', 'root', f'{_CORE}.rootfinding:newton', f'{_WINDOWS}.newton:run',
+         "Newton Method", (DERIVATIVE, BATCH))
+register('safeguarded_newton', 'root', f'{_CORE}.rootfinding:safeguarded_newton', f'{_WINDOWS}.newton:run',
+         capabilities=(BRACKETING, DERIVATIVE, BATCH))
+register('secant', 'root', f'{_CORE}.rootfinding:secant', f'{_WINDOWS}.secantUpdated:run',
+         "Secant Method", (BATCH,))
+register('gauss_elimination', 'linear', f'{_CORE}.linear:gauss_elimination', f'{_WINDOWS}.GE:run',
+         "Gauss Elimination", (MATRIX, BATCH))
+register('lu', 'linear', f'{_CORE}.linear:lu_solve', f'{_WINDOWS}.LUDec:run',
+         "LU Decomposistion", (MATRIX, BATCH))
+register('structured', 'sparse', f'{_CORE}.structured:solve_structured', capabilities=(MATRIX, BATCH))
+register('jacobi', 'iterative', f'{_CORE}.iterative:jacobi', f'{_WINDOWS}.iterative:run',
+         "Iterative Linear Solvers", (MATRIX, BATCH))
+register('gauss_seidel', 'iterative', f'{_CORE}.iterative:gauss_seidel', f'{_WINDOWS}.iterative:run',
+         capabilities=(MATRIX, BATCH))
+register('sor', 'iterative', f'{_CORE}.iterative:sor', f'{_WINDOWS}.iterative:run',
+         capabilities=(MATRIX, BATCH))
+register('conjugate_gradient', 'iterative', f'{_CORE}.iterative:conjugate_gradient', f'{_WINDOWS}.iterative:run',
+         capabilities=(MATRIX, BATCH))
+register('newton_system', 'system', f'{_CORE}.systems:newton_system', f'{_WINDOWS}.systems:run',
+         "Nonlinear Systems", (BATCH,))
+register('golden_section', 'optimum', f'{_CORE}.optimize:golden_section', f'{_WINDOWS}.goldenSectionSearch:run',
+         "Golden-Section Search", (BRACKETING, BATCH))
+register('brent_optimum', 'optimum', f'{_CORE}.optimize:brent_optimum', f'{_WINDOWS}.goldenSectionSearch:run',
+         capabilities=(BRACKETING, BATCH))
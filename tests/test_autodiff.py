@@ -0,0 +1,12 @@
+import pytest
+
+from numericalAnalysisCalculator.core.autodiff import compile_with_derivative
+
+
+@pytest.mark.parametrize('source, expected', [
+    ('x**0', (1.0, 0.0)),
+    ('sin(x) + 2*x**0.0', (2.0, 1.0)),
+    ('x**2', (0.0, 0.0)),
+])
+def test_power_rule_at_zero(source, expected):
+    assert compile_with_derivative(source)(0.0) == pytest.approx(expected)
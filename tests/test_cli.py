@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def run_cli(problems):
+    """Feeds problem dicts to python -m numericalAnalysisCalculator; returns the result records."""
+    text = ''.join(json.dumps(problem) + '\n' for problem in problems)
+    done = subprocess.run([sys.executable, '-m', 'numericalAnalysisCalculator', '-'], input=text,
+                          capture_output=True, text=True, cwd=ROOT, check=True)
+    return [json.loads(line) for line in done.stdout.splitlines()]
+
+
+def tridiagonal(n):
+    return [[2.0 if i == j else -1.0 if abs(i - j) == 1 else 0.0 for j in range(n)] for i in range(n)]
+
+
+def test_linear_methods_write_the_same_fields():
+    problems = [{'method': method, 'A': A, 'b': [1.0] * len(A)}
+                for A in ([[4, 1], [1, 3]], tridiagonal(80))
+                for method in ('lu', 'gauss_elimination')]
+    records = run_cli(problems)
+    # Factors are left out for every method, whether or not the solver formed them
+    for record in records:
+        assert set(record) == {'index', 'method', 'x', 'c', 'cached', 'result_method'}
+    dense, structured = records[:2], records[2:]
+    assert [r['result_method'] for r in dense] == ['dense', 'dense']
+    assert dense[0]['x'] == dense[1]['x']
+    # The 80 x 80 tridiagonal system goes to the Thomas algorithm, which has no c
+    assert [r['result_method'] for r in structured] == ['tridiagonal', 'tridiagonal']
+    assert [r['c'] for r in structured] == [None, None]
+    assert len(structured[0]['x']) == 80
@@ -0,0 +1,38 @@
+import pytest
+
+from numericalAnalysisCalculator.benchmarks import catalogue
+from numericalAnalysisCalculator.core.expression import compile_function
+from numericalAnalysisCalculator.core.rootfinding import bisection, brent
+
+PROBLEMS = {p['name']: p for p in catalogue.ROOT_PROBLEMS}
+
+
+def count_evals(solver, problem):
+    """Runs solver on a catalogue problem; returns (result, number of f evaluations)."""
+    f = compile_function(problem['f'])
+    calls = 0
+
+    def counted(x):
+        nonlocal calls
+        calls += 1
+        return f(x)
+
+    result = solver(counted, problem['xl'], problem['xu'], catalogue.EPS, catalogue.MAX_ITER, record=False)
+    return result, calls
+
+
+@pytest.mark.parametrize('name', ['tenth-power', 'fifth-power-factor', 'seventh-power'])
+def test_brent_needs_no_more_evaluations_than_bisection(name):
+    problem = PROBLEMS[name]
+    result, brent_evals = count_evals(brent, problem)
+    _, bisection_evals = count_evals(bisection, problem)
+    assert result.converged
+    if 'root' in problem:
+        assert abs(result.root - problem['root']) <= catalogue.ROOT_CHECK
+    assert brent_evals <= bisection_evals
+
+
+def test_brent_converges_on_a_root_at_zero():
+    result = brent(lambda x: x**3, -1.0, 2.0, record=False)
+    assert result.converged
+    assert abs(result.root) <= 1e-6